@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import annotations
+
+DOCUMENTATION = r"""
+---
+name: api_profile
+type: aggregate
+short_description: Aggregates catalystwan Manager API metrics across a play
+version_added: "0.3.4"
+description:
+  - Collects C(metrics) block returned by cisco.catalystwan modules and prints, at the end of the playbook,
+    table of the slowest tasks together with total Manager requests, logins performed and time spent waiting on tasks.
+  - Modules report metrics only when C(collect_metrics) is enabled. The easiest way to enable it for all tasks
+    is to export C(CATALYSTWAN_COLLECT_METRICS=true) before running the playbook.
+  - Optionally exports aggregated data as Prometheus text-format file or Chrome trace JSON
+    (open it in chrome://tracing or https://ui.perfetto.dev).
+requirements:
+  - enable in configuration, e.g. C(callbacks_enabled = cisco.catalystwan.api_profile) in ansible.cfg
+options:
+  top_tasks:
+    description:
+      - Number of the slowest tasks to display in play-end table.
+    type: int
+    default: 10
+    env:
+      - name: CATALYSTWAN_API_PROFILE_TOP_TASKS
+    ini:
+      - section: callback_api_profile
+        key: top_tasks
+  prometheus_file:
+    description:
+      - Path to a file where aggregated metrics will be written in Prometheus text format.
+    type: path
+    env:
+      - name: CATALYSTWAN_API_PROFILE_PROMETHEUS_FILE
+    ini:
+      - section: callback_api_profile
+        key: prometheus_file
+  chrome_trace_file:
+    description:
+      - Path to a file where tasks timeline will be written as Chrome trace JSON.
+    type: path
+    env:
+      - name: CATALYSTWAN_API_PROFILE_CHROME_TRACE_FILE
+    ini:
+      - section: callback_api_profile
+        key: chrome_trace_file
+author:
+  - Arkadiusz Cichon (acichon@cisco.com)
+"""
+
+import json
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from ansible.plugins.callback import CallbackBase
+
+COLLECTION_PREFIX = "cisco.catalystwan."
+
+
+class TaskProfile:
+    def __init__(self, play: str, role: str, task: str, host: str, started: float) -> None:
+        self.play = play
+        self.role = role
+        self.task = task
+        self.host = host
+        self.started = started
+        self.finished = started
+        self.status = "ok"
+        self.invocations = 0
+        self.requests = 0
+        self.logins = 0
+        self.login_seconds = 0.0
+        self.request_seconds = 0.0
+        self.task_wait_seconds = 0.0
+        self.throttled_responses = 0
+        self.endpoints: Dict[str, Dict] = defaultdict(lambda: dict(count=0, total_seconds=0.0))
+
+    @property
+    def duration(self) -> float:
+        return self.finished - self.started
+
+    def add_metrics(self, metrics: Dict) -> None:
+        self.invocations += 1
+        self.requests += metrics.get("requests_total", 0)
+        self.logins += metrics.get("logins", 0)
+        self.login_seconds += metrics.get("login_seconds", 0.0)
+        self.request_seconds += metrics.get("requests_seconds", 0.0)
+        self.task_wait_seconds += metrics.get("task_wait_seconds", 0.0)
+        self.throttled_responses += metrics.get("throttled_responses", 0)
+        for endpoint, stats in metrics.get("endpoints", {}).items():
+            self.endpoints[endpoint]["count"] += stats.get("count", 0)
+            self.endpoints[endpoint]["total_seconds"] += stats.get("total_seconds", 0.0)
+
+    @property
+    def labels(self) -> Dict[str, str]:
+        return dict(play=self.play, role=self.role, task=self.task, host=self.host)
+
+
+def prometheus_labels(labels: Dict[str, str]) -> str:
+    def escape(value: str) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return ",".join(f'{key}="{escape(value)}"' for key, value in labels.items())
+
+
+def wall_time(profiles: List[TaskProfile]) -> float:
+    """
+    Wall-clock time covered by profiles, tasks running at the same time on many hosts are counted once.
+    """
+    total = 0.0
+    span_start, span_end = None, None
+    for profile in sorted(profiles, key=lambda profile: profile.started):
+        if span_end is None or profile.started > span_end:
+            if span_end is not None:
+                total += span_end - span_start
+            span_start, span_end = profile.started, profile.finished
+        else:
+            span_end = max(span_end, profile.finished)
+    if span_end is not None:
+        total += span_end - span_start
+    return total
+
+
+class CallbackModule(CallbackBase):
+    """
+    Aggregates Manager API metrics reported by catalystwan modules.
+    """
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = "aggregate"
+    CALLBACK_NAME = "cisco.catalystwan.api_profile"
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self, *args, **kwargs) -> None:
+        super(CallbackModule, self).__init__(*args, **kwargs)
+        self.playbook_started = time.time()
+        self.play_name = ""
+        self.task_started: Dict[str, float] = {}
+        self.profiles: List[TaskProfile] = []
+
+    def v2_playbook_on_play_start(self, play) -> None:
+        self.play_name = play.get_name().strip()
+
+    def v2_playbook_on_task_start(self, task, is_conditional) -> None:
+        self.task_started[task._uuid] = time.time()
+
+    def v2_playbook_on_handler_task_start(self, task) -> None:
+        self.task_started[task._uuid] = time.time()
+
+    def _record(self, result, status: str) -> None:
+        task = result._task
+        results = [result._result] + list(result._result.get("results", []))
+        metrics = [item["metrics"] for item in results if isinstance(item, dict) and item.get("metrics")]
+        # Short module names (collections keyword) are resolved to FQCN only in resolved_action
+        action = getattr(task, "resolved_action", None) or task.action
+        if not metrics and not action.startswith(COLLECTION_PREFIX):
+            return
+
+        profile = TaskProfile(
+            play=self.play_name,
+            role=task._role.get_name() if task._role else "",
+            task=task.get_name().strip(),
+            host=result._host.get_name(),
+            started=self.task_started.get(task._uuid, time.time()),
+        )
+        profile.finished = time.time()
+        profile.status = status
+        for task_metrics in metrics:
+            profile.add_metrics(task_metrics)
+        self.profiles.append(profile)
+
+    def v2_runner_on_ok(self, result) -> None:
+        self._record(result, "ok")
+
+    def v2_runner_on_failed(self, result, ignore_errors=False) -> None:
+        self._record(result, "failed")
+
+    def v2_runner_on_unreachable(self, result) -> None:
+        self._record(result, "unreachable")
+
+    def v2_playbook_on_stats(self, stats) -> None:
+        if not self.profiles:
+            return
+
+        self._display.banner("CATALYSTWAN API PROFILE")
+        slowest = sorted(self.profiles, key=lambda profile: profile.duration, reverse=True)
+        self._display.display(
+            f"{'duration':>10} {'requests':>9} {'logins':>7} {'api [s]':>9} {'tasks [s]':>10}  task",
+        )
+        for profile in slowest[: self.get_option("top_tasks")]:
+            name = f"{profile.role} : {profile.task}" if profile.role else profile.task
+            self._display.display(
+                f"{profile.duration:>9.2f}s {profile.requests:>9} {profile.logins:>7} "
+                f"{profile.request_seconds:>9.2f} {profile.task_wait_seconds:>10.2f}  {name} ({profile.host})"
+            )
+
+        by_role: Dict[str, List[TaskProfile]] = defaultdict(list)
+        for profile in self.profiles:
+            by_role[profile.role or "(no role)"].append(profile)
+        self._display.display("")
+        wall_times = {role: wall_time(profiles) for role, profiles in by_role.items()}
+        for role, duration in sorted(wall_times.items(), key=lambda item: item[1], reverse=True):
+            self._display.display(f"{duration:>9.2f}s  role: {role}")
+
+        self._display.display("")
+        self._display.display(f"Total Manager requests: {sum(profile.requests for profile in self.profiles)}")
+        self._display.display(f"Total logins performed: {sum(profile.logins for profile in self.profiles)}")
+        self._display.display(
+            f"Total time spent waiting on tasks: {sum(profile.task_wait_seconds for profile in self.profiles):.2f}s"
+        )
+        throttled = sum(profile.throttled_responses for profile in self.profiles)
+        if throttled:
+            self._display.display(f"Throttled responses (429/503): {throttled}")
+
+        self._export(self.get_option("prometheus_file"), self.prometheus_text)
+        self._export(self.get_option("chrome_trace_file"), self.chrome_trace)
+
+    def _export(self, path: Optional[str], render) -> None:
+        if not path:
+            return
+        try:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(render())
+        except OSError as ex:
+            self._display.warning(f"Cannot write catalystwan API profile to file: {path}, exception: {ex}")
+
+    def prometheus_text(self) -> str:
+        lines = []
+        task_metrics = [
+            ("catalystwan_task_duration_seconds", "gauge", "Wall time of the task, summed over its runs", "duration"),
+            ("catalystwan_task_requests_total", "counter", "Manager API requests performed", "requests"),
+            ("catalystwan_task_logins_total", "counter", "Logins to Manager performed", "logins"),
+            ("catalystwan_task_login_seconds", "gauge", "Time spent on logins to Manager", "login_seconds"),
+            ("catalystwan_task_api_seconds", "gauge", "Time spent on Manager API requests", "request_seconds"),
+            ("catalystwan_task_wait_seconds", "gauge", "Time spent waiting on Manager tasks", "task_wait_seconds"),
+            ("catalystwan_task_throttled_total", "counter", "Responses with 429/503 status", "throttled_responses"),
+        ]
+        # Task run many times with the same labels, e.g. from included file, is exported as single series
+        series: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(int))
+        for profile in self.profiles:
+            for _, _, _, attribute in task_metrics:
+                series[prometheus_labels(profile.labels)][attribute] += getattr(profile, attribute)
+        for name, metric_type, description, attribute in task_metrics:
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, values in series.items():
+                lines.append(f"{name}{{{labels}}} {round(values[attribute], 4)}")
+
+        endpoints: Dict[str, Dict] = defaultdict(lambda: dict(count=0, total_seconds=0.0))
+        for profile in self.profiles:
+            for endpoint, stats in profile.endpoints.items():
+                endpoints[endpoint]["count"] += stats["count"]
+                endpoints[endpoint]["total_seconds"] += stats["total_seconds"]
+        lines.append("# HELP catalystwan_endpoint_requests_total Manager API requests per endpoint")
+        lines.append("# TYPE catalystwan_endpoint_requests_total counter")
+        for endpoint, stats in sorted(endpoints.items()):
+            lines.append(
+                f"catalystwan_endpoint_requests_total{{{prometheus_labels(dict(endpoint=endpoint))}}} {stats['count']}"
+            )
+        lines.append("# HELP catalystwan_endpoint_seconds_total Time spent on Manager API requests per endpoint")
+        lines.append("# TYPE catalystwan_endpoint_seconds_total counter")
+        for endpoint, stats in sorted(endpoints.items()):
+            lines.append(
+                f"catalystwan_endpoint_seconds_total{{{prometheus_labels(dict(endpoint=endpoint))}}} "
+                f"{round(stats['total_seconds'], 4)}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def chrome_trace(self) -> str:
+        hosts = sorted({profile.host for profile in self.profiles})
+        events = [
+            dict(name="thread_name", ph="M", pid=1, tid=tid, args=dict(name=host)) for tid, host in enumerate(hosts)
+        ]
+        for profile in self.profiles:
+            events.append(
+                dict(
+                    name=profile.task,
+                    cat=profile.role or "play",
+                    ph="X",
+                    pid=1,
+                    tid=hosts.index(profile.host),
+                    ts=int((profile.started - self.playbook_started) * 1e6),
+                    dur=int(profile.duration * 1e6),
+                    args=dict(
+                        play=profile.play,
+                        status=profile.status,
+                        requests=profile.requests,
+                        logins=profile.logins,
+                        api_seconds=round(profile.request_seconds, 4),
+                        task_wait_seconds=round(profile.task_wait_seconds, 4),
+                    ),
+                )
+            )
+        return json.dumps(dict(traceEvents=events, displayTimeUnit="ms"))
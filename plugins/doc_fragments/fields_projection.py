@@ -0,0 +1,32 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import annotations
+
+
+class ModuleDocFragment(object):
+    # Options limiting fields returned by info modules
+    DOCUMENTATION = r"""
+options:
+  fields:
+    description:
+      - List of fields returned for every record, e.g. C([uuid, host_name, system_ip]).
+      - Fields can be given by name or by Manager API alias (e.g. C(host_name) or C(host-name)).
+      - Fields are selected before records are serialized, so limiting them reduces
+        size of module result for large inventories.
+      - When not set, all fields are returned.
+    required: false
+    type: list
+    elements: str
+    version_added: "0.3.4"
+  exclude_fields:
+    description:
+      - List of fields removed from every record. Applied after C(fields).
+    required: false
+    type: list
+    elements: str
+    version_added: "0.3.4"
+"""
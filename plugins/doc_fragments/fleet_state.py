@@ -0,0 +1,27 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import annotations
+
+
+class ModuleDocFragment(object):
+    # Options for storing records fetched by modules in fleet state database
+    DOCUMENTATION = r"""
+options:
+  fleet_state_db:
+    description:
+      - Path to SQLite database where records fetched from Manager are stored as new snapshot.
+        Database and its directory are created when missing.
+      - Snapshots are queried with C(cisco.catalystwan.fleet_state_info), which also finds records changed
+        since given snapshot, without contacting Manager.
+      - Records are stored as fetched, C(fields) and C(exclude_fields) don't apply to them.
+        Info modules store records before C(filters) are applied, so snapshots of filtered runs are comparable.
+      - Can be set with C(CATALYSTWAN_FLEET_STATE_DB) environment variable.
+      - When not set, fleet state is not stored.
+    required: false
+    type: path
+    version_added: "0.3.4"
+"""
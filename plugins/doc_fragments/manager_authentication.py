@@ -39,6 +39,39 @@ options:
           - Port number to use for connecting to vManage.
         required: false
         type: str
+  collect_metrics:
+    description:
+      - Collect timing of all Manager calls performed by the module (logins, endpoints, task polling)
+        and return them as C(metrics) in module result.
+      - Per-endpoint counts, p50/p95 latency, failures and payload sizes are reported.
+    required: false
+    type: bool
+    default: false
+  metrics_file:
+    description:
+      - Path to a file where collected metrics will be appended as a single JSON line per module invocation.
+      - Setting this option enables metrics collection even if C(collect_metrics) is false.
+    required: false
+    type: path
+  rate_limit:
+    description:
+      - Maximum number of requests per second sent to Manager, shared by all module processes running
+        on the controller against the same Manager (e.g. tasks executed with high number of forks).
+      - Throttled responses (429/503) are retried after C(Retry-After) or exponential backoff and
+        temporarily lower the rate for all processes.
+      - When not set, requests are not rate limited.
+    required: false
+    type: float
+  rate_limit_burst:
+    description:
+      - Number of requests that can be sent at once before rate limit applies. Defaults to C(rate_limit).
+    required: false
+    type: int
+  rate_limit_state_dir:
+    description:
+      - Directory for rate limiter state file shared between processes. Defaults to system temporary directory.
+    required: false
+    type: path
 notes:
   - manager_authentication argument is required for all modules invocation.
     To keep all examples of usage of modules clean and easy to read examples are not including that argument.
@@ -0,0 +1,31 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import annotations
+
+
+class ModuleDocFragment(object):
+    # Options for writing records of info modules to file
+    DOCUMENTATION = r"""
+options:
+  output_file:
+    description:
+      - Path to a file where records are written as JSON Lines (one JSON object per line), record by record.
+      - When set, records are not returned in module result. Module returns C(output) with
+        C(path), C(records) (number of records written), C(checksum) (SHA1 of the file) and C(compressed) instead.
+      - Existing file is replaced only when all records were written.
+      - C(fields) and C(exclude_fields) apply to written records.
+    required: false
+    type: path
+    version_added: "0.3.4"
+  output_compress:
+    description:
+      - Compress C(output_file) with gzip. Files with C(.gz) extension are always compressed.
+    required: false
+    type: bool
+    default: false
+    version_added: "0.3.4"
+"""
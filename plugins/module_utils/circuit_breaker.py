@@ -0,0 +1,93 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import os
+import random
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from ..module_utils.shared_state import locked_json_state, shared_state_file
+
+POLL_INTERVAL_SECONDS = 1.0
+
+
+def full_jitter_backoff(attempt: int, base: float, max_backoff: float) -> float:
+    """
+    Exponential backoff with full jitter: random value from [0, min(max_backoff, base * 2^attempt)].
+    Spreads retries of concurrent clients instead of retrying in lockstep.
+    """
+    return random.uniform(0, min(max_backoff, base * 2**attempt))
+
+
+def default_state_file(manager_url: str, state_dir: Optional[str] = None) -> str:
+    return shared_state_file("catalystwan_circuit_breaker", manager_url, state_dir)
+
+
+class SharedCircuitBreaker:
+    """Circuit breaker for session establishment shared by all module processes on the controller.
+
+    Failed connection attempt opens the circuit for backoff time (exponential with full jitter,
+    growing with number of consecutive failures). While circuit is open, no process tries to connect.
+    When backoff time passes, single process becomes a probe (half-open state) and others wait for its result:
+    success closes the circuit for everyone, failure opens it again with longer backoff.
+
+    Args:
+        state_file (str): path to shared state file.
+        base (float): base backoff in seconds.
+        max_backoff (float): maximum backoff in seconds.
+        probe_timeout (float): time after which probe that didn't report result is considered lost.
+    """
+
+    def __init__(self, state_file: str, base: float = 1.0, max_backoff: float = 30.0, probe_timeout: float = 120.0):
+        self.state_file = state_file
+        self.base = base
+        self.max_backoff = max_backoff
+        self.probe_timeout = probe_timeout
+        self.pid = os.getpid()
+        self.waited_seconds = 0.0
+
+    @contextmanager
+    def _locked_state(self):
+        with locked_json_state(self.state_file) as state:
+            state.setdefault("failures", 0)
+            state.setdefault("open_until", 0.0)
+            state.setdefault("probe_pid", None)
+            state.setdefault("probe_until", 0.0)
+            yield state
+
+    def before_attempt(self) -> float:
+        """
+        Block while circuit is open or other process probes Manager. Returns number of seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._locked_state() as state:
+                now = time.time()
+                probe_in_progress = state["probe_until"] > now and state["probe_pid"] != self.pid
+                if state["open_until"] <= now and not probe_in_progress:
+                    if state["failures"]:
+                        state["probe_pid"] = self.pid
+                        state["probe_until"] = now + self.probe_timeout
+                    self.waited_seconds += waited
+                    return waited
+                wait = max(state["open_until"], state["probe_until"] if probe_in_progress else 0.0) - now
+            # poll, so waiting processes react quickly when probe closes the circuit
+            wait = min(wait, random.uniform(0.5, 1.5) * POLL_INTERVAL_SECONDS)
+            time.sleep(wait)
+            waited += wait
+
+    def record_success(self) -> None:
+        with self._locked_state() as state:
+            state.update(failures=0, open_until=0.0, probe_pid=None, probe_until=0.0)
+
+    def record_failure(self) -> float:
+        """
+        Open the circuit. Returns backoff time in seconds.
+        """
+        with self._locked_state() as state:
+            backoff = full_jitter_backoff(state["failures"], self.base, self.max_backoff)
+            state["failures"] += 1
+            state["open_until"] = max(state["open_until"], time.time() + backoff)
+            state.update(probe_pid=None, probe_until=0.0)
+        return backoff
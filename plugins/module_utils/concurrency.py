@@ -0,0 +1,83 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional, Sequence, TypeVar
+
+ItemType = TypeVar("ItemType")
+ReturnType = TypeVar("ReturnType")
+
+
+class ConcurrentResult(NamedTuple):
+    item: Any
+    result: Any
+    error: Optional[Exception]
+
+
+def chunked(items: Sequence[ItemType], size: int) -> List[Sequence[ItemType]]:
+    """
+    Split items to chunks of at most `size` items. Size lower than 1 means single chunk with all items.
+    """
+    if not items:
+        return []
+    if size < 1:
+        return [items]
+    chunks = []
+    for start in range(0, len(items), size):
+        stop = start + size
+        chunks.append(items[start:stop])
+    return chunks
+
+
+def run_concurrently(
+    func: Callable[[ItemType], ReturnType], items: Iterable[ItemType], max_workers: int
+) -> List[ConcurrentResult]:
+    """
+    Call `func` for every item in at most `max_workers` threads, results are returned in order of items.
+
+    Exceptions raised by `func` are returned in results, so one failed item doesn't abort the others.
+    `func` must not call `fail_json` or `exit_json`, these are re-raised after all items were processed.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        outcomes = []
+        for item in items:
+            try:
+                outcomes.append(ConcurrentResult(item, func(item), None))
+            except Exception as ex:
+                outcomes.append(ConcurrentResult(item, None, ex))
+        return outcomes
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+    outcomes = []
+    for item, future in zip(items, futures):
+        error = future.exception()
+        if error is not None and not isinstance(error, Exception):
+            raise error
+        outcomes.append(ConcurrentResult(item, None if error else future.result(), error))
+    return outcomes
+
+
+def serialize_login(session: Any) -> None:
+    """
+    Make re-login of session shared by worker threads exclusive.
+
+    Session logs in again when its JSESSIONID expires. Without lock every thread which got expired response
+    would log in at the same time, clearing cookies of each other. Threads which waited for login of another
+    thread reuse its result instead of logging in again.
+    """
+    lock = threading.Lock()
+    login = session.login
+    logins = [0]
+
+    def exclusive_login():
+        seen = logins[0]
+        with lock:
+            if logins[0] == seen:
+                login()
+                logins[0] += 1
+        return session
+
+    session.login = exclusive_login
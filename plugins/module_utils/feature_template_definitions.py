@@ -0,0 +1,305 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# This file is autogenerated by `utils/ft_generator.py`
+
+# Every definition is imported only when its template type is used in task arguments.
+# Imports are written out explicitly, so Ansible still packs all definitions with the module.
+
+from collections.abc import Mapping
+from typing import Callable, Dict, Final, Iterator, Optional
+
+
+def _aaa_definition() -> Dict:
+    from ..module_utils.feature_templates.aaa import aaa_definition
+
+    return aaa_definition
+
+
+def _cisco_aaa_definition() -> Dict:
+    from ..module_utils.feature_templates.cisco_aaa import cisco_aaa_definition
+
+    return cisco_aaa_definition
+
+
+def _cisco_banner_definition() -> Dict:
+    from ..module_utils.feature_templates.cisco_banner import cisco_banner_definition
+
+    return cisco_banner_definition
+
+
+def _cisco_bfd_definition() -> Dict:
+    from ..module_utils.feature_templates.cisco_bfd import cisco_bfd_definition
+
+    return cisco_bfd_definition
+
+
+def _cisco_logging_definition() -> Dict:
+    from ..module_utils.feature_templates.cisco_logging import cisco_logging_definition
+
+    return cisco_logging_definition
+
+
+def _cisco_ntp_definition() -> Dict:
+    from ..module_utils.feature_templates.cisco_ntp import cisco_ntp_definition
+
+    return cisco_ntp_definition
+
+
+def _cisco_omp_definition() -> Dict:
+    from ..module_utils.feature_templates.cisco_omp import cisco_omp_definition
+
+    return cisco_omp_definition
+
+
+def _cisco_ospf_definition() -> Dict:
+    from ..module_utils.feature_templates.cisco_ospf import cisco_ospf_definition
+
+    return cisco_ospf_definition
+
+
+def _cisco_secure_internet_gateway_definition() -> Dict:
+    from ..module_utils.feature_templates.cisco_secure_internet_gateway import cisco_secure_internet_gateway_definition
+
+    return cisco_secure_internet_gateway_definition
+
+
+def _cisco_snmp_definition() -> Dict:
+    from ..module_utils.feature_templates.cisco_snmp import cisco_snmp_definition
+
+    return cisco_snmp_definition
+
+
+def _cisco_system_definition() -> Dict:
+    from ..module_utils.feature_templates.cisco_system import cisco_system_definition
+
+    return cisco_system_definition
+
+
+def _cisco_vpn_definition() -> Dict:
+    from ..module_utils.feature_templates.cisco_vpn import cisco_vpn_definition
+
+    return cisco_vpn_definition
+
+
+def _cisco_vpn_interface_definition() -> Dict:
+    from ..module_utils.feature_templates.cisco_vpn_interface import cisco_vpn_interface_definition
+
+    return cisco_vpn_interface_definition
+
+
+def _omp_vsmart_definition() -> Dict:
+    from ..module_utils.feature_templates.omp_vsmart import omp_vsmart_definition
+
+    return omp_vsmart_definition
+
+
+def _security_vsmart_definition() -> Dict:
+    from ..module_utils.feature_templates.security_vsmart import security_vsmart_definition
+
+    return security_vsmart_definition
+
+
+def _system_vsmart_definition() -> Dict:
+    from ..module_utils.feature_templates.system_vsmart import system_vsmart_definition
+
+    return system_vsmart_definition
+
+
+def _vpn_vsmart_definition() -> Dict:
+    from ..module_utils.feature_templates.vpn_vsmart import vpn_vsmart_definition
+
+    return vpn_vsmart_definition
+
+
+def _vpn_vsmart_interface_definition() -> Dict:
+    from ..module_utils.feature_templates.vpn_vsmart_interface import vpn_vsmart_interface_definition
+
+    return vpn_vsmart_interface_definition
+
+
+FEATURE_TEMPLATE_DEFINITIONS: Final[Dict[str, Callable[[], Dict]]] = {
+    "aaa": _aaa_definition,
+    "cisco_aaa": _cisco_aaa_definition,
+    "cisco_banner": _cisco_banner_definition,
+    "cisco_bfd": _cisco_bfd_definition,
+    "cisco_logging": _cisco_logging_definition,
+    "cisco_ntp": _cisco_ntp_definition,
+    "cisco_omp": _cisco_omp_definition,
+    "cisco_ospf": _cisco_ospf_definition,
+    "cisco_secure_internet_gateway": _cisco_secure_internet_gateway_definition,
+    "cisco_snmp": _cisco_snmp_definition,
+    "cisco_system": _cisco_system_definition,
+    "cisco_vpn": _cisco_vpn_definition,
+    "cisco_vpn_interface": _cisco_vpn_interface_definition,
+    "omp_vsmart": _omp_vsmart_definition,
+    "security_vsmart": _security_vsmart_definition,
+    "system_vsmart": _system_vsmart_definition,
+    "vpn_vsmart": _vpn_vsmart_definition,
+    "vpn_vsmart_interface": _vpn_vsmart_interface_definition,
+}
+
+
+def _aaa_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import aaa
+
+    return aaa.aaa_validation
+
+
+def _cisco_aaa_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import cisco_aaa
+
+    return cisco_aaa.cisco_aaa_validation
+
+
+def _cisco_banner_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import cisco_banner
+
+    return cisco_banner.cisco_banner_validation
+
+
+def _cisco_bfd_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import cisco_bfd
+
+    return cisco_bfd.cisco_bfd_validation
+
+
+def _cisco_logging_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import cisco_logging
+
+    return cisco_logging.cisco_logging_validation
+
+
+def _cisco_ntp_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import cisco_ntp
+
+    return cisco_ntp.cisco_ntp_validation
+
+
+def _cisco_omp_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import cisco_omp
+
+    return cisco_omp.cisco_omp_validation
+
+
+def _cisco_ospf_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import cisco_ospf
+
+    return cisco_ospf.cisco_ospf_validation
+
+
+def _cisco_secure_internet_gateway_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import cisco_secure_internet_gateway
+
+    return cisco_secure_internet_gateway.cisco_secure_internet_gateway_validation
+
+
+def _cisco_snmp_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import cisco_snmp
+
+    return cisco_snmp.cisco_snmp_validation
+
+
+def _cisco_system_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import cisco_system
+
+    return cisco_system.cisco_system_validation
+
+
+def _cisco_vpn_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import cisco_vpn
+
+    return cisco_vpn.cisco_vpn_validation
+
+
+def _cisco_vpn_interface_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import cisco_vpn_interface
+
+    return cisco_vpn_interface.cisco_vpn_interface_validation
+
+
+def _omp_vsmart_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import omp_vsmart
+
+    return omp_vsmart.omp_vsmart_validation
+
+
+def _security_vsmart_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import security_vsmart
+
+    return security_vsmart.security_vsmart_validation
+
+
+def _system_vsmart_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import system_vsmart
+
+    return system_vsmart.system_vsmart_validation
+
+
+def _vpn_vsmart_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import vpn_vsmart
+
+    return vpn_vsmart.vpn_vsmart_validation
+
+
+def _vpn_vsmart_interface_validation() -> Dict:
+    from ..module_utils.feature_templates_validation import vpn_vsmart_interface
+
+    return vpn_vsmart_interface.vpn_vsmart_interface_validation
+
+
+FEATURE_TEMPLATE_VALIDATIONS: Final[Dict[str, Callable[[], Dict]]] = {
+    "aaa": _aaa_validation,
+    "cisco_aaa": _cisco_aaa_validation,
+    "cisco_banner": _cisco_banner_validation,
+    "cisco_bfd": _cisco_bfd_validation,
+    "cisco_logging": _cisco_logging_validation,
+    "cisco_ntp": _cisco_ntp_validation,
+    "cisco_omp": _cisco_omp_validation,
+    "cisco_ospf": _cisco_ospf_validation,
+    "cisco_secure_internet_gateway": _cisco_secure_internet_gateway_validation,
+    "cisco_snmp": _cisco_snmp_validation,
+    "cisco_system": _cisco_system_validation,
+    "cisco_vpn": _cisco_vpn_validation,
+    "cisco_vpn_interface": _cisco_vpn_interface_validation,
+    "omp_vsmart": _omp_vsmart_validation,
+    "security_vsmart": _security_vsmart_validation,
+    "system_vsmart": _system_vsmart_validation,
+    "vpn_vsmart": _vpn_vsmart_validation,
+    "vpn_vsmart_interface": _vpn_vsmart_interface_validation,
+}
+
+
+class LazyOptions(Mapping):
+    """
+    Suboptions of feature template type, imported on first access. AnsibleModule reads suboptions only
+    of parameters set in task, so definitions of template types not used in task are not imported.
+    """
+
+    def __init__(self, template_type: str) -> None:
+        self.template_type = template_type
+        self._options: Optional[Dict] = None
+
+    def _load(self) -> Dict:
+        if self._options is None:
+            self._options = FEATURE_TEMPLATE_DEFINITIONS[self.template_type]()[self.template_type]["options"]
+        return self._options
+
+    def __getitem__(self, key: str) -> Dict:
+        return self._load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+
+def feature_template_argument_spec() -> Dict:
+    """
+    Argument spec of all feature template types, with suboptions loaded lazily.
+    """
+    return {
+        template_type: dict(type="dict", required=False, default=None, options=LazyOptions(template_type))
+        for template_type in FEATURE_TEMPLATE_DEFINITIONS
+    }
@@ -0,0 +1,96 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from copy import copy
+from typing import Any, Callable, Dict, Final, Iterable, Optional, Tuple
+
+from ..module_utils.feature_template_definitions import FEATURE_TEMPLATE_VALIDATIONS
+
+# Validation table generated by `utils/ft_generator.py` maps option path (e.g. "cisco_ntp.server.name")
+# to (type, required, default, elements, choices, children). Options of list of dicts are children of the list.
+ValidationEntry = Tuple[str, bool, Any, Optional[str], Optional[Tuple], Tuple[str, ...]]
+
+TYPE_CHECKS: Final[Dict[str, Callable[[Any], bool]]] = {
+    "str": lambda value: isinstance(value, str),
+    "int": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "bool": lambda value: isinstance(value, bool),
+    "dict": lambda value: isinstance(value, dict),
+    "list": lambda value: isinstance(value, list),
+    "raw": lambda value: True,
+}
+
+
+class FastValidationError(Exception):
+    """
+    Value can't be accepted by fast validator: it's invalid or needs conversion (e.g. "1" for int option).
+    AnsibleModule validates such parameters with full argument spec and reports errors as usual.
+    """
+
+
+def _validate_scalar(value: Any, value_type: str, choices: Optional[Tuple], path: str) -> None:
+    if not TYPE_CHECKS[value_type](value):
+        raise FastValidationError(f"{path}: expected {value_type}")
+    if choices is not None and value not in choices:
+        raise FastValidationError(f"{path}: value not in choices")
+
+
+def _validate_options(table: Dict[str, ValidationEntry], path: str, value: Any, children: Tuple[str, ...]) -> Dict:
+    if not isinstance(value, dict):
+        raise FastValidationError(f"{path}: expected dict")
+    unsupported = value.keys() - set(children)
+    if unsupported:
+        raise FastValidationError(f"{path}: unsupported parameters {sorted(unsupported)}")
+
+    validated = {}
+    for child in children:
+        child_path = f"{path}.{child}"
+        child_required, child_default = table[child_path][1], table[child_path][2]
+        if child in value:
+            validated[child] = validate_value(table, child_path, value[child])
+        elif child_required:
+            raise FastValidationError(f"{child_path}: missing required parameter")
+        elif child_default is not None:
+            validated[child] = validate_value(table, child_path, copy(child_default))
+        else:
+            validated[child] = None
+    return validated
+
+
+def validate_value(table: Dict[str, ValidationEntry], path: str, value: Any) -> Any:
+    """
+    Validate value of option at `path` and apply defaults of its suboptions, the same way
+    AnsibleModule does for correctly typed parameters. Raises FastValidationError for anything else.
+    """
+    if value is None:
+        return None
+    value_type, _, _, elements, choices, children = table[path]
+
+    if value_type == "list":
+        _validate_scalar(value, "list", None, path)
+        if elements == "dict" and children:
+            return [_validate_options(table, path, element, children) for element in value]
+        if elements is not None:
+            for element in value:
+                _validate_scalar(element, elements, choices, path)
+        return list(value)
+
+    if value_type == "dict" and children:
+        return _validate_options(table, path, value, children)
+
+    _validate_scalar(value, value_type, choices, path)
+    return value
+
+
+def fast_validate_feature_templates(params: Dict, template_types: Iterable[str]) -> Optional[Dict]:
+    """
+    Validate feature template parameters in one pass over precomputed validation tables.
+    Returns validated parameters, or None when any of them has to be validated by AnsibleModule.
+    """
+    validated = {}
+    for template_type in template_types:
+        table = FEATURE_TEMPLATE_VALIDATIONS[template_type]()
+        try:
+            validated[template_type] = validate_value(table, template_type, params.get(template_type))
+        except FastValidationError:
+            return None
+    return validated
@@ -0,0 +1,129 @@
+aaa_validation = {
+    "aaa": (
+        "dict",
+        False,
+        None,
+        None,
+        None,
+        (
+            "accounting",
+            "admin_auth_order",
+            "audit_disable",
+            "auth_fallback",
+            "auth_order",
+            "cisco_tac_ro_user",
+            "cisco_tac_rw_user",
+            "netconf_disable",
+            "radius_retransmit",
+            "radius_server",
+            "radius_server_list",
+            "radius_timeout",
+            "tacacs_authentication",
+            "tacacs_server",
+            "tacacs_timeout",
+            "task",
+            "user",
+            "usergroup",
+        ),
+    ),
+    "aaa.accounting": ("bool", False, False, None, None, ()),
+    "aaa.admin_auth_order": ("bool", False, False, None, None, ()),
+    "aaa.audit_disable": ("bool", False, False, None, None, ()),
+    "aaa.auth_fallback": ("bool", False, False, None, None, ()),
+    "aaa.auth_order": ("list", False, ["local", "radius", "tacacs"], "str", None, ()),
+    "aaa.cisco_tac_ro_user": ("bool", False, True, None, None, ()),
+    "aaa.cisco_tac_rw_user": ("bool", False, True, None, None, ()),
+    "aaa.netconf_disable": ("bool", False, False, None, None, ()),
+    "aaa.radius_retransmit": ("int", False, None, None, None, ()),
+    "aaa.radius_server": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("acct_port", "address", "auth_port", "key", "priority", "secret_key", "source_interface", "tag", "vpn"),
+    ),
+    "aaa.radius_server.acct_port": ("int", False, None, None, None, ()),
+    "aaa.radius_server.address": ("str", True, None, None, None, ()),
+    "aaa.radius_server.auth_port": ("int", False, None, None, None, ()),
+    "aaa.radius_server.key": ("str", False, None, None, None, ()),
+    "aaa.radius_server.priority": ("int", False, None, None, None, ()),
+    "aaa.radius_server.secret_key": ("str", False, None, None, None, ()),
+    "aaa.radius_server.source_interface": ("str", False, None, None, None, ()),
+    "aaa.radius_server.tag": ("str", False, None, None, None, ()),
+    "aaa.radius_server.vpn": ("str", False, None, None, None, ()),
+    "aaa.radius_server_list": ("list", False, None, "str", None, ()),
+    "aaa.radius_timeout": ("int", False, None, None, None, ()),
+    "aaa.tacacs_authentication": ("str", False, "pap", None, None, ()),
+    "aaa.tacacs_server": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("address", "auth_port", "key", "priority", "secret_key", "source_interface", "vpn"),
+    ),
+    "aaa.tacacs_server.address": ("str", True, None, None, None, ()),
+    "aaa.tacacs_server.auth_port": ("int", False, None, None, None, ()),
+    "aaa.tacacs_server.key": ("str", False, None, None, None, ()),
+    "aaa.tacacs_server.priority": ("int", False, None, None, None, ()),
+    "aaa.tacacs_server.secret_key": ("str", False, None, None, None, ()),
+    "aaa.tacacs_server.source_interface": ("str", False, None, None, None, ()),
+    "aaa.tacacs_server.vpn": ("str", False, None, None, None, ()),
+    "aaa.tacacs_timeout": ("int", False, None, None, None, ()),
+    "aaa.task": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        (
+            "config_accept_action",
+            "config_default_action",
+            "config_deny_action",
+            "name",
+            "oper_exec_accept_action",
+            "oper_exec_default_action",
+            "oper_exec_deny_action",
+            "password",
+            "privilege",
+            "secret",
+        ),
+    ),
+    "aaa.task.config_accept_action": ("list", False, None, "dict", None, ("command",)),
+    "aaa.task.config_accept_action.command": ("str", True, None, None, None, ()),
+    "aaa.task.config_default_action": ("str", True, None, None, None, ()),
+    "aaa.task.config_deny_action": ("list", False, None, "dict", None, ("command",)),
+    "aaa.task.config_deny_action.command": ("str", True, None, None, None, ()),
+    "aaa.task.name": ("str", True, None, None, None, ()),
+    "aaa.task.oper_exec_accept_action": ("list", False, None, "dict", None, ("command",)),
+    "aaa.task.oper_exec_accept_action.command": ("str", True, None, None, None, ()),
+    "aaa.task.oper_exec_default_action": ("str", True, None, None, None, ()),
+    "aaa.task.oper_exec_deny_action": ("list", False, None, "dict", None, ("command",)),
+    "aaa.task.oper_exec_deny_action.command": ("str", True, None, None, None, ()),
+    "aaa.task.password": ("str", False, None, None, None, ()),
+    "aaa.task.privilege": ("str", False, "15", None, None, ()),
+    "aaa.task.secret": ("str", False, None, None, None, ()),
+    "aaa.user": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("description", "group", "name", "password", "pubkey_chain", "secret"),
+    ),
+    "aaa.user.description": ("str", False, None, None, None, ()),
+    "aaa.user.group": ("list", False, None, "str", None, ()),
+    "aaa.user.name": ("str", True, None, None, None, ()),
+    "aaa.user.password": ("str", False, None, None, None, ()),
+    "aaa.user.pubkey_chain": ("list", False, None, "dict", None, ("key_string", "key_type", "usertag")),
+    "aaa.user.pubkey_chain.key_string": ("str", True, None, None, None, ()),
+    "aaa.user.pubkey_chain.key_type": ("str", False, "ssh-rsa", None, None, ()),
+    "aaa.user.pubkey_chain.usertag": ("str", True, None, None, None, ()),
+    "aaa.user.secret": ("str", False, None, None, None, ()),
+    "aaa.usergroup": ("list", False, None, "dict", None, ("name", "task")),
+    "aaa.usergroup.name": ("str", True, None, None, None, ()),
+    "aaa.usergroup.task": ("list", False, None, "dict", None, ("mode", "permission")),
+    "aaa.usergroup.task.mode": ("str", True, None, None, None, ()),
+    "aaa.usergroup.task.permission": ("list", False, "pap", "str", None, ()),
+}
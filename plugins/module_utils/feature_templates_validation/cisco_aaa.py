@@ -0,0 +1,117 @@
+cisco_aaa_validation = {
+    "cisco_aaa": (
+        "dict",
+        False,
+        None,
+        None,
+        None,
+        (
+            "accounting_group",
+            "accounting_rules",
+            "authentication_group",
+            "authentication_type",
+            "authorization_config_commands",
+            "authorization_console",
+            "authorization_rules",
+            "cts_authorization_list",
+            "domain_stripping",
+            "port",
+            "radius",
+            "radius_client",
+            "radius_trustsec_group",
+            "server_auth_order",
+            "server_key_password",
+            "tacacs",
+            "user",
+        ),
+    ),
+    "cisco_aaa.accounting_group": ("bool", False, False, None, None, ()),
+    "cisco_aaa.accounting_rules": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("group", "level", "method", "rule_id", "start_stop"),
+    ),
+    "cisco_aaa.accounting_rules.group": ("str", True, None, None, None, ()),
+    "cisco_aaa.accounting_rules.level": ("str", False, None, None, None, ()),
+    "cisco_aaa.accounting_rules.method": ("str", True, None, None, None, ()),
+    "cisco_aaa.accounting_rules.rule_id": ("str", True, None, None, None, ()),
+    "cisco_aaa.accounting_rules.start_stop": ("bool", False, True, None, None, ()),
+    "cisco_aaa.authentication_group": ("bool", False, False, None, None, ()),
+    "cisco_aaa.authentication_type": ("str", False, "any", None, None, ()),
+    "cisco_aaa.authorization_config_commands": ("bool", False, None, None, None, ()),
+    "cisco_aaa.authorization_console": ("bool", False, None, None, None, ()),
+    "cisco_aaa.authorization_rules": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("authenticated", "group", "level", "method", "rule_id"),
+    ),
+    "cisco_aaa.authorization_rules.authenticated": ("bool", False, False, None, None, ()),
+    "cisco_aaa.authorization_rules.group": ("str", True, None, None, None, ()),
+    "cisco_aaa.authorization_rules.level": ("str", False, None, None, None, ()),
+    "cisco_aaa.authorization_rules.method": ("str", True, None, None, None, ()),
+    "cisco_aaa.authorization_rules.rule_id": ("str", True, None, None, None, ()),
+    "cisco_aaa.cts_authorization_list": ("str", False, None, None, None, ()),
+    "cisco_aaa.domain_stripping": ("str", False, None, None, None, ()),
+    "cisco_aaa.port": ("int", False, None, None, None, ()),
+    "cisco_aaa.radius": ("list", False, None, "dict", None, ("group_name", "server", "source_interface", "vpn")),
+    "cisco_aaa.radius.group_name": ("str", True, None, None, None, ()),
+    "cisco_aaa.radius.server": (
+        "list",
+        False,
+        [],
+        "dict",
+        None,
+        ("acct_port", "address", "auth_port", "key", "key_enum", "key_type", "retransmit", "secret_key", "timeout"),
+    ),
+    "cisco_aaa.radius.server.acct_port": ("int", False, None, None, None, ()),
+    "cisco_aaa.radius.server.address": ("str", True, None, None, None, ()),
+    "cisco_aaa.radius.server.auth_port": ("int", False, None, None, None, ()),
+    "cisco_aaa.radius.server.key": ("str", True, None, None, None, ()),
+    "cisco_aaa.radius.server.key_enum": ("str", False, None, None, None, ()),
+    "cisco_aaa.radius.server.key_type": ("str", False, None, None, None, ()),
+    "cisco_aaa.radius.server.retransmit": ("int", False, None, None, None, ()),
+    "cisco_aaa.radius.server.secret_key": ("str", False, None, None, None, ()),
+    "cisco_aaa.radius.server.timeout": ("int", False, None, None, None, ()),
+    "cisco_aaa.radius.source_interface": ("str", True, None, None, None, ()),
+    "cisco_aaa.radius.vpn": ("int", True, None, None, None, ()),
+    "cisco_aaa.radius_client": ("list", False, None, "dict", None, ("ip", "vpn")),
+    "cisco_aaa.radius_client.ip": ("str", True, None, None, None, ()),
+    "cisco_aaa.radius_client.vpn": ("list", True, None, "dict", None, ("name", "server_key")),
+    "cisco_aaa.radius_client.vpn.name": ("str", True, None, None, None, ()),
+    "cisco_aaa.radius_client.vpn.server_key": ("str", False, None, None, None, ()),
+    "cisco_aaa.radius_trustsec_group": ("str", False, None, None, None, ()),
+    "cisco_aaa.server_auth_order": ("str", False, "local", None, None, ()),
+    "cisco_aaa.server_key_password": ("str", False, None, None, None, ()),
+    "cisco_aaa.tacacs": ("list", False, None, "dict", None, ("group_name", "server", "source_interface", "vpn")),
+    "cisco_aaa.tacacs.group_name": ("str", True, None, None, None, ()),
+    "cisco_aaa.tacacs.server": (
+        "list",
+        False,
+        [],
+        "dict",
+        None,
+        ("address", "key", "key_enum", "port", "secret_key", "timeout"),
+    ),
+    "cisco_aaa.tacacs.server.address": ("str", True, None, None, None, ()),
+    "cisco_aaa.tacacs.server.key": ("str", True, None, None, None, ()),
+    "cisco_aaa.tacacs.server.key_enum": ("str", False, None, None, None, ()),
+    "cisco_aaa.tacacs.server.port": ("int", False, None, None, None, ()),
+    "cisco_aaa.tacacs.server.secret_key": ("str", False, None, None, None, ()),
+    "cisco_aaa.tacacs.server.timeout": ("int", False, None, None, None, ()),
+    "cisco_aaa.tacacs.source_interface": ("str", False, None, None, None, ()),
+    "cisco_aaa.tacacs.vpn": ("int", False, None, None, None, ()),
+    "cisco_aaa.user": ("list", False, None, "dict", None, ("name", "password", "privilege", "pubkey_chain", "secret")),
+    "cisco_aaa.user.name": ("str", True, None, None, None, ()),
+    "cisco_aaa.user.password": ("str", False, None, None, None, ()),
+    "cisco_aaa.user.privilege": ("str", False, "15", None, None, ()),
+    "cisco_aaa.user.pubkey_chain": ("list", False, None, "dict", None, ("key_string", "key_type")),
+    "cisco_aaa.user.pubkey_chain.key_string": ("str", True, None, None, None, ()),
+    "cisco_aaa.user.pubkey_chain.key_type": ("str", False, "ssh-rsa", None, None, ()),
+    "cisco_aaa.user.secret": ("str", False, None, None, None, ()),
+}
@@ -0,0 +1,5 @@
+cisco_banner_validation = {
+    "cisco_banner": ("dict", False, None, None, None, ("login_banner", "motd_banner")),
+    "cisco_banner.login_banner": ("str", False, None, None, None, ()),
+    "cisco_banner.motd_banner": ("str", False, None, None, None, ()),
+}
@@ -0,0 +1,19 @@
+cisco_bfd_validation = {
+    "cisco_bfd": ("dict", False, None, None, None, ("color", "default_dscp", "multiplier", "poll_interval")),
+    "cisco_bfd.color": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("color", "dscp", "hello_interval", "multiplier", "pmtu_discovery"),
+    ),
+    "cisco_bfd.color.color": ("str", True, None, None, None, ()),
+    "cisco_bfd.color.dscp": ("int", False, None, None, None, ()),
+    "cisco_bfd.color.hello_interval": ("int", False, None, None, None, ()),
+    "cisco_bfd.color.multiplier": ("int", False, None, None, None, ()),
+    "cisco_bfd.color.pmtu_discovery": ("bool", False, True, None, None, ()),
+    "cisco_bfd.default_dscp": ("int", False, None, None, None, ()),
+    "cisco_bfd.multiplier": ("int", False, None, None, None, ()),
+    "cisco_bfd.poll_interval": ("int", False, None, None, None, ()),
+}
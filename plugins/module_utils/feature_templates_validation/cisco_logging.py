@@ -0,0 +1,55 @@
+cisco_logging_validation = {
+    "cisco_logging": (
+        "dict",
+        False,
+        None,
+        None,
+        None,
+        ("enable", "ipv6_server", "rotate", "server", "size", "tls_profile"),
+    ),
+    "cisco_logging.enable": ("bool", False, None, None, None, ()),
+    "cisco_logging.ipv6_server": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("custom_profile", "enable_tls", "name", "priority", "profile", "source_interface", "vpn"),
+    ),
+    "cisco_logging.ipv6_server.custom_profile": ("bool", False, False, None, None, ()),
+    "cisco_logging.ipv6_server.enable_tls": ("bool", False, False, None, None, ()),
+    "cisco_logging.ipv6_server.name": ("str", True, None, None, None, ()),
+    "cisco_logging.ipv6_server.priority": ("str", False, "information", None, None, ()),
+    "cisco_logging.ipv6_server.profile": ("str", False, None, None, None, ()),
+    "cisco_logging.ipv6_server.source_interface": ("str", False, None, None, None, ()),
+    "cisco_logging.ipv6_server.vpn": ("int", True, None, None, None, ()),
+    "cisco_logging.rotate": ("int", False, None, None, None, ()),
+    "cisco_logging.server": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("custom_profile", "enable_tls", "name", "priority", "profile", "source_interface", "vpn"),
+    ),
+    "cisco_logging.server.custom_profile": ("bool", False, False, None, None, ()),
+    "cisco_logging.server.enable_tls": ("bool", False, False, None, None, ()),
+    "cisco_logging.server.name": ("str", True, None, None, None, ()),
+    "cisco_logging.server.priority": ("str", False, "information", None, None, ()),
+    "cisco_logging.server.profile": ("str", False, None, None, None, ()),
+    "cisco_logging.server.source_interface": ("str", False, None, None, None, ()),
+    "cisco_logging.server.vpn": ("int", True, None, None, None, ()),
+    "cisco_logging.size": ("int", False, None, None, None, ()),
+    "cisco_logging.tls_profile": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("auth_type", "ciphersuite_list", "profile", "version"),
+    ),
+    "cisco_logging.tls_profile.auth_type": ("str", True, None, None, None, ()),
+    "cisco_logging.tls_profile.ciphersuite_list": ("list", False, None, "str", None, ()),
+    "cisco_logging.tls_profile.profile": ("str", True, None, None, None, ()),
+    "cisco_logging.tls_profile.version": ("str", False, "TLSv1.1", None, None, ()),
+}
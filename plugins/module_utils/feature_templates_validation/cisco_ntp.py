@@ -0,0 +1,31 @@
+cisco_ntp_validation = {
+    "cisco_ntp": (
+        "dict",
+        False,
+        None,
+        None,
+        None,
+        ("authentication", "enable", "server", "source", "stratum", "trusted"),
+    ),
+    "cisco_ntp.authentication": ("list", False, None, "dict", None, ("md5", "number")),
+    "cisco_ntp.authentication.md5": ("str", True, None, None, None, ()),
+    "cisco_ntp.authentication.number": ("int", True, None, None, None, ()),
+    "cisco_ntp.enable": ("bool", False, None, None, None, ()),
+    "cisco_ntp.server": (
+        "list",
+        False,
+        [],
+        "dict",
+        None,
+        ("key", "name", "prefer", "source_interface", "version", "vpn"),
+    ),
+    "cisco_ntp.server.key": ("int", False, None, None, None, ()),
+    "cisco_ntp.server.name": ("str", True, None, None, None, ()),
+    "cisco_ntp.server.prefer": ("bool", False, None, None, None, ()),
+    "cisco_ntp.server.source_interface": ("str", False, None, None, None, ()),
+    "cisco_ntp.server.version": ("int", False, None, None, None, ()),
+    "cisco_ntp.server.vpn": ("int", False, None, None, None, ()),
+    "cisco_ntp.source": ("str", False, None, None, None, ()),
+    "cisco_ntp.stratum": ("int", False, None, None, None, ()),
+    "cisco_ntp.trusted": ("list", False, None, "int", None, ()),
+}
@@ -0,0 +1,48 @@
+cisco_omp_validation = {
+    "cisco_omp": (
+        "dict",
+        False,
+        None,
+        None,
+        None,
+        (
+            "advertise",
+            "advertisement_interval",
+            "auto_translate",
+            "ecmp_limit",
+            "eor_timer",
+            "graceful_restart",
+            "graceful_restart_timer",
+            "holdtime",
+            "ignore_region_path_length",
+            "ipv6_advertise",
+            "omp_admin_distance_ipv4",
+            "omp_admin_distance_ipv6",
+            "overlay_as",
+            "send_path_limit",
+            "shutdown",
+            "site_types",
+            "transport_gateway",
+        ),
+    ),
+    "cisco_omp.advertise": ("list", False, None, "dict", None, ("protocol", "route")),
+    "cisco_omp.advertise.protocol": ("str", True, None, None, None, ()),
+    "cisco_omp.advertise.route": ("str", False, None, None, None, ()),
+    "cisco_omp.advertisement_interval": ("int", False, None, None, None, ()),
+    "cisco_omp.auto_translate": ("bool", False, False, None, None, ()),
+    "cisco_omp.ecmp_limit": ("int", False, None, None, None, ()),
+    "cisco_omp.eor_timer": ("int", False, None, None, None, ()),
+    "cisco_omp.graceful_restart": ("bool", False, True, None, None, ()),
+    "cisco_omp.graceful_restart_timer": ("int", False, None, None, None, ()),
+    "cisco_omp.holdtime": ("int", False, None, None, None, ()),
+    "cisco_omp.ignore_region_path_length": ("bool", False, False, None, None, ()),
+    "cisco_omp.ipv6_advertise": ("list", False, None, "dict", None, ("protocol",)),
+    "cisco_omp.ipv6_advertise.protocol": ("str", True, None, None, None, ()),
+    "cisco_omp.omp_admin_distance_ipv4": ("int", False, None, None, None, ()),
+    "cisco_omp.omp_admin_distance_ipv6": ("int", False, None, None, None, ()),
+    "cisco_omp.overlay_as": ("int", False, None, None, None, ()),
+    "cisco_omp.send_path_limit": ("int", False, None, None, None, ()),
+    "cisco_omp.shutdown": ("bool", False, None, None, None, ()),
+    "cisco_omp.site_types": ("list", False, None, "str", None, ()),
+    "cisco_omp.transport_gateway": ("str", False, None, None, None, ()),
+}
@@ -0,0 +1,90 @@
+cisco_ospf_validation = {
+    "cisco_ospf": (
+        "dict",
+        False,
+        None,
+        None,
+        None,
+        (
+            "always",
+            "area",
+            "delay",
+            "external",
+            "initial_hold",
+            "inter_area",
+            "intra_area",
+            "max_hold",
+            "metric",
+            "metric_type",
+            "originate",
+            "redistribute",
+            "reference_bandwidth",
+            "rfc1583",
+            "route_policy",
+            "router_id",
+            "router_lsa",
+        ),
+    ),
+    "cisco_ospf.always": ("bool", False, None, None, None, ()),
+    "cisco_ospf.area": ("list", False, None, "dict", None, ("a_num", "interface", "nssa", "range", "stub")),
+    "cisco_ospf.area.a_num": ("int", True, None, None, None, ()),
+    "cisco_ospf.area.interface": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        (
+            "cost",
+            "dead_interval",
+            "hello_interval",
+            "md5",
+            "message_digest_key",
+            "name",
+            "network",
+            "passive_interface",
+            "priority",
+            "retransmit_interval",
+            "type",
+        ),
+    ),
+    "cisco_ospf.area.interface.cost": ("int", False, None, None, None, ()),
+    "cisco_ospf.area.interface.dead_interval": ("int", False, None, None, None, ()),
+    "cisco_ospf.area.interface.hello_interval": ("int", False, None, None, None, ()),
+    "cisco_ospf.area.interface.md5": ("str", False, None, None, None, ()),
+    "cisco_ospf.area.interface.message_digest_key": ("int", False, None, None, None, ()),
+    "cisco_ospf.area.interface.name": ("str", True, None, None, None, ()),
+    "cisco_ospf.area.interface.network": ("str", False, "broadcast", None, None, ()),
+    "cisco_ospf.area.interface.passive_interface": ("bool", False, False, None, None, ()),
+    "cisco_ospf.area.interface.priority": ("int", False, None, None, None, ()),
+    "cisco_ospf.area.interface.retransmit_interval": ("int", False, None, None, None, ()),
+    "cisco_ospf.area.interface.type": ("str", False, None, None, None, ()),
+    "cisco_ospf.area.nssa": ("bool", False, None, None, None, ()),
+    "cisco_ospf.area.range": ("list", False, None, "dict", None, ("address", "cost", "no_advertise")),
+    "cisco_ospf.area.range.address": ("str", True, None, None, None, ()),
+    "cisco_ospf.area.range.cost": ("int", False, None, None, None, ()),
+    "cisco_ospf.area.range.no_advertise": ("bool", False, False, None, None, ()),
+    "cisco_ospf.area.stub": ("bool", False, None, None, None, ()),
+    "cisco_ospf.delay": ("int", False, None, None, None, ()),
+    "cisco_ospf.external": ("int", False, None, None, None, ()),
+    "cisco_ospf.initial_hold": ("int", False, None, None, None, ()),
+    "cisco_ospf.inter_area": ("int", False, None, None, None, ()),
+    "cisco_ospf.intra_area": ("int", False, None, None, None, ()),
+    "cisco_ospf.max_hold": ("int", False, None, None, None, ()),
+    "cisco_ospf.metric": ("int", False, None, None, None, ()),
+    "cisco_ospf.metric_type": ("str", False, None, None, None, ()),
+    "cisco_ospf.originate": ("bool", False, None, None, None, ()),
+    "cisco_ospf.redistribute": ("list", False, None, "dict", None, ("dia", "protocol", "route_policy")),
+    "cisco_ospf.redistribute.dia": ("bool", False, True, None, None, ()),
+    "cisco_ospf.redistribute.protocol": ("str", True, None, None, None, ()),
+    "cisco_ospf.redistribute.route_policy": ("str", False, None, None, None, ()),
+    "cisco_ospf.reference_bandwidth": ("int", False, None, None, None, ()),
+    "cisco_ospf.rfc1583": ("bool", False, True, None, None, ()),
+    "cisco_ospf.route_policy": ("list", False, None, "dict", None, ("direction", "pol_name")),
+    "cisco_ospf.route_policy.direction": ("str", True, None, None, None, ()),
+    "cisco_ospf.route_policy.pol_name": ("str", True, None, None, None, ()),
+    "cisco_ospf.router_id": ("str", False, None, None, None, ()),
+    "cisco_ospf.router_lsa": ("list", False, None, "dict", None, ("ad_type", "time")),
+    "cisco_ospf.router_lsa.ad_type": ("str", True, None, None, None, ()),
+    "cisco_ospf.router_lsa.time": ("int", True, None, None, None, ()),
+}
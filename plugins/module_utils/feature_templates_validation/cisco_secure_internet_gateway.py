@@ -0,0 +1,185 @@
+cisco_secure_internet_gateway_validation = {
+    "cisco_secure_internet_gateway": (
+        "dict",
+        False,
+        None,
+        None,
+        None,
+        ("child_org_id", "interface", "service", "tracker", "tracker_src_ip", "vpn_id"),
+    ),
+    "cisco_secure_internet_gateway.child_org_id": ("str", False, "", None, None, ()),
+    "cisco_secure_internet_gateway.interface": (
+        "list",
+        True,
+        None,
+        "dict",
+        None,
+        (
+            "address",
+            "application",
+            "auto",
+            "description",
+            "dpd_interval",
+            "dpd_retries",
+            "if_name",
+            "ike_ciphersuite",
+            "ike_group",
+            "ike_local_id",
+            "ike_rekey_interval",
+            "ike_remote_id",
+            "ike_version",
+            "ipsec_ciphersuite",
+            "ipsec_rekey_interval",
+            "ipsec_replay_window",
+            "mtu",
+            "perfect_forward_secrecy",
+            "pre_shared_key_dynamic",
+            "pre_shared_secret",
+            "shutdown",
+            "tcp_mss_adjust",
+            "track_enable",
+            "tracker",
+            "tunnel_dc_preference",
+            "tunnel_destination",
+            "tunnel_public_ip",
+            "tunnel_route_via",
+            "tunnel_set",
+            "tunnel_source",
+            "tunnel_source_interface",
+            "unnumbered",
+        ),
+    ),
+    "cisco_secure_internet_gateway.interface.address": ("str", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.application": ("str", False, "sig", None, None, ()),
+    "cisco_secure_internet_gateway.interface.auto": ("bool", True, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.description": ("str", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.dpd_interval": ("int", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.dpd_retries": ("int", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.if_name": ("str", True, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.ike_ciphersuite": ("str", False, "aes256-cbc-sha1", None, None, ()),
+    "cisco_secure_internet_gateway.interface.ike_group": ("str", False, "14", None, None, ()),
+    "cisco_secure_internet_gateway.interface.ike_local_id": ("str", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.ike_rekey_interval": ("int", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.ike_remote_id": ("str", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.ike_version": ("int", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.ipsec_ciphersuite": ("str", False, "aes256-gcm", None, None, ()),
+    "cisco_secure_internet_gateway.interface.ipsec_rekey_interval": ("int", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.ipsec_replay_window": ("int", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.mtu": ("int", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.perfect_forward_secrecy": ("str", False, "none", None, None, ()),
+    "cisco_secure_internet_gateway.interface.pre_shared_key_dynamic": ("bool", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.pre_shared_secret": ("str", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.shutdown": ("bool", True, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.tcp_mss_adjust": ("int", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.track_enable": ("bool", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.tracker": ("bool", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.tunnel_dc_preference": ("str", False, "primary-dc", None, None, ()),
+    "cisco_secure_internet_gateway.interface.tunnel_destination": ("str", True, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.tunnel_public_ip": ("str", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.tunnel_route_via": ("str", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.tunnel_set": (
+        "str",
+        False,
+        "secure-internet-gateway-umbrella",
+        None,
+        None,
+        (),
+    ),
+    "cisco_secure_internet_gateway.interface.tunnel_source": ("str", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.tunnel_source_interface": ("str", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.interface.unnumbered": ("bool", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.service": (
+        "list",
+        True,
+        None,
+        "dict",
+        None,
+        (
+            "auth_required",
+            "block_internet_until_accepted",
+            "caution_enabled",
+            "data_center_primary",
+            "data_center_secondary",
+            "display_time_unit",
+            "enabled",
+            "force_ssl_inspection",
+            "idle_time",
+            "interface_pair",
+            "ip",
+            "ip_enforced_for_known_browsers",
+            "ips_control",
+            "location_name",
+            "ofw_enabled",
+            "primary_data_center",
+            "refresh_time",
+            "refresh_time_unit",
+            "secondary_data_center",
+            "svc_type",
+            "timeout",
+            "xff_forward_enabled",
+        ),
+    ),
+    "cisco_secure_internet_gateway.service.auth_required": ("bool", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.service.block_internet_until_accepted": ("bool", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.service.caution_enabled": ("bool", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.service.data_center_primary": ("str", False, "Auto", None, None, ()),
+    "cisco_secure_internet_gateway.service.data_center_secondary": ("str", False, "Auto", None, None, ()),
+    "cisco_secure_internet_gateway.service.display_time_unit": ("str", False, "MINUTE", None, None, ()),
+    "cisco_secure_internet_gateway.service.enabled": ("bool", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.service.force_ssl_inspection": ("bool", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.service.idle_time": ("int", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.service.interface_pair": (
+        "list",
+        True,
+        None,
+        "dict",
+        None,
+        ("active_interface", "active_interface_weight", "backup_interface", "backup_interface_weight"),
+    ),
+    "cisco_secure_internet_gateway.service.interface_pair.active_interface": ("str", True, None, None, None, ()),
+    "cisco_secure_internet_gateway.service.interface_pair.active_interface_weight": (
+        "int",
+        False,
+        None,
+        None,
+        None,
+        (),
+    ),
+    "cisco_secure_internet_gateway.service.interface_pair.backup_interface": ("str", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.service.interface_pair.backup_interface_weight": (
+        "int",
+        False,
+        None,
+        None,
+        None,
+        (),
+    ),
+    "cisco_secure_internet_gateway.service.ip": ("bool", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.service.ip_enforced_for_known_browsers": ("bool", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.service.ips_control": ("bool", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.service.location_name": ("str", False, "Auto", None, None, ()),
+    "cisco_secure_internet_gateway.service.ofw_enabled": ("bool", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.service.primary_data_center": ("str", False, "Auto", None, None, ()),
+    "cisco_secure_internet_gateway.service.refresh_time": ("int", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.service.refresh_time_unit": ("str", False, "MINUTE", None, None, ()),
+    "cisco_secure_internet_gateway.service.secondary_data_center": ("str", False, "Auto", None, None, ()),
+    "cisco_secure_internet_gateway.service.svc_type": ("str", False, "sig", None, None, ()),
+    "cisco_secure_internet_gateway.service.timeout": ("int", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.service.xff_forward_enabled": ("bool", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.tracker": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("endpoint_api_url", "interval", "multiplier", "name", "threshold", "tracker_type"),
+    ),
+    "cisco_secure_internet_gateway.tracker.endpoint_api_url": ("str", True, None, None, None, ()),
+    "cisco_secure_internet_gateway.tracker.interval": ("int", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.tracker.multiplier": ("int", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.tracker.name": ("str", True, None, None, None, ()),
+    "cisco_secure_internet_gateway.tracker.threshold": ("int", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.tracker.tracker_type": ("str", True, None, None, None, ()),
+    "cisco_secure_internet_gateway.tracker_src_ip": ("str", False, None, None, None, ()),
+    "cisco_secure_internet_gateway.vpn_id": ("int", False, None, None, None, ()),
+}
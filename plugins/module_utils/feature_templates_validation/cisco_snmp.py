@@ -0,0 +1,54 @@
+cisco_snmp_validation = {
+    "cisco_snmp": (
+        "dict",
+        False,
+        None,
+        None,
+        None,
+        ("community", "contact", "group", "location", "shutdown", "target", "user", "view"),
+    ),
+    "cisco_snmp.community": ("list", False, None, "dict", None, ("authorization", "name", "view")),
+    "cisco_snmp.community.authorization": ("str", True, None, None, None, ()),
+    "cisco_snmp.community.name": ("str", True, None, None, None, ()),
+    "cisco_snmp.community.view": ("str", True, None, None, None, ()),
+    "cisco_snmp.contact": ("str", False, None, None, None, ()),
+    "cisco_snmp.group": ("list", False, None, "dict", None, ("name", "security_level", "view")),
+    "cisco_snmp.group.name": ("str", True, None, None, None, ()),
+    "cisco_snmp.group.security_level": ("str", True, None, None, None, ()),
+    "cisco_snmp.group.view": ("str", True, None, None, None, ()),
+    "cisco_snmp.location": ("str", False, None, None, None, ()),
+    "cisco_snmp.shutdown": ("bool", False, True, None, None, ()),
+    "cisco_snmp.target": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("community_name", "ip", "port", "source_interface", "user", "vpn_id"),
+    ),
+    "cisco_snmp.target.community_name": ("str", False, None, None, None, ()),
+    "cisco_snmp.target.ip": ("str", True, None, None, None, ()),
+    "cisco_snmp.target.port": ("int", True, None, None, None, ()),
+    "cisco_snmp.target.source_interface": ("str", False, None, None, None, ()),
+    "cisco_snmp.target.user": ("str", False, None, None, None, ()),
+    "cisco_snmp.target.vpn_id": ("int", True, None, None, None, ()),
+    "cisco_snmp.user": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("auth", "auth_password", "group", "name", "priv", "priv_password"),
+    ),
+    "cisco_snmp.user.auth": ("str", False, None, None, None, ()),
+    "cisco_snmp.user.auth_password": ("str", False, None, None, None, ()),
+    "cisco_snmp.user.group": ("str", True, None, None, None, ()),
+    "cisco_snmp.user.name": ("str", True, None, None, None, ()),
+    "cisco_snmp.user.priv": ("str", False, None, None, None, ()),
+    "cisco_snmp.user.priv_password": ("str", False, None, None, None, ()),
+    "cisco_snmp.view": ("list", False, None, "dict", None, ("name", "oid")),
+    "cisco_snmp.view.name": ("str", True, None, None, None, ()),
+    "cisco_snmp.view.oid": ("list", False, None, "dict", None, ("exclude", "id")),
+    "cisco_snmp.view.oid.exclude": ("bool", False, None, None, None, ()),
+    "cisco_snmp.view.oid.id": ("str", True, None, None, None, ()),
+}
@@ -0,0 +1,158 @@
+cisco_system_validation = {
+    "cisco_system": (
+        "dict",
+        False,
+        None,
+        None,
+        None,
+        (
+            "admin_tech_on_failure",
+            "affinity_group_number",
+            "affinity_per_vrf",
+            "console_baud_rate",
+            "control_session_pps",
+            "controller_group_list",
+            "description",
+            "device_groups",
+            "enable_fencing",
+            "enable_management_region",
+            "enable_mrf_migration",
+            "enable_sms",
+            "enable_tunnel",
+            "epfr",
+            "hostname",
+            "idle_timeout",
+            "latitude",
+            "location",
+            "longitude",
+            "management_gateway",
+            "max_omp_sessions",
+            "migration_bgp_community",
+            "mobile_number",
+            "multi_tenant",
+            "object_track",
+            "on_demand_idle_timeout_min",
+            "overlay_id",
+            "port_hop",
+            "port_offset",
+            "preference",
+            "preference_auto",
+            "range",
+            "region_id",
+            "role",
+            "secondary_region",
+            "site_id",
+            "site_type",
+            "system_ip",
+            "timezone",
+            "track_default_gateway",
+            "track_interface_tag",
+            "track_transport",
+            "tracker",
+            "transport_gateway",
+            "vrf",
+        ),
+    ),
+    "cisco_system.admin_tech_on_failure": ("bool", False, None, None, None, ()),
+    "cisco_system.affinity_group_number": ("int", False, None, None, None, ()),
+    "cisco_system.affinity_per_vrf": ("list", False, None, "dict", None, ("affinity_group_number", "vrf_range")),
+    "cisco_system.affinity_per_vrf.affinity_group_number": ("int", False, None, None, None, ()),
+    "cisco_system.affinity_per_vrf.vrf_range": ("str", False, None, None, None, ()),
+    "cisco_system.console_baud_rate": ("str", False, None, None, None, ()),
+    "cisco_system.control_session_pps": ("int", False, None, None, None, ()),
+    "cisco_system.controller_group_list": ("list", False, None, "int", None, ()),
+    "cisco_system.description": ("str", False, None, None, None, ()),
+    "cisco_system.device_groups": ("list", False, None, "str", None, ()),
+    "cisco_system.enable_fencing": ("bool", False, None, None, None, ()),
+    "cisco_system.enable_management_region": ("bool", False, None, None, None, ()),
+    "cisco_system.enable_mrf_migration": ("str", False, None, None, None, ()),
+    "cisco_system.enable_sms": ("bool", False, False, None, None, ()),
+    "cisco_system.enable_tunnel": ("bool", False, None, None, None, ()),
+    "cisco_system.epfr": ("str", False, None, None, None, ()),
+    "cisco_system.hostname": ("raw", False, None, None, None, ("name",)),
+    "cisco_system.hostname.name": ("str", True, "system_host_name", None, None, ()),
+    "cisco_system.idle_timeout": ("int", False, None, None, None, ()),
+    "cisco_system.latitude": ("str", False, None, None, None, ()),
+    "cisco_system.location": ("str", False, None, None, None, ()),
+    "cisco_system.longitude": ("str", False, None, None, None, ()),
+    "cisco_system.management_gateway": ("bool", False, None, None, None, ()),
+    "cisco_system.max_omp_sessions": ("int", False, None, None, None, ()),
+    "cisco_system.migration_bgp_community": ("int", False, None, None, None, ()),
+    "cisco_system.mobile_number": ("list", False, None, "dict", None, ("number",)),
+    "cisco_system.mobile_number.number": ("str", True, None, None, None, ()),
+    "cisco_system.multi_tenant": ("bool", False, None, None, None, ()),
+    "cisco_system.object_track": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("boolean", "interface", "ip", "mask", "object", "object_number", "sig", "vpn"),
+    ),
+    "cisco_system.object_track.boolean": ("str", True, None, None, None, ()),
+    "cisco_system.object_track.interface": ("str", True, None, None, None, ()),
+    "cisco_system.object_track.ip": ("str", True, None, None, None, ()),
+    "cisco_system.object_track.mask": ("str", False, "0.0.0.0", None, None, ()),
+    "cisco_system.object_track.object": ("list", True, None, "dict", None, ("number",)),
+    "cisco_system.object_track.object.number": ("int", True, None, None, None, ()),
+    "cisco_system.object_track.object_number": ("int", True, None, None, None, ()),
+    "cisco_system.object_track.sig": ("str", True, None, None, None, ()),
+    "cisco_system.object_track.vpn": ("int", True, None, None, None, ()),
+    "cisco_system.on_demand_idle_timeout_min": ("int", False, None, None, None, ()),
+    "cisco_system.overlay_id": ("int", False, None, None, None, ()),
+    "cisco_system.port_hop": ("bool", False, None, None, None, ()),
+    "cisco_system.port_offset": ("int", False, None, None, None, ()),
+    "cisco_system.preference": ("list", False, None, "int", None, ()),
+    "cisco_system.preference_auto": ("bool", False, None, None, None, ()),
+    "cisco_system.range": ("int", False, None, None, None, ()),
+    "cisco_system.region_id": ("int", False, None, None, None, ()),
+    "cisco_system.role": ("str", False, None, None, None, ()),
+    "cisco_system.secondary_region": ("int", False, None, None, None, ()),
+    "cisco_system.site_id": ("int", False, "system_site_id", None, None, ()),
+    "cisco_system.site_type": ("list", False, None, "str", None, ()),
+    "cisco_system.system_ip": ("raw", False, None, None, None, ("name",)),
+    "cisco_system.system_ip.name": ("str", True, "system_system_ip", None, None, ()),
+    "cisco_system.timezone": ("str", False, None, None, None, ()),
+    "cisco_system.track_default_gateway": ("bool", False, None, None, None, ()),
+    "cisco_system.track_interface_tag": ("int", False, None, None, None, ()),
+    "cisco_system.track_transport": ("bool", False, None, None, None, ()),
+    "cisco_system.tracker": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        (
+            "boolean",
+            "elements",
+            "endpoint_api_url",
+            "endpoint_dns_name",
+            "endpoint_ip",
+            "endpoint_ip_transport_port",
+            "interval",
+            "multiplier",
+            "name",
+            "port",
+            "protocol",
+            "threshold",
+            "type",
+        ),
+    ),
+    "cisco_system.tracker.boolean": ("str", False, "or", None, None, ()),
+    "cisco_system.tracker.elements": ("list", False, None, "str", None, ()),
+    "cisco_system.tracker.endpoint_api_url": ("str", False, None, None, None, ()),
+    "cisco_system.tracker.endpoint_dns_name": ("str", False, None, None, None, ()),
+    "cisco_system.tracker.endpoint_ip": ("str", False, None, None, None, ()),
+    "cisco_system.tracker.endpoint_ip_transport_port": ("str", False, None, None, None, ()),
+    "cisco_system.tracker.interval": ("int", False, None, None, None, ()),
+    "cisco_system.tracker.multiplier": ("int", False, None, None, None, ()),
+    "cisco_system.tracker.name": ("str", True, None, None, None, ()),
+    "cisco_system.tracker.port": ("int", False, None, None, None, ()),
+    "cisco_system.tracker.protocol": ("str", False, None, None, None, ()),
+    "cisco_system.tracker.threshold": ("int", False, None, None, None, ()),
+    "cisco_system.tracker.type": ("str", False, "interface", None, None, ()),
+    "cisco_system.transport_gateway": ("bool", False, None, None, None, ()),
+    "cisco_system.vrf": ("list", False, None, "dict", None, ("gateway_preference", "vrf_id")),
+    "cisco_system.vrf.gateway_preference": ("list", False, None, "int", None, ()),
+    "cisco_system.vrf.vrf_id": ("int", True, None, None, None, ()),
+}
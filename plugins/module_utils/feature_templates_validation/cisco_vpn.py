@@ -0,0 +1,275 @@
+cisco_vpn_validation = {
+    "cisco_vpn": (
+        "dict",
+        False,
+        None,
+        None,
+        None,
+        (
+            "advertise",
+            "dns",
+            "dns_ipv6",
+            "gre_route",
+            "host",
+            "ipsec_route",
+            "ipv6_advertise",
+            "layer4",
+            "natpool",
+            "omp_admin_distance_ipv4",
+            "omp_admin_distance_ipv6",
+            "org_name",
+            "pool",
+            "port_forward",
+            "route_export",
+            "route_import",
+            "route_import_from",
+            "route_v4",
+            "route_v6",
+            "service",
+            "service_route",
+            "static",
+            "subnet_static",
+            "tenant_vpn_id",
+            "vpn_id",
+            "vpn_name",
+        ),
+    ),
+    "cisco_vpn.advertise": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("prefix_list", "protocol", "protocol_sub_type", "route_policy"),
+    ),
+    "cisco_vpn.advertise.prefix_list": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("aggregate_only", "prefix_entry", "region"),
+    ),
+    "cisco_vpn.advertise.prefix_list.aggregate_only": ("bool", False, None, None, None, ()),
+    "cisco_vpn.advertise.prefix_list.prefix_entry": ("str", True, None, None, None, ()),
+    "cisco_vpn.advertise.prefix_list.region": ("str", False, None, None, None, ()),
+    "cisco_vpn.advertise.protocol": ("str", True, None, None, None, ()),
+    "cisco_vpn.advertise.protocol_sub_type": ("list", False, None, "str", None, ()),
+    "cisco_vpn.advertise.route_policy": ("str", False, None, None, None, ()),
+    "cisco_vpn.dns": ("list", False, None, "dict", None, ("dns_addr", "role")),
+    "cisco_vpn.dns.dns_addr": ("str", False, None, None, None, ()),
+    "cisco_vpn.dns.role": ("str", False, "primary", None, None, ()),
+    "cisco_vpn.dns_ipv6": ("list", False, None, "dict", None, ("dns_addr", "role")),
+    "cisco_vpn.dns_ipv6.dns_addr": ("str", False, None, None, None, ()),
+    "cisco_vpn.dns_ipv6.role": ("str", False, "primary", None, None, ()),
+    "cisco_vpn.gre_route": ("list", False, None, "dict", None, ("interface", "prefix", "vpn")),
+    "cisco_vpn.gre_route.interface": ("list", False, None, "str", None, ()),
+    "cisco_vpn.gre_route.prefix": ("str", True, None, None, None, ()),
+    "cisco_vpn.gre_route.vpn": ("int", True, None, None, None, ()),
+    "cisco_vpn.host": ("list", False, None, "dict", None, ("hostname", "ip")),
+    "cisco_vpn.host.hostname": ("str", True, None, None, None, ()),
+    "cisco_vpn.host.ip": ("list", True, None, "str", None, ()),
+    "cisco_vpn.ipsec_route": ("list", False, None, "dict", None, ("interface", "prefix", "vpn")),
+    "cisco_vpn.ipsec_route.interface": ("list", False, None, "str", None, ()),
+    "cisco_vpn.ipsec_route.prefix": ("str", True, None, None, None, ()),
+    "cisco_vpn.ipsec_route.vpn": ("int", True, None, None, None, ()),
+    "cisco_vpn.ipv6_advertise": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("prefix_list", "protocol", "protocol_sub_type", "route_policy"),
+    ),
+    "cisco_vpn.ipv6_advertise.prefix_list": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("aggregate_only", "prefix_entry", "region"),
+    ),
+    "cisco_vpn.ipv6_advertise.prefix_list.aggregate_only": ("bool", False, None, None, None, ()),
+    "cisco_vpn.ipv6_advertise.prefix_list.prefix_entry": ("str", True, None, None, None, ()),
+    "cisco_vpn.ipv6_advertise.prefix_list.region": ("str", False, None, None, None, ()),
+    "cisco_vpn.ipv6_advertise.protocol": ("str", True, None, None, None, ()),
+    "cisco_vpn.ipv6_advertise.protocol_sub_type": ("list", False, None, "str", None, ()),
+    "cisco_vpn.ipv6_advertise.route_policy": ("str", False, None, None, None, ()),
+    "cisco_vpn.layer4": ("bool", False, None, None, None, ()),
+    "cisco_vpn.natpool": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("direction", "name", "overload", "prefix_length", "range_end", "range_start", "tracker_id"),
+    ),
+    "cisco_vpn.natpool.direction": ("str", True, None, None, None, ()),
+    "cisco_vpn.natpool.name": ("int", True, None, None, None, ()),
+    "cisco_vpn.natpool.overload": ("str", False, "true", None, None, ()),
+    "cisco_vpn.natpool.prefix_length": ("int", False, None, None, None, ()),
+    "cisco_vpn.natpool.range_end": ("str", False, None, None, None, ()),
+    "cisco_vpn.natpool.range_start": ("str", False, None, None, None, ()),
+    "cisco_vpn.natpool.tracker_id": ("int", False, None, None, None, ()),
+    "cisco_vpn.omp_admin_distance_ipv4": ("int", False, None, None, None, ()),
+    "cisco_vpn.omp_admin_distance_ipv6": ("int", False, None, None, None, ()),
+    "cisco_vpn.org_name": ("str", False, None, None, None, ()),
+    "cisco_vpn.pool": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        (
+            "end_address",
+            "leak_from_global",
+            "leak_from_global_protocol",
+            "leak_to_global",
+            "name",
+            "overload",
+            "start_address",
+        ),
+    ),
+    "cisco_vpn.pool.end_address": ("str", True, None, None, None, ()),
+    "cisco_vpn.pool.leak_from_global": ("bool", True, None, None, None, ()),
+    "cisco_vpn.pool.leak_from_global_protocol": ("str", True, None, None, None, ()),
+    "cisco_vpn.pool.leak_to_global": ("bool", True, None, None, None, ()),
+    "cisco_vpn.pool.name": ("str", True, None, None, None, ()),
+    "cisco_vpn.pool.overload": ("bool", False, None, None, None, ()),
+    "cisco_vpn.pool.start_address": ("str", True, None, None, None, ()),
+    "cisco_vpn.port_forward": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("pool_name", "proto", "source_ip", "source_port", "translate_ip", "translate_port"),
+    ),
+    "cisco_vpn.port_forward.pool_name": ("int", False, None, None, None, ()),
+    "cisco_vpn.port_forward.proto": ("str", True, None, None, None, ()),
+    "cisco_vpn.port_forward.source_ip": ("str", True, None, None, None, ()),
+    "cisco_vpn.port_forward.source_port": ("int", True, None, None, None, ()),
+    "cisco_vpn.port_forward.translate_ip": ("str", True, None, None, None, ()),
+    "cisco_vpn.port_forward.translate_port": ("int", True, None, None, None, ()),
+    "cisco_vpn.route_export": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("protocol", "protocol_sub_type", "redistribute", "route_policy"),
+    ),
+    "cisco_vpn.route_export.protocol": ("str", True, None, None, None, ()),
+    "cisco_vpn.route_export.protocol_sub_type": ("list", True, None, "str", None, ()),
+    "cisco_vpn.route_export.redistribute": ("list", False, None, "dict", None, ("protocol", "route_policy")),
+    "cisco_vpn.route_export.redistribute.protocol": ("str", True, None, None, None, ()),
+    "cisco_vpn.route_export.redistribute.route_policy": ("str", False, None, None, None, ()),
+    "cisco_vpn.route_export.route_policy": ("str", False, None, None, None, ()),
+    "cisco_vpn.route_import": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("protocol", "protocol_sub_type", "redistribute", "route_policy"),
+    ),
+    "cisco_vpn.route_import.protocol": ("str", True, None, None, None, ()),
+    "cisco_vpn.route_import.protocol_sub_type": ("list", True, None, "str", None, ()),
+    "cisco_vpn.route_import.redistribute": ("list", False, None, "dict", None, ("protocol", "route_policy")),
+    "cisco_vpn.route_import.redistribute.protocol": ("str", True, None, None, None, ()),
+    "cisco_vpn.route_import.redistribute.route_policy": ("str", False, None, None, None, ()),
+    "cisco_vpn.route_import.route_policy": ("str", False, None, None, None, ()),
+    "cisco_vpn.route_import_from": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("protocol", "protocol_sub_type", "redistribute", "route_policy", "source_vpn"),
+    ),
+    "cisco_vpn.route_import_from.protocol": ("str", True, None, None, None, ()),
+    "cisco_vpn.route_import_from.protocol_sub_type": ("list", True, None, "str", None, ()),
+    "cisco_vpn.route_import_from.redistribute": ("list", False, None, "dict", None, ("protocol", "route_policy")),
+    "cisco_vpn.route_import_from.redistribute.protocol": ("str", True, None, None, None, ()),
+    "cisco_vpn.route_import_from.redistribute.route_policy": ("str", False, None, None, None, ()),
+    "cisco_vpn.route_import_from.route_policy": ("str", False, None, None, None, ()),
+    "cisco_vpn.route_import_from.source_vpn": ("int", True, None, None, None, ()),
+    "cisco_vpn.route_v4": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("dhcp", "distance", "next_hop", "next_hop_with_track", "null0", "prefix", "route_interface", "vpn"),
+    ),
+    "cisco_vpn.route_v4.dhcp": ("bool", False, None, None, None, ()),
+    "cisco_vpn.route_v4.distance": ("int", False, None, None, None, ()),
+    "cisco_vpn.route_v4.next_hop": ("list", False, None, "dict", None, ("address", "distance")),
+    "cisco_vpn.route_v4.next_hop.address": ("str", False, None, None, None, ()),
+    "cisco_vpn.route_v4.next_hop.distance": ("int", False, None, None, None, ()),
+    "cisco_vpn.route_v4.next_hop_with_track": ("list", False, None, "dict", None, ("address", "distance", "tracker")),
+    "cisco_vpn.route_v4.next_hop_with_track.address": ("str", False, None, None, None, ()),
+    "cisco_vpn.route_v4.next_hop_with_track.distance": ("int", False, None, None, None, ()),
+    "cisco_vpn.route_v4.next_hop_with_track.tracker": ("str", True, None, None, None, ()),
+    "cisco_vpn.route_v4.null0": ("bool", False, None, None, None, ()),
+    "cisco_vpn.route_v4.prefix": ("str", False, None, None, None, ()),
+    "cisco_vpn.route_v4.route_interface": ("dict", False, None, None, None, ("interface_name", "interface_next_hop")),
+    "cisco_vpn.route_v4.route_interface.interface_name": ("str", True, None, None, None, ()),
+    "cisco_vpn.route_v4.route_interface.interface_next_hop": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("address", "distance"),
+    ),
+    "cisco_vpn.route_v4.route_interface.interface_next_hop.address": ("str", False, None, None, None, ()),
+    "cisco_vpn.route_v4.route_interface.interface_next_hop.distance": ("int", False, None, None, None, ()),
+    "cisco_vpn.route_v4.vpn": ("int", False, None, None, None, ()),
+    "cisco_vpn.route_v6": ("list", False, None, "dict", None, ("nat", "next_hop", "null0", "prefix", "vpn")),
+    "cisco_vpn.route_v6.nat": ("str", False, None, None, None, ()),
+    "cisco_vpn.route_v6.next_hop": ("list", False, None, "dict", None, ("address", "distance")),
+    "cisco_vpn.route_v6.next_hop.address": ("str", True, None, None, None, ()),
+    "cisco_vpn.route_v6.next_hop.distance": ("int", False, None, None, None, ()),
+    "cisco_vpn.route_v6.null0": ("bool", False, None, None, None, ()),
+    "cisco_vpn.route_v6.prefix": ("str", True, None, None, None, ()),
+    "cisco_vpn.route_v6.vpn": ("int", False, None, None, None, ()),
+    "cisco_vpn.service": ("list", False, None, "dict", None, ("address", "interface", "svc_type", "track_enable")),
+    "cisco_vpn.service.address": ("list", False, None, "str", None, ()),
+    "cisco_vpn.service.interface": ("str", False, None, None, None, ()),
+    "cisco_vpn.service.svc_type": ("str", True, None, None, None, ()),
+    "cisco_vpn.service.track_enable": ("bool", False, None, None, None, ()),
+    "cisco_vpn.service_route": ("list", False, None, "dict", None, ("prefix", "service", "vpn")),
+    "cisco_vpn.service_route.prefix": ("str", True, None, None, None, ()),
+    "cisco_vpn.service_route.service": ("str", False, "sig", None, None, ()),
+    "cisco_vpn.service_route.vpn": ("int", True, None, None, None, ()),
+    "cisco_vpn.static": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("pool_name", "source_ip", "static_nat_direction", "tracker_id", "translate_ip"),
+    ),
+    "cisco_vpn.static.pool_name": ("int", False, None, None, None, ()),
+    "cisco_vpn.static.source_ip": ("str", False, None, None, None, ()),
+    "cisco_vpn.static.static_nat_direction": ("str", True, None, None, None, ()),
+    "cisco_vpn.static.tracker_id": ("int", False, None, None, None, ()),
+    "cisco_vpn.static.translate_ip": ("str", False, None, None, None, ()),
+    "cisco_vpn.subnet_static": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("prefix_length", "source_ip_subnet", "static_nat_direction", "tracker_id", "translate_ip_subnet"),
+    ),
+    "cisco_vpn.subnet_static.prefix_length": ("int", True, None, None, None, ()),
+    "cisco_vpn.subnet_static.source_ip_subnet": ("str", True, None, None, None, ()),
+    "cisco_vpn.subnet_static.static_nat_direction": ("str", True, None, None, None, ()),
+    "cisco_vpn.subnet_static.tracker_id": ("int", False, None, None, None, ()),
+    "cisco_vpn.subnet_static.translate_ip_subnet": ("str", True, None, None, None, ()),
+    "cisco_vpn.tenant_vpn_id": ("int", False, None, None, None, ()),
+    "cisco_vpn.vpn_id": ("int", False, None, None, None, ()),
+    "cisco_vpn.vpn_name": ("str", False, None, None, None, ()),
+}
@@ -0,0 +1,343 @@
+cisco_vpn_interface_validation = {
+    "cisco_vpn_interface": (
+        "dict",
+        False,
+        None,
+        None,
+        None,
+        (
+            "access_list_ipv4",
+            "access_list_ipv6",
+            "all",
+            "arp_timeout",
+            "auto_bandwidth_detect",
+            "autonegotiate",
+            "bandwidth_down",
+            "bandwidth_downstream",
+            "bandwidth_up",
+            "bandwidth_upstream",
+            "bgp",
+            "bind",
+            "block_non_source_ip",
+            "border",
+            "carrier",
+            "clear_dont_fragment",
+            "control_connections",
+            "core_region",
+            "dhcp",
+            "dhcp_distance",
+            "dhcp_helper",
+            "dhcp_helper_v6",
+            "dhcp_ipv4_client",
+            "dhcp_ipv6_client",
+            "dmax",
+            "dmin",
+            "dns",
+            "dst_ip",
+            "duplex",
+            "enable",
+            "enable_core_region",
+            "enable_sgt_authorization_and_forwarding",
+            "enable_sgt_enforcement",
+            "enable_sgt_propagation",
+            "enforcement_sgt",
+            "exclude_controller_group_list",
+            "group",
+            "hello_interval",
+            "hello_tolerance",
+            "https",
+            "icmp",
+            "icmp_redirect_disable",
+            "if_name",
+            "interface_description",
+            "intrf_mtu",
+            "ip",
+            "ip_directed_broadcast",
+            "iperf_server",
+            "ipv4_address",
+            "ipv6_address",
+            "ipv6_vrrp",
+            "last_resort_circuit",
+            "load_interval",
+            "loopback_interface",
+            "low_bandwidth_link",
+            "mac_address",
+            "max_control_connections",
+            "media_type",
+            "mode",
+            "mtu",
+            "nat",
+            "nat64",
+            "nat66",
+            "nat_choice",
+            "nat_range_end",
+            "nat_range_start",
+            "nat_refresh_interval",
+            "netconf",
+            "network_broadcast",
+            "ntp",
+            "ospf",
+            "overload",
+            "per_tunnel_qos",
+            "per_tunnel_qos_aggregator",
+            "period",
+            "poe",
+            "port_hop",
+            "prefix_length",
+            "propagate_sgt",
+            "qos_adaptive",
+            "qos_map",
+            "qos_map_vpn",
+            "restrict",
+            "rule_name",
+            "secondary_ipv4_address",
+            "secondary_ipv6_address",
+            "secondary_region",
+            "security_group_tag",
+            "service_provider",
+            "shaping_rate",
+            "shutdown",
+            "snmp",
+            "speed",
+            "src_ip",
+            "sshd",
+            "static",
+            "static_nat66",
+            "static_port_forward",
+            "stun",
+            "tcp_mss_adjust",
+            "tcp_timeout",
+            "tloc_encapsulation",
+            "tloc_extension",
+            "tracker",
+            "trusted",
+            "tunnel_tcp_mss_adjust",
+            "tunnels_bandwidth",
+            "udp_timeout",
+            "umax",
+            "umin",
+            "value",
+            "vbond_as_stun_server",
+            "vmanage_connection_preference",
+            "vrrp",
+            "xconnect",
+        ),
+    ),
+    "cisco_vpn_interface.access_list_ipv4": ("list", False, None, "dict", None, ("acl_name", "direction")),
+    "cisco_vpn_interface.access_list_ipv4.acl_name": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.access_list_ipv4.direction": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.access_list_ipv6": ("list", False, None, "dict", None, ("acl_name", "direction")),
+    "cisco_vpn_interface.access_list_ipv6.acl_name": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.access_list_ipv6.direction": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.all": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.arp_timeout": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.auto_bandwidth_detect": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.autonegotiate": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.bandwidth_down": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.bandwidth_downstream": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.bandwidth_up": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.bandwidth_upstream": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.bgp": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.bind": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.block_non_source_ip": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.border": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.carrier": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.clear_dont_fragment": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.control_connections": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.core_region": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.dhcp": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.dhcp_distance": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.dhcp_helper": ("list", False, None, "str", None, ()),
+    "cisco_vpn_interface.dhcp_helper_v6": ("list", False, None, "dict", None, ("address", "vpn")),
+    "cisco_vpn_interface.dhcp_helper_v6.address": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.dhcp_helper_v6.vpn": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.dhcp_ipv4_client": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.dhcp_ipv6_client": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.dmax": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.dmin": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.dns": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.dst_ip": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.duplex": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.enable": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.enable_core_region": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.enable_sgt_authorization_and_forwarding": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.enable_sgt_enforcement": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.enable_sgt_propagation": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.enforcement_sgt": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.exclude_controller_group_list": ("list", False, None, "int", None, ()),
+    "cisco_vpn_interface.group": ("list", False, None, "int", None, ()),
+    "cisco_vpn_interface.hello_interval": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.hello_tolerance": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.https": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.icmp": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.icmp_redirect_disable": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.if_name": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.interface_description": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.intrf_mtu": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.ip": ("list", False, None, "dict", None, ("addr", "mac")),
+    "cisco_vpn_interface.ip.addr": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.ip.mac": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.ip_directed_broadcast": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.iperf_server": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.ipv4_address": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.ipv6_address": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.ipv6_vrrp": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("grp_id", "ipv6", "priority", "timer", "track_omp", "track_prefix_list"),
+    ),
+    "cisco_vpn_interface.ipv6_vrrp.grp_id": ("int", True, None, None, None, ()),
+    "cisco_vpn_interface.ipv6_vrrp.ipv6": ("list", False, None, "dict", None, ("ipv6_link_local", "prefix")),
+    "cisco_vpn_interface.ipv6_vrrp.ipv6.ipv6_link_local": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.ipv6_vrrp.ipv6.prefix": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.ipv6_vrrp.priority": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.ipv6_vrrp.timer": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.ipv6_vrrp.track_omp": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.ipv6_vrrp.track_prefix_list": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.last_resort_circuit": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.load_interval": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.loopback_interface": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.low_bandwidth_link": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.mac_address": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.max_control_connections": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.media_type": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.mode": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.mtu": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.nat": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.nat64": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.nat66": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.nat_choice": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.nat_range_end": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.nat_range_start": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.nat_refresh_interval": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.netconf": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.network_broadcast": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.ntp": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.ospf": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.overload": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.per_tunnel_qos": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.per_tunnel_qos_aggregator": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.period": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.poe": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.port_hop": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.prefix_length": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.propagate_sgt": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.qos_adaptive": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.qos_map": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.qos_map_vpn": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.restrict": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.rule_name": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.secondary_ipv4_address": ("list", False, None, "dict", None, ("address",)),
+    "cisco_vpn_interface.secondary_ipv4_address.address": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.secondary_ipv6_address": ("list", False, None, "dict", None, ("address",)),
+    "cisco_vpn_interface.secondary_ipv6_address.address": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.secondary_region": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.security_group_tag": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.service_provider": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.shaping_rate": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.shutdown": ("bool", False, False, None, None, ()),
+    "cisco_vpn_interface.snmp": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.speed": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.src_ip": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.sshd": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.static": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("source_ip", "source_vpn", "static_nat_direction", "translate_ip"),
+    ),
+    "cisco_vpn_interface.static.source_ip": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.static.source_vpn": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.static.static_nat_direction": ("str", False, "inside", None, None, ()),
+    "cisco_vpn_interface.static.translate_ip": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.static_nat66": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("source_prefix", "source_vpn_id", "translated_source_prefix"),
+    ),
+    "cisco_vpn_interface.static_nat66.source_prefix": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.static_nat66.source_vpn_id": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.static_nat66.translated_source_prefix": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.static_port_forward": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("proto", "source_ip", "source_port", "source_vpn", "static_nat_direction", "translate_ip", "translate_port"),
+    ),
+    "cisco_vpn_interface.static_port_forward.proto": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.static_port_forward.source_ip": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.static_port_forward.source_port": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.static_port_forward.source_vpn": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.static_port_forward.static_nat_direction": ("str", False, "inside", None, None, ()),
+    "cisco_vpn_interface.static_port_forward.translate_ip": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.static_port_forward.translate_port": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.stun": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.tcp_mss_adjust": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.tcp_timeout": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.tloc_encapsulation": ("list", False, None, "dict", None, ("encap", "preference", "weight")),
+    "cisco_vpn_interface.tloc_encapsulation.encap": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.tloc_encapsulation.preference": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.tloc_encapsulation.weight": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.tloc_extension": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.tracker": ("list", False, None, "str", None, ()),
+    "cisco_vpn_interface.trusted": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.tunnel_tcp_mss_adjust": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.tunnels_bandwidth": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.udp_timeout": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.umax": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.umin": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.value": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.vbond_as_stun_server": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.vmanage_connection_preference": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.vrrp": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        (
+            "address",
+            "grp_id",
+            "ipv4_secondary",
+            "priority",
+            "timer",
+            "tloc_change_pref",
+            "track_omp",
+            "track_prefix_list",
+            "tracking_object",
+            "value",
+        ),
+    ),
+    "cisco_vpn_interface.vrrp.address": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.vrrp.grp_id": ("int", True, None, None, None, ()),
+    "cisco_vpn_interface.vrrp.ipv4_secondary": ("list", False, None, "dict", None, ("address",)),
+    "cisco_vpn_interface.vrrp.ipv4_secondary.address": ("str", True, None, None, None, ()),
+    "cisco_vpn_interface.vrrp.priority": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.vrrp.timer": ("int", False, None, None, None, ()),
+    "cisco_vpn_interface.vrrp.tloc_change_pref": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.vrrp.track_omp": ("bool", False, None, None, None, ()),
+    "cisco_vpn_interface.vrrp.track_prefix_list": ("str", False, None, None, None, ()),
+    "cisco_vpn_interface.vrrp.tracking_object": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("decrement", "name", "track_action"),
+    ),
+    "cisco_vpn_interface.vrrp.tracking_object.decrement": ("int", True, None, None, None, ()),
+    "cisco_vpn_interface.vrrp.tracking_object.name": ("int", True, None, None, None, ()),
+    "cisco_vpn_interface.vrrp.tracking_object.track_action": ("str", False, "Decrement", None, None, ()),
+    "cisco_vpn_interface.vrrp.value": ("int", True, None, None, None, ()),
+    "cisco_vpn_interface.xconnect": ("str", False, None, None, None, ()),
+}
@@ -0,0 +1,33 @@
+omp_vsmart_validation = {
+    "omp_vsmart": (
+        "dict",
+        False,
+        None,
+        None,
+        None,
+        (
+            "advertisement_interval",
+            "affinity_group_preference",
+            "discard_rejected",
+            "eor_timer",
+            "graceful_restart",
+            "graceful_restart_timer",
+            "holdtime",
+            "send_backup_paths",
+            "send_path_limit",
+            "shutdown",
+            "tloc_color",
+        ),
+    ),
+    "omp_vsmart.advertisement_interval": ("int", False, None, None, None, ()),
+    "omp_vsmart.affinity_group_preference": ("bool", False, False, None, None, ()),
+    "omp_vsmart.discard_rejected": ("bool", False, None, None, None, ()),
+    "omp_vsmart.eor_timer": ("int", False, None, None, None, ()),
+    "omp_vsmart.graceful_restart": ("bool", False, None, None, None, ()),
+    "omp_vsmart.graceful_restart_timer": ("int", False, None, None, None, ()),
+    "omp_vsmart.holdtime": ("int", False, None, None, None, ()),
+    "omp_vsmart.send_backup_paths": ("bool", False, None, None, None, ()),
+    "omp_vsmart.send_path_limit": ("int", False, None, None, None, ()),
+    "omp_vsmart.shutdown": ("bool", False, None, None, None, ()),
+    "omp_vsmart.tloc_color": ("bool", False, False, None, None, ()),
+}
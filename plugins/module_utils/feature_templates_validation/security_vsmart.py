@@ -0,0 +1,5 @@
+security_vsmart_validation = {
+    "security_vsmart": ("dict", False, None, None, None, ("protocol", "tls_port")),
+    "security_vsmart.protocol": ("str", False, None, None, None, ()),
+    "security_vsmart.tls_port": ("int", False, None, None, None, ()),
+}
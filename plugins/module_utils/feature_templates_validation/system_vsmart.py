@@ -0,0 +1,73 @@
+system_vsmart_validation = {
+    "system_vsmart": (
+        "dict",
+        False,
+        None,
+        None,
+        None,
+        (
+            "admin_tech_on_failure",
+            "compatible",
+            "control_session_pps",
+            "controller_group_id",
+            "description",
+            "device_groups",
+            "dns_cache_timeout",
+            "dual_stack_ipv6",
+            "host_name",
+            "idle_timeout",
+            "incompatible",
+            "iptables_enable",
+            "latitude",
+            "location",
+            "longitude",
+            "management_region",
+            "overlay_id",
+            "port_hop",
+            "port_offset",
+            "region_list_id",
+            "site_id",
+            "system_ip",
+            "system_tunnel_mtu",
+            "timezone",
+            "topology",
+            "track_default_gateway",
+            "track_transport",
+        ),
+    ),
+    "system_vsmart.admin_tech_on_failure": ("bool", False, True, None, None, ()),
+    "system_vsmart.compatible": ("list", False, None, "dict", None, ("color_1", "color_2")),
+    "system_vsmart.compatible.color_1": ("str", False, None, None, None, ()),
+    "system_vsmart.compatible.color_2": ("str", False, None, None, None, ()),
+    "system_vsmart.control_session_pps": ("int", False, None, None, None, ()),
+    "system_vsmart.controller_group_id": ("int", False, None, None, None, ()),
+    "system_vsmart.description": ("str", False, None, None, None, ()),
+    "system_vsmart.device_groups": ("list", False, None, "str", None, ()),
+    "system_vsmart.dns_cache_timeout": ("int", False, None, None, None, ()),
+    "system_vsmart.dual_stack_ipv6": ("raw", False, None, None, None, ("name",)),
+    "system_vsmart.dual_stack_ipv6.name": ("str", True, "system_ipv6-strict-control", None, None, ()),
+    "system_vsmart.host_name": ("raw", False, None, None, None, ("name",)),
+    "system_vsmart.host_name.name": ("str", True, "system_host_name", None, None, ()),
+    "system_vsmart.idle_timeout": ("int", False, None, None, None, ()),
+    "system_vsmart.incompatible": ("list", False, None, "dict", None, ("color_1", "color_2")),
+    "system_vsmart.incompatible.color_1": ("str", False, None, None, None, ()),
+    "system_vsmart.incompatible.color_2": ("str", False, None, None, None, ()),
+    "system_vsmart.iptables_enable": ("bool", False, True, None, None, ()),
+    "system_vsmart.latitude": ("int", False, None, None, None, ()),
+    "system_vsmart.location": ("str", False, None, None, None, ()),
+    "system_vsmart.longitude": ("int", False, None, None, None, ()),
+    "system_vsmart.management_region": ("bool", False, None, None, None, ()),
+    "system_vsmart.overlay_id": ("int", False, None, None, None, ()),
+    "system_vsmart.port_hop": ("bool", False, None, None, None, ()),
+    "system_vsmart.port_offset": ("int", False, None, None, None, ()),
+    "system_vsmart.region_list_id": ("int", False, None, None, None, ()),
+    "system_vsmart.site_id": ("raw", False, None, None, None, ("name",)),
+    "system_vsmart.site_id.name": ("str", True, "system_site_id", None, None, ()),
+    "system_vsmart.system_ip": ("raw", False, None, None, None, ("name",)),
+    "system_vsmart.system_ip.name": ("str", True, "system_system_ip", None, None, ()),
+    "system_vsmart.system_tunnel_mtu": ("int", False, None, None, None, ()),
+    "system_vsmart.timezone": ("str", False, "UTC", None, None, ()),
+    "system_vsmart.topology": ("list", False, None, "str", None, ()),
+    "system_vsmart.track_default_gateway": ("bool", False, True, None, None, ()),
+    "system_vsmart.track_transport": ("bool", False, True, None, None, ()),
+}
@@ -0,0 +1,46 @@
+vpn_vsmart_validation = {
+    "vpn_vsmart": ("dict", False, None, None, None, ("dns", "host", "name", "route_v4", "route_v6", "vpn_id")),
+    "vpn_vsmart.dns": ("list", False, None, "dict", None, ("dns_addr", "role")),
+    "vpn_vsmart.dns.dns_addr": ("str", False, None, None, None, ()),
+    "vpn_vsmart.dns.role": ("str", True, None, None, None, ()),
+    "vpn_vsmart.host": ("list", False, None, "dict", None, ("hostname", "ip")),
+    "vpn_vsmart.host.hostname": ("str", True, None, None, None, ()),
+    "vpn_vsmart.host.ip": ("list", True, None, "str", None, ()),
+    "vpn_vsmart.name": ("str", False, None, None, None, ()),
+    "vpn_vsmart.route_v4": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("distance", "next_hop", "null0", "prefix", "route_interface", "vpn"),
+    ),
+    "vpn_vsmart.route_v4.distance": ("int", False, None, None, None, ()),
+    "vpn_vsmart.route_v4.next_hop": ("list", False, None, "dict", None, ("address", "distance")),
+    "vpn_vsmart.route_v4.next_hop.address": ("str", False, None, None, None, ()),
+    "vpn_vsmart.route_v4.next_hop.distance": ("int", False, None, None, None, ()),
+    "vpn_vsmart.route_v4.null0": ("bool", False, None, None, None, ()),
+    "vpn_vsmart.route_v4.prefix": ("str", False, None, None, None, ()),
+    "vpn_vsmart.route_v4.route_interface": ("dict", False, None, None, None, ("interface_name", "interface_next_hop")),
+    "vpn_vsmart.route_v4.route_interface.interface_name": ("str", True, None, None, None, ()),
+    "vpn_vsmart.route_v4.route_interface.interface_next_hop": (
+        "list",
+        False,
+        None,
+        "dict",
+        None,
+        ("address", "distance"),
+    ),
+    "vpn_vsmart.route_v4.route_interface.interface_next_hop.address": ("str", False, None, None, None, ()),
+    "vpn_vsmart.route_v4.route_interface.interface_next_hop.distance": ("int", False, None, None, None, ()),
+    "vpn_vsmart.route_v4.vpn": ("int", False, None, None, None, ()),
+    "vpn_vsmart.route_v6": ("list", False, None, "dict", None, ("distance", "next_hop", "null0", "prefix", "vpn")),
+    "vpn_vsmart.route_v6.distance": ("int", False, None, None, None, ()),
+    "vpn_vsmart.route_v6.next_hop": ("list", False, None, "dict", None, ("address", "distance")),
+    "vpn_vsmart.route_v6.next_hop.address": ("str", True, None, None, None, ()),
+    "vpn_vsmart.route_v6.next_hop.distance": ("int", False, None, None, None, ()),
+    "vpn_vsmart.route_v6.null0": ("bool", False, None, None, None, ()),
+    "vpn_vsmart.route_v6.prefix": ("str", True, None, None, None, ()),
+    "vpn_vsmart.route_v6.vpn": ("int", False, None, None, None, ()),
+    "vpn_vsmart.vpn_id": ("str", True, None, None, None, ()),
+}
@@ -0,0 +1,81 @@
+vpn_vsmart_interface_validation = {
+    "vpn_vsmart_interface": (
+        "dict",
+        False,
+        None,
+        None,
+        None,
+        (
+            "all",
+            "autonegotiate",
+            "carrier",
+            "clear_dont_fragment",
+            "dhcp",
+            "dhcp_distance",
+            "dhcp_ipv4_client",
+            "dhcp_ipv6_client",
+            "dhcp_ipv6_distance",
+            "dhcp_rapid_commit",
+            "dns",
+            "duplex",
+            "flow_control",
+            "group",
+            "hello_interval",
+            "hello_tolerance",
+            "icmp",
+            "if_name",
+            "interface_description",
+            "ip",
+            "ipv4_address",
+            "ipv6_address",
+            "mac_address",
+            "mtu",
+            "nat_refresh_interval",
+            "netconf",
+            "ntp",
+            "pmtu",
+            "shutdown",
+            "speed",
+            "sshd",
+            "stun",
+            "tcp_mss_adjust",
+            "value",
+        ),
+    ),
+    "vpn_vsmart_interface.all": ("bool", False, None, None, None, ()),
+    "vpn_vsmart_interface.autonegotiate": ("bool", False, True, None, None, ()),
+    "vpn_vsmart_interface.carrier": ("str", False, None, None, None, ()),
+    "vpn_vsmart_interface.clear_dont_fragment": ("bool", False, False, None, None, ()),
+    "vpn_vsmart_interface.dhcp": ("bool", False, None, None, None, ()),
+    "vpn_vsmart_interface.dhcp_distance": ("int", False, None, None, None, ()),
+    "vpn_vsmart_interface.dhcp_ipv4_client": ("bool", False, None, None, None, ()),
+    "vpn_vsmart_interface.dhcp_ipv6_client": ("bool", False, None, None, None, ()),
+    "vpn_vsmart_interface.dhcp_ipv6_distance": ("int", False, None, None, None, ()),
+    "vpn_vsmart_interface.dhcp_rapid_commit": ("bool", False, None, None, None, ()),
+    "vpn_vsmart_interface.dns": ("bool", False, None, None, None, ()),
+    "vpn_vsmart_interface.duplex": ("str", False, None, None, None, ()),
+    "vpn_vsmart_interface.flow_control": ("str", False, None, None, None, ()),
+    "vpn_vsmart_interface.group": ("list", False, None, "int", None, ()),
+    "vpn_vsmart_interface.hello_interval": ("int", False, None, None, None, ()),
+    "vpn_vsmart_interface.hello_tolerance": ("int", False, None, None, None, ()),
+    "vpn_vsmart_interface.icmp": ("bool", False, None, None, None, ()),
+    "vpn_vsmart_interface.if_name": ("str", False, None, None, None, ()),
+    "vpn_vsmart_interface.interface_description": ("str", False, None, None, None, ()),
+    "vpn_vsmart_interface.ip": ("list", False, None, "dict", None, ("addr", "mac")),
+    "vpn_vsmart_interface.ip.addr": ("str", True, None, None, None, ()),
+    "vpn_vsmart_interface.ip.mac": ("str", True, None, None, None, ()),
+    "vpn_vsmart_interface.ipv4_address": ("str", False, None, None, None, ()),
+    "vpn_vsmart_interface.ipv6_address": ("str", False, None, None, None, ()),
+    "vpn_vsmart_interface.mac_address": ("str", False, None, None, None, ()),
+    "vpn_vsmart_interface.mtu": ("int", False, None, None, None, ()),
+    "vpn_vsmart_interface.nat_refresh_interval": ("int", False, None, None, None, ()),
+    "vpn_vsmart_interface.netconf": ("bool", False, None, None, None, ()),
+    "vpn_vsmart_interface.ntp": ("bool", False, None, None, None, ()),
+    "vpn_vsmart_interface.pmtu": ("bool", False, False, None, None, ()),
+    "vpn_vsmart_interface.shutdown": ("bool", False, False, None, None, ()),
+    "vpn_vsmart_interface.speed": ("str", False, None, None, None, ()),
+    "vpn_vsmart_interface.sshd": ("bool", False, None, None, None, ()),
+    "vpn_vsmart_interface.stun": ("bool", False, None, None, None, ()),
+    "vpn_vsmart_interface.tcp_mss_adjust": ("int", False, None, None, None, ()),
+    "vpn_vsmart_interface.value": ("str", False, None, None, None, ()),
+}
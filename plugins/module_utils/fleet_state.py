@@ -0,0 +1,235 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from ansible.module_utils.basic import env_fallback
+
+from ..module_utils.vmanage_module import AnsibleCatalystwanModule
+
+# Kinds of records stored by modules
+DEVICES = "devices"
+SOFTWARE = "software"
+TEMPLATES = "templates"
+TEMPLATE_ATTACHMENTS = "template_attachments"
+HEALTH = "health"
+KINDS = [DEVICES, SOFTWARE, TEMPLATES, TEMPLATE_ATTACHMENTS, HEALTH]
+
+# Columns of records table, which can be queried by index instead of reading every record
+INDEXED_FIELDS = ["key", "host_name", "system_ip"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    scope TEXT NOT NULL DEFAULT '',
+    manager TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL,
+    records INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS snapshots_kind ON snapshots (kind, scope, manager, id);
+CREATE TABLE IF NOT EXISTS records (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    host_name TEXT,
+    system_ip TEXT,
+    hash TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (snapshot_id, key)
+);
+CREATE INDEX IF NOT EXISTS records_host_name ON records (snapshot_id, host_name);
+CREATE INDEX IF NOT EXISTS records_system_ip ON records (snapshot_id, system_ip);
+"""
+
+
+def fleet_state_argument_spec() -> Dict:
+    """
+    Arguments of modules that store fetched records in fleet state database.
+    """
+    return dict(
+        fleet_state_db=dict(type="path", default=None, fallback=(env_fallback, ["CATALYSTWAN_FLEET_STATE_DB"])),
+    )
+
+
+def record_hash(data: Any) -> str:
+    return hashlib.sha1(
+        json.dumps(data, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def changed_fields(before: Dict, after: Dict, ignore_fields: Optional[List[str]] = None) -> Dict[str, Dict]:
+    """
+    Top level fields which values differ between two versions of record, except `ignore_fields`.
+    """
+    ignored = set(ignore_fields or [])
+    return {
+        name: dict(before=before.get(name), after=after.get(name))
+        for name in sorted(before.keys() | after.keys())
+        if name not in ignored and before.get(name) != after.get(name)
+    }
+
+
+class FleetStateStore:
+    """SQLite database of fleet state, one snapshot per module run which stored records.
+
+    Every snapshot holds records of one kind (e.g. devices inventory) and scope (e.g. device category),
+    fetched from one Manager. Records are keyed, and hashed, so changes between snapshots are found
+    without comparing records which didn't change.
+
+    Args:
+        path (str): database file path, created with parent directory when missing.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def __enter__(self) -> "FleetStateStore":
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        # Database may be written by modules running in parallel forks, writers wait for each other
+        self._connection = sqlite3.connect(self.path, timeout=30)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(SCHEMA)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self._connection.commit()
+        else:
+            self._connection.rollback()
+        self._connection.close()
+
+    def add_snapshot(self, kind: str, scope: str, manager: str, records: Iterable[Dict], key_field: str) -> Dict:
+        """
+        Store records as new snapshot. Records are JSON-compatible dicts, `key_field` identifies record.
+        """
+        created_at = datetime.now(timezone.utc).isoformat()
+        with self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO snapshots (kind, scope, manager, created_at) VALUES (?, ?, ?, ?)",
+                (kind, scope or "", manager or "", created_at),
+            )
+            snapshot_id = cursor.lastrowid
+            rows = (
+                (
+                    snapshot_id,
+                    str(record[key_field]),
+                    record.get("host_name"),
+                    record.get("system_ip"),
+                    record_hash(record),
+                    json.dumps(record, sort_keys=True, default=str),
+                )
+                for record in records
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO records (snapshot_id, key, host_name, system_ip, hash, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            count = self._connection.execute(
+                "SELECT COUNT(*) FROM records WHERE snapshot_id = ?", (snapshot_id,)
+            ).fetchone()[0]
+            self._connection.execute("UPDATE snapshots SET records = ? WHERE id = ?", (count, snapshot_id))
+        return self.get_snapshot(snapshot_id)
+
+    def get_snapshot(self, snapshot_id: int) -> Optional[Dict]:
+        row = self._connection.execute("SELECT * FROM snapshots WHERE id = ?", (snapshot_id,)).fetchone()
+        return dict(row) if row else None
+
+    def snapshots(
+        self, kind: str, scope: Optional[str] = None, manager: Optional[str] = None, limit: int = 0
+    ) -> List[Dict]:
+        """
+        Snapshots of given kind, latest first. Scope and manager are not filtered when not set.
+        """
+        query = "SELECT * FROM snapshots WHERE kind = ?"
+        params: List[Any] = [kind]
+        if scope is not None:
+            query += " AND scope = ?"
+            params.append(scope)
+        if manager is not None:
+            query += " AND manager = ?"
+            params.append(manager)
+        query += " ORDER BY id DESC"
+        if limit > 0:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self._connection.execute(query, params)]
+
+    def latest_snapshot(self, kind: str, scope: Optional[str] = None, manager: Optional[str] = None) -> Optional[Dict]:
+        snapshots = self.snapshots(kind, scope, manager, limit=1)
+        return snapshots[0] if snapshots else None
+
+    def query(self, snapshot_id: int, filters: Optional[Dict] = None) -> List[Dict]:
+        """
+        Records of snapshot matching all filters. Indexed fields are matched by index,
+        other fields by value of top level field of record. List value matches any of its elements.
+        """
+        query = "SELECT data FROM records WHERE snapshot_id = ?"
+        params: List[Any] = [snapshot_id]
+        for name, expected in (filters or {}).items():
+            values = expected if isinstance(expected, list) else [expected]
+            placeholders = ", ".join("?" * len(values))
+            if name in INDEXED_FIELDS:
+                query += f" AND {name} IN ({placeholders})"
+            else:
+                query += f" AND json_extract(data, ?) IN ({placeholders})"
+                params.append(f'$."{name}"')
+            params.extend(values)
+        query += " ORDER BY key"
+        return [json.loads(row["data"]) for row in self._connection.execute(query, params)]
+
+    def delta(self, before_id: int, after_id: int, ignore_fields: Optional[List[str]] = None) -> Dict[str, List]:
+        """
+        Records added, removed and changed between two snapshots. Only records with different hash are
+        compared field by field, changes of `ignore_fields` alone don't make record changed.
+        """
+        added = self._connection.execute(
+            "SELECT data FROM records a WHERE snapshot_id = ? "
+            "AND NOT EXISTS (SELECT 1 FROM records b WHERE b.snapshot_id = ? AND b.key = a.key) ORDER BY key",
+            (after_id, before_id),
+        )
+        removed = self._connection.execute(
+            "SELECT data FROM records b WHERE snapshot_id = ? "
+            "AND NOT EXISTS (SELECT 1 FROM records a WHERE a.snapshot_id = ? AND a.key = b.key) ORDER BY key",
+            (before_id, after_id),
+        )
+        delta: Dict[str, List] = dict(
+            added=[json.loads(row["data"]) for row in added],
+            removed=[json.loads(row["data"]) for row in removed],
+            changed=[],
+        )
+        modified = self._connection.execute(
+            "SELECT b.key, a.host_name, b.data AS before, a.data AS after FROM records b "
+            "JOIN records a ON a.snapshot_id = ? AND a.key = b.key "
+            "WHERE b.snapshot_id = ? AND a.hash != b.hash ORDER BY b.key",
+            (after_id, before_id),
+        )
+        for row in modified:
+            changes = changed_fields(json.loads(row["before"]), json.loads(row["after"]), ignore_fields)
+            if changes:
+                delta["changed"].append(dict(key=row["key"], host_name=row["host_name"], changes=changes))
+        return delta
+
+
+def store_fleet_state(
+    module: AnsibleCatalystwanModule, kind: str, records: Iterable[Dict], key_field: str, scope: str = ""
+) -> Dict:
+    """
+    Store records fetched by module as new snapshot in module's `fleet_state_db`.
+    Returns stored snapshot, with its ID used by C(cisco.catalystwan.fleet_state_info) queries.
+    """
+    path = module.params["fleet_state_db"]
+    try:
+        with FleetStateStore(path) as store:
+            snapshot = store.add_snapshot(kind, scope, module.params["manager_credentials"]["url"], records, key_field)
+    except (OSError, sqlite3.Error) as ex:
+        module.fail_json(msg=f"Cannot store fleet state in database: {path}, exception: {ex}")
+    return dict(path=path, **snapshot)
@@ -0,0 +1,164 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import json
+import math
+import re
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+UUID_PATTERN = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+IPV4_PATTERN = re.compile(r"^\d{1,3}(\.\d{1,3}){3}$")
+THROTTLED_STATUS_CODES = (429, 503)
+
+
+def percentile(values: List[float], rank: float) -> float:
+    """
+    Nearest-rank percentile, good enough for the small samples collected during single module run.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(int(math.ceil(rank / 100.0 * len(ordered))) - 1, 0)
+    return ordered[index]
+
+
+def normalize_endpoint(method: str, url: str) -> str:
+    """
+    Group requests by endpoint, not by exact URL. Query string is dropped and
+    path segments with identifiers (uuids, task ids, ip addresses, numbers) are replaced with placeholders.
+    """
+    path = UUID_PATTERN.sub("{id}", urlsplit(url).path)
+    segments = []
+    for segment in path.split("/"):
+        if segment.isdigit():
+            segment = "{id}"
+        elif IPV4_PATTERN.match(segment):
+            segment = "{ip}"
+        segments.append(segment)
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+class CallStats:
+    def __init__(self) -> None:
+        self.durations: List[float] = []
+        self.request_bytes: int = 0
+        self.response_bytes: int = 0
+        self.failures: int = 0
+
+    def add(self, duration: float, request_bytes: int = 0, response_bytes: int = 0, failed: bool = False) -> None:
+        self.durations.append(duration)
+        self.request_bytes += request_bytes
+        self.response_bytes += response_bytes
+        if failed:
+            self.failures += 1
+
+    def summary(self) -> Dict:
+        return dict(
+            count=len(self.durations),
+            failures=self.failures,
+            total_seconds=round(sum(self.durations), 4),
+            p50_seconds=round(percentile(self.durations, 50), 4),
+            p95_seconds=round(percentile(self.durations, 95), 4),
+            max_seconds=round(max(self.durations, default=0.0), 4),
+            request_bytes=self.request_bytes,
+            response_bytes=self.response_bytes,
+        )
+
+
+class ApiMetrics:
+    """Collects timing of all Manager calls made by single module invocation.
+
+    Three layers are measured, so it's possible to tell where time of slow task is spent:
+        * endpoints - every HTTP request sent by catalystwan session (Manager-side latency),
+        * operations - calls done via AnsibleCatalystwanModule wrappers (latency + model parsing),
+        * logins and task polling.
+    """
+
+    def __init__(self, module_name: str) -> None:
+        self.module_name = module_name
+        self.started = time.monotonic()
+        self.endpoints: Dict[str, CallStats] = {}
+        self.operations: Dict[str, CallStats] = {}
+        self.logins = CallStats()
+        self.login_retries: int = 0
+        self.task_waits = CallStats()
+        self.throttled_responses: int = 0
+
+    def response_hook(self, response, *args, **kwargs):
+        """
+        requests' response hook, registered on ManagerSession, executed for every response received.
+        """
+        request = response.request
+        request_body = request.body or b""
+        response_bytes = int(response.headers.get("Content-Length", 0) or 0)
+        if not response_bytes and not kwargs.get("stream"):
+            response_bytes = len(response.content or b"")
+        if response.status_code in THROTTLED_STATUS_CODES:
+            self.throttled_responses += 1
+
+        endpoint = normalize_endpoint(request.method, request.url)
+        self.endpoints.setdefault(endpoint, CallStats()).add(
+            response.elapsed.total_seconds(),
+            request_bytes=len(request_body),
+            response_bytes=response_bytes,
+            failed=response.status_code >= 400,
+        )
+        return response
+
+    @contextmanager
+    def measure_operation(self, name: str):
+        start = time.monotonic()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            self.operations.setdefault(name, CallStats()).add(time.monotonic() - start, failed=failed)
+
+    @contextmanager
+    def measure_login(self):
+        start = time.monotonic()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            self.logins.add(time.monotonic() - start, failed=failed)
+            if failed:
+                self.login_retries += 1
+
+    @contextmanager
+    def measure_task_wait(self):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.task_waits.add(time.monotonic() - start)
+
+    def summary(self) -> Dict:
+        endpoints = {name: stats.summary() for name, stats in sorted(self.endpoints.items())}
+        return dict(
+            module=self.module_name,
+            elapsed_seconds=round(time.monotonic() - self.started, 4),
+            logins=len(self.logins.durations),
+            login_retries=self.login_retries,
+            login_seconds=round(sum(self.logins.durations), 4),
+            requests_total=sum(stats["count"] for stats in endpoints.values()),
+            requests_seconds=round(sum(stats["total_seconds"] for stats in endpoints.values()), 4),
+            request_bytes=sum(stats["request_bytes"] for stats in endpoints.values()),
+            response_bytes=sum(stats["response_bytes"] for stats in endpoints.values()),
+            throttled_responses=self.throttled_responses,
+            task_waits=len(self.task_waits.durations),
+            task_wait_seconds=round(sum(self.task_waits.durations), 4),
+            endpoints=endpoints,
+            operations={name: stats.summary() for name, stats in sorted(self.operations.items())},
+        )
+
+    def write_jsonl(self, path: str, summary: Optional[Dict] = None) -> None:
+        record = dict(timestamp=datetime.now(timezone.utc).isoformat(), **(summary or self.summary()))
+        with open(path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
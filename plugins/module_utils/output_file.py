@@ -0,0 +1,142 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from typing import IO, Any, Dict, Iterable, List, Optional
+
+from ..module_utils.projection import project_record
+from ..module_utils.vmanage_module import AnsibleCatalystwanModule
+
+CHUNK_SIZE = 64 * 1024
+
+
+def output_file_argument_spec() -> Dict:
+    """
+    Arguments of info modules that write records to file instead of returning them in module result.
+    """
+    return dict(
+        output_file=dict(type="path", default=None),
+        output_compress=dict(type="bool", default=False),
+    )
+
+
+def file_checksum(path: str) -> str:
+    """
+    SHA1 of file content, same algorithm as `checksum` returned by ansible.builtin.stat and copy modules.
+    """
+    digest = hashlib.sha1()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class JsonLinesWriter:
+    """Writes records as JSON Lines, one record at a time, so memory usage doesn't depend on number of records.
+
+    Records are written to temporary file in the destination directory, which replaces
+    destination file only when all records were written. In append mode records are appended
+    directly to the destination file (gzip members are appended, concatenated members are valid gzip file).
+    Compressed with gzip when `compress` is set or path ends with `.gz`.
+
+    Args:
+        path (str): destination file path.
+        compress (bool): gzip output.
+        append (bool): append to existing file instead of replacing it.
+    """
+
+    def __init__(self, path: str, compress: bool = False, append: bool = False) -> None:
+        self.path = path
+        self.compress = compress or path.endswith(".gz")
+        self.append = append
+        self.records = 0
+        self._tmp_path: Optional[str] = None
+        self._raw: Optional[IO] = None
+        self._file: Optional[IO] = None
+
+    def __enter__(self) -> "JsonLinesWriter":
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        if self.append:
+            self._raw = open(self.path, "ab")
+        else:
+            fd, self._tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+            self._raw = os.fdopen(fd, "wb")
+        self._file = gzip.GzipFile(fileobj=self._raw, mode="wb") if self.compress else self._raw
+        return self
+
+    def write(self, record: Any) -> None:
+        self._file.write(json.dumps(record, separators=(",", ":"), default=str).encode("utf-8") + b"\n")
+        self.records += 1
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._file is not self._raw:
+            self._file.close()
+        self._raw.close()
+        if self.append:
+            return
+        if exc_type is not None:
+            os.unlink(self._tmp_path)
+            return
+        # mkstemp creates file readable only by owner, apply permissions regular open() would
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(self._tmp_path, 0o666 & ~umask)
+        os.replace(self._tmp_path, self.path)
+
+    def summary(self) -> Dict:
+        return dict(path=self.path, records=self.records, checksum=file_checksum(self.path), compressed=self.compress)
+
+
+def rotate_file(path: str, max_bytes: int, backups: int) -> bool:
+    """
+    Rotate file when it reaches `max_bytes`: `path` becomes `path.1`, `path.1` becomes `path.2` and so on,
+    up to `backups` files. Returns True when file was rotated.
+    """
+    if not os.path.exists(path) or os.path.getsize(path) < max_bytes:
+        return False
+    if backups < 1:
+        os.unlink(path)
+        return True
+    for index in range(backups - 1, 0, -1):
+        if os.path.exists(f"{path}.{index}"):
+            os.replace(f"{path}.{index}", f"{path}.{index + 1}")
+    os.replace(path, f"{path}.1")
+    return True
+
+
+def write_records(
+    path: str,
+    records: Iterable[Any],
+    fields: Optional[List[str]] = None,
+    exclude_fields: Optional[List[str]] = None,
+    compress: bool = False,
+) -> Dict:
+    """
+    Write records as JSON Lines with only requested fields. Returns path, number of records and checksum.
+    """
+    with JsonLinesWriter(path, compress) as writer:
+        for record in records:
+            writer.write(project_record(record, fields, exclude_fields))
+    return writer.summary()
+
+
+def write_output_file(module: AnsibleCatalystwanModule, records: Iterable[Any]) -> Dict:
+    """
+    Write records to module's `output_file`, honoring `fields` and `exclude_fields` options.
+    """
+    path = module.params["output_file"]
+    try:
+        return write_records(
+            path,
+            records,
+            fields=module.params.get("fields"),
+            exclude_fields=module.params.get("exclude_fields"),
+            compress=module.params.get("output_compress"),
+        )
+    except OSError as ex:
+        module.fail_json(msg=f"Cannot write records to file: {path}, exception: {ex}")
@@ -0,0 +1,65 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from pydantic import BaseModel
+
+
+def projection_argument_spec() -> Dict:
+    """
+    Arguments of info modules that limit which fields of every record are returned.
+    """
+    return dict(
+        fields=dict(type="list", elements="str", default=None),
+        exclude_fields=dict(type="list", elements="str", default=None),
+    )
+
+
+def _model_field_names(model: BaseModel, names: Optional[List[str]]) -> Optional[Set[str]]:
+    """
+    Translate requested names to model field names. Both field names and aliases
+    (e.g. `host_name` and `host-name`) are accepted, unknown names are ignored.
+    """
+    if names is None:
+        return None
+    field_names = set()
+    for field_name, field_info in type(model).model_fields.items():
+        aliases = {field_name, field_info.alias, field_info.serialization_alias}
+        if isinstance(field_info.validation_alias, str):
+            aliases.add(field_info.validation_alias)
+        if aliases.intersection(names):
+            field_names.add(field_name)
+    return field_names
+
+
+def project_record(record: Any, fields: Optional[List[str]] = None, exclude_fields: Optional[List[str]] = None) -> Any:
+    """
+    Dump single record to JSON-compatible dict with only requested fields.
+
+    Pydantic models are dumped with `include`/`exclude`, so fields that are not requested are never serialized.
+    Dicts (e.g. already converted attrs dataclasses) are filtered by keys.
+    """
+    if isinstance(record, BaseModel):
+        return record.model_dump(
+            mode="json",
+            include=_model_field_names(record, fields),
+            exclude=_model_field_names(record, exclude_fields),
+        )
+    if isinstance(record, dict):
+        return {
+            key: value
+            for key, value in record.items()
+            if (fields is None or key in fields) and (exclude_fields is None or key not in exclude_fields)
+        }
+    return record
+
+
+def project_records(
+    records: Iterable[Any], fields: Optional[List[str]] = None, exclude_fields: Optional[List[str]] = None
+) -> List[Any]:
+    """
+    Dump list of records with only requested fields. When no projection is requested,
+    every record is dumped as a whole, same as `model_dump(mode="json")`.
+    """
+    return [project_record(record, fields, exclude_fields) for record in records]
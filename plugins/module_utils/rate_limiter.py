@@ -0,0 +1,156 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+from ..module_utils.shared_state import locked_json_state, shared_state_file
+
+THROTTLED_STATUS_CODES = (429, 503)
+MAX_BACKOFF_SECONDS = 60.0
+RATE_DECREASE_FACTOR = 0.5
+RATE_INCREASE_FACTOR = 0.05
+MIN_RATE_FACTOR = 0.05
+
+
+def default_state_file(manager_url: str, state_dir: Optional[str] = None) -> str:
+    return shared_state_file("catalystwan_rate_limit", manager_url, state_dir)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After header can be either number of seconds or HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class SharedRateLimiter:
+    """Token bucket rate limiter with state shared by all module processes on the controller.
+
+    State of the bucket is kept in JSON file guarded by exclusive file lock, so every fork
+    running a module against the same Manager draws tokens from the same bucket.
+
+    Rate is adaptive (AIMD): every throttled response (429/503) halves current rate and blocks
+    all processes for `Retry-After` seconds (or exponential backoff when header is missing),
+    every successful response increases rate back towards configured `rate`. Successful responses
+    are only counted in process and applied to shared state on next `acquire`, so they don't take the lock.
+
+    Args:
+        state_file (str): path to shared state file.
+        rate (float): maximum number of requests per second.
+        burst (int, optional): bucket capacity. Defaults to rate (at least 1).
+        max_retries (int, optional): how many times throttled request is retried. Defaults to 5.
+    """
+
+    def __init__(self, state_file: str, rate: float, burst: Optional[int] = None, max_retries: int = 5) -> None:
+        self.state_file = state_file
+        self.max_rate = float(rate)
+        self.min_rate = self.max_rate * MIN_RATE_FACTOR
+        self.burst = float(burst or max(int(rate), 1))
+        self.max_retries = max_retries
+        self.waited_seconds = 0.0
+        self.throttled = 0
+        self.pending_successes = 0
+
+    @contextmanager
+    def _locked_state(self):
+        with locked_json_state(self.state_file) as state:
+            state.setdefault("tokens", self.burst)
+            state.setdefault("updated", time.time())
+            state.setdefault("rate", self.max_rate)
+            state.setdefault("blocked_until", 0.0)
+            state.setdefault("consecutive_throttles", 0)
+            # configuration could change between runs, never exceed current limits
+            state["rate"] = min(state["rate"], self.max_rate)
+            state["tokens"] = min(state["tokens"], self.burst)
+            yield state
+
+    def acquire(self) -> float:
+        """
+        Block until token is available. Returns number of seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._locked_state() as state:
+                self._apply_successes(state)
+                now = time.time()
+                if state["blocked_until"] > now:
+                    wait = state["blocked_until"] - now
+                else:
+                    state["tokens"] = min(self.burst, state["tokens"] + (now - state["updated"]) * state["rate"])
+                    state["updated"] = now
+                    if state["tokens"] >= 1:
+                        state["tokens"] -= 1
+                        self.waited_seconds += waited
+                        return waited
+                    wait = (1 - state["tokens"]) / state["rate"]
+            time.sleep(wait)
+            waited += wait
+
+    def _apply_successes(self, state: dict) -> None:
+        if not self.pending_successes:
+            return
+        state["consecutive_throttles"] = 0
+        state["rate"] = min(
+            self.max_rate, state["rate"] + self.max_rate * RATE_INCREASE_FACTOR * self.pending_successes
+        )
+        self.pending_successes = 0
+
+    def on_success(self) -> None:
+        self.pending_successes += 1
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        self.throttled += 1
+        # Throttling outweighs successes not yet applied to shared state
+        self.pending_successes = 0
+        with self._locked_state() as state:
+            state["consecutive_throttles"] += 1
+            state["rate"] = max(self.min_rate, state["rate"] * RATE_DECREASE_FACTOR)
+            if retry_after is None:
+                retry_after = min(MAX_BACKOFF_SECONDS, 2.0 ** (state["consecutive_throttles"] - 1))
+            state["blocked_until"] = max(state["blocked_until"], time.time() + retry_after)
+            state["tokens"] = 0.0
+
+    def wrap(self, request_func: Callable) -> Callable:
+        """
+        Wrap `request` method of requests' Session. Every request takes token from the bucket,
+        throttled requests are retried after backoff shared with other processes.
+        """
+
+        def request(method, url, *args, **kwargs):
+            retries = 0
+            while True:
+                self.acquire()
+                try:
+                    response = request_func(method, url, *args, **kwargs)
+                except Exception as ex:
+                    response = getattr(ex, "response", None)
+                    status_code = getattr(response, "status_code", None)
+                    if status_code in THROTTLED_STATUS_CODES and retries < self.max_retries:
+                        retries += 1
+                        self.on_throttled(parse_retry_after(response.headers.get("Retry-After")))
+                        continue
+                    raise
+                if response.status_code in THROTTLED_STATUS_CODES and retries < self.max_retries:
+                    retries += 1
+                    self.on_throttled(parse_retry_after(response.headers.get("Retry-After")))
+                    continue
+                self.on_success()
+                return response
+
+        return request
@@ -0,0 +1,44 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+
+def shared_state_file(prefix: str, manager_url: str, state_dir: Optional[str] = None) -> str:
+    """
+    Path of state file shared by all module processes on the controller.
+    One file per Manager, so state for different Managers is independent.
+    """
+    digest = hashlib.sha1(manager_url.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(state_dir or tempfile.gettempdir(), f"{prefix}_{digest}.json")
+
+
+@contextmanager
+def locked_json_state(path: str) -> Iterator[Dict]:
+    """
+    Load JSON state from file under exclusive lock and write it back when context exits.
+    Missing or corrupted file is treated as empty state.
+    """
+    with open(path, "a+", encoding="utf-8") as file:
+        fcntl.flock(file, fcntl.LOCK_EX)
+        try:
+            file.seek(0)
+            try:
+                state = json.loads(file.read() or "{}")
+            except ValueError:
+                state = {}
+
+            yield state
+
+            file.seek(0)
+            file.truncate()
+            file.write(json.dumps(state))
+            file.flush()
+        finally:
+            fcntl.flock(file, fcntl.LOCK_UN)
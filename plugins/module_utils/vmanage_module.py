@@ -3,33 +3,67 @@
 
 
 import logging
-import time
 import traceback
-from typing import Any, Callable, Dict, Protocol, TypeVar
+from contextlib import contextmanager
+from importlib.util import find_spec
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Protocol, TypeVar
 
 import urllib3
 from ansible.module_utils.basic import AnsibleModule, env_fallback, missing_required_lib
 from urllib3.exceptions import NewConnectionError, TimeoutError
 
+from ..module_utils.circuit_breaker import SharedCircuitBreaker
+from ..module_utils.circuit_breaker import default_state_file as default_circuit_breaker_state_file
+from ..module_utils.concurrency import serialize_login
 from ..module_utils.logger_config import configure_logger
+from ..module_utils.metrics import ApiMetrics
+from ..module_utils.rate_limiter import SharedRateLimiter
+from ..module_utils.rate_limiter import default_state_file as default_rate_limiter_state_file
 from ..module_utils.result import ModuleResult
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
+if TYPE_CHECKING:
+    from catalystwan.session import ManagerSession
+
+# Importing catalystwan (and all pydantic models it defines) takes significant part of short module run,
+# so it's only checked that library is installed here and it's imported on first use of Manager session.
 # Suggested by
 # https://docs.ansible.com/ansible/latest/dev_guide/developing_modules_best_practices.html#importing-and-using-shared-code
 LIB_IMP_ERR = None
-try:
-    from catalystwan.api.task_status_api import Task
-    from catalystwan.session import ManagerHTTPError, ManagerRequestException, ManagerSession, create_manager_session
-    from catalystwan.typed_list import DataSequence
-    from catalystwan.vmanage_auth import UnauthorizedAccessError
+HAS_LIB = find_spec("catalystwan") is not None
+
+_catalystwan: Optional[SimpleNamespace] = None
 
-    HAS_LIB = True
-except:  # noqa: E722
-    HAS_LIB = False
-    LIB_IMP_ERR = traceback.format_exc()
+
+def import_catalystwan() -> SimpleNamespace:
+    """
+    Import catalystwan objects used by AnsibleCatalystwanModule once, on first use.
+    """
+    global _catalystwan
+    if _catalystwan is None:
+        from catalystwan.api.task_status_api import Task
+        from catalystwan.session import (
+            ManagerHTTPError,
+            ManagerRequestException,
+            ManagerSession,
+            create_manager_session,
+        )
+        from catalystwan.typed_list import DataSequence
+        from catalystwan.vmanage_auth import UnauthorizedAccessError
+
+        _catalystwan = SimpleNamespace(
+            Task=Task,
+            ManagerHTTPError=ManagerHTTPError,
+            ManagerRequestException=ManagerRequestException,
+            ManagerSession=ManagerSession,
+            create_manager_session=create_manager_session,
+            DataSequence=DataSequence,
+            UnauthorizedAccessError=UnauthorizedAccessError,
+        )
+    return _catalystwan
 
 
 ReturnType = TypeVar("ReturnType")
@@ -46,6 +80,9 @@ class AnsibleCatalystwanModule:
     Args:
         argument_spec (dict): Dictionary containing arguments specific to the module.
         supports_check_mode (bool, optional): Check mode of module. Defaults to False.
+        session_reconnect_retries (int, optional): How many times to retry session establishment. Defaults to 0.
+        session_reconnect_backoff (float, optional): Base of exponential backoff between retries. Defaults to 1.0.
+        session_reconnect_max_backoff (float, optional): Maximum backoff between retries. Defaults to 30.0.
 
     Note: supports_check_mode is currently not supported for AnsibleCatalystwanModule
 
@@ -62,14 +99,33 @@ class AnsibleCatalystwanModule:
                 password=dict(type="str", required=True, fallback=(env_fallback, ["VMANAGE_PASSWORD"]), no_log=True),
                 port=dict(type="str", required=False, fallback=(env_fallback, ["VMANAGE_PORT"])),
             ),
-        )
+        ),
+        collect_metrics=dict(
+            type="bool", required=False, default=False, fallback=(env_fallback, ["CATALYSTWAN_COLLECT_METRICS"])
+        ),
+        metrics_file=dict(type="path", required=False, fallback=(env_fallback, ["CATALYSTWAN_METRICS_FILE"])),
+        rate_limit=dict(type="float", required=False, fallback=(env_fallback, ["CATALYSTWAN_RATE_LIMIT"])),
+        rate_limit_burst=dict(type="int", required=False, fallback=(env_fallback, ["CATALYSTWAN_RATE_LIMIT_BURST"])),
+        rate_limit_state_dir=dict(
+            type="path", required=False, fallback=(env_fallback, ["CATALYSTWAN_RATE_LIMIT_STATE_DIR"])
+        ),
     )
 
-    def __init__(self, argument_spec=None, supports_check_mode=False, session_reconnect_retries=0, **kwargs):
+    def __init__(
+        self,
+        argument_spec=None,
+        supports_check_mode=False,
+        session_reconnect_retries=0,
+        session_reconnect_backoff=1.0,
+        session_reconnect_max_backoff=30.0,
+        **kwargs,
+    ):
         self.argument_spec = argument_spec
         if self.argument_spec is None:
             self.argument_spec = dict()
         self.session_reconnect_retries = session_reconnect_retries
+        self.session_reconnect_backoff = session_reconnect_backoff
+        self.session_reconnect_max_backoff = session_reconnect_max_backoff
 
         self.argument_spec.update(self.common_args)
         self.module = AnsibleModule(argument_spec=self.argument_spec, supports_check_mode=supports_check_mode, **kwargs)
@@ -80,11 +136,45 @@ class AnsibleCatalystwanModule:
             self.module.fail_json(msg=missing_required_lib("catalystwan"), exception=LIB_IMP_ERR)
 
         self._session = None
+        self.circuit_breaker = None
+
+        self.metrics = None
+        if self.params.get("collect_metrics") or self.params.get("metrics_file"):
+            self.metrics = ApiMetrics(module_name=self.module._name)
+
+        self.rate_limiter = None
+        if self.params.get("rate_limit"):
+            self.rate_limiter = SharedRateLimiter(
+                state_file=default_rate_limiter_state_file(
+                    self.params["manager_credentials"]["url"], self.params.get("rate_limit_state_dir")
+                ),
+                rate=self.params["rate_limit"],
+                burst=self.params.get("rate_limit_burst"),
+            )
+
+    def _report_metrics(self, result: Dict) -> None:
+        if self.metrics is None:
+            return
+        summary = self.metrics.summary()
+        if self.rate_limiter is not None:
+            summary["rate_limit_wait_seconds"] = round(self.rate_limiter.waited_seconds, 4)
+            summary["rate_limit_throttled"] = self.rate_limiter.throttled
+        if self.circuit_breaker is not None:
+            summary["session_backoff_seconds"] = round(self.circuit_breaker.waited_seconds, 4)
+        if self.params.get("collect_metrics"):
+            result["metrics"] = summary
+        if self.params.get("metrics_file"):
+            try:
+                self.metrics.write_jsonl(self.params["metrics_file"], summary)
+            except OSError as ex:
+                self.module.warn(f"Cannot write metrics to file: {self.params['metrics_file']}, exception: {ex}")
 
     def exit_json(self, **kwargs):
+        self._report_metrics(kwargs)
         self.module.exit_json(**kwargs)
 
     def fail_json(self, msg: str, **kwargs):
+        self._report_metrics(kwargs)
         self.module.fail_json(msg, **kwargs)
 
     @property
@@ -113,32 +203,67 @@ class AnsibleCatalystwanModule:
             return repr(exception)
 
     @property
-    def session(self) -> ManagerSession:
+    def catalystwan(self) -> SimpleNamespace:
+        try:
+            return import_catalystwan()
+        except ImportError:
+            self.module.fail_json(msg=missing_required_lib("catalystwan"), exception=traceback.format_exc())
+
+    @property
+    def session(self) -> "ManagerSession":
         if self._session is None:
+            catalystwan = self.catalystwan
             reconnect_times = self.session_reconnect_retries
             manager_url = self.module.params["manager_credentials"]["url"]
+            # With retries enabled, Manager unavailability is shared between all processes on the controller,
+            # so concurrent tasks wait for circuit breaker instead of retrying in lockstep.
+            if reconnect_times and self.circuit_breaker is None:
+                self.circuit_breaker = SharedCircuitBreaker(
+                    state_file=default_circuit_breaker_state_file(manager_url),
+                    base=self.session_reconnect_backoff,
+                    max_backoff=self.session_reconnect_max_backoff,
+                )
+            circuit_breaker = self.circuit_breaker
             while True:
                 try:
-                    self._session = create_manager_session(
-                        url=manager_url,
-                        username=self.module.params["manager_credentials"]["username"],
-                        password=self.module.params["manager_credentials"]["password"],
-                        port=self.module.params["manager_credentials"]["port"],
-                        logger=self._vmanage_logger,
-                    )
+                    if circuit_breaker is not None:
+                        circuit_breaker.before_attempt()
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.acquire()
+                    with self.measure_login():
+                        self._session = catalystwan.create_manager_session(
+                            url=manager_url,
+                            username=self.module.params["manager_credentials"]["username"],
+                            password=self.module.params["manager_credentials"]["password"],
+                            port=self.module.params["manager_credentials"]["port"],
+                            logger=self._vmanage_logger,
+                        )
+                    if self.metrics is not None:
+                        self._session.hooks["response"].append(self.metrics.response_hook)
+                    if self.rate_limiter is not None:
+                        self._session.request = self.rate_limiter.wrap(self._session.request)
+                    # Modules share session between `run_concurrently` threads, which may log in again
+                    serialize_login(self._session)
+                    if circuit_breaker is not None:
+                        circuit_breaker.record_success()
                     break
                 # Avoid catchall exceptions, they are not very useful unless the underlying API
                 # gives very good error messages pertaining the attempted action.
                 except (
                     NewConnectionError,
                     ConnectionError,
-                    ManagerRequestException,
+                    catalystwan.ManagerRequestException,
                     TimeoutError,
-                    UnauthorizedAccessError,
+                    catalystwan.UnauthorizedAccessError,
                 ) as exception:
+                    if circuit_breaker is not None:
+                        backoff = circuit_breaker.record_failure()
+                        self.logger.warning(
+                            f"Cannot establish session with Manager: {manager_url}, "
+                            f"retries left: {reconnect_times}, backing off for {backoff:.1f}s"
+                        )
                     if reconnect_times:
                         reconnect_times = reconnect_times - 1
-                        time.sleep(1)
                         continue
                     else:
                         self.module.fail_json(
@@ -152,6 +277,30 @@ class AnsibleCatalystwanModule:
 
         return self._session
 
+    @contextmanager
+    def measure_login(self):
+        if self.metrics is None:
+            yield
+        else:
+            with self.metrics.measure_login():
+                yield
+
+    @contextmanager
+    def measure_operation(self, name: str):
+        if self.metrics is None:
+            yield
+        else:
+            with self.metrics.measure_operation(name):
+                yield
+
+    @contextmanager
+    def measure_task_wait(self):
+        if self.metrics is None:
+            yield
+        else:
+            with self.metrics.measure_task_wait():
+                yield
+
     def get_response_safely(self, get_data_func: GetDataFunc[ReturnType], **kwargs: Any) -> ReturnType:
         """
         Wrapper around get endpoints, that handles ManagerHTTPError exceptions.
@@ -159,11 +308,13 @@ class AnsibleCatalystwanModule:
         Used to simplify getting safe data for manager, that is not intented to be returned directly to user, but
         that will be used internally for verification of state or for operations.
         """
+        catalystwan = self.catalystwan
         try:
-            data = get_data_func(**kwargs)
+            with self.measure_operation(f"get_response_safely:{getattr(get_data_func, '__name__', get_data_func)}"):
+                data = get_data_func(**kwargs)
             return data
 
-        except ManagerHTTPError as ex:
+        except catalystwan.ManagerHTTPError as ex:
             self.fail_json(
                 msg=f"Could not call '{get_data_func}' endpoint.\nManager error: {ex.info}",
                 exception=traceback.format_exc(),
@@ -181,11 +332,13 @@ class AnsibleCatalystwanModule:
         """
         Simplify process of sending requests to Manager safely. Handle all kind of requests.
         """
+        catalystwan = self.catalystwan
         try:
-            response = send_func(**kwargs)
+            with self.measure_operation(f"send_request_safely:{action_name}"):
+                response = send_func(**kwargs)
 
             if response_key and response is not None:
-                if isinstance(response, DataSequence) and len(response):
+                if isinstance(response, catalystwan.DataSequence) and len(response):
                     try:
                         result.response[f"{response_key}"] = [element.model_dump(mode="json") for element in response]
                     except AttributeError:  # handle pydantic v1 models
@@ -194,7 +347,7 @@ class AnsibleCatalystwanModule:
                     result.response[f"{response_key}"] = response
             result.changed = True
 
-        except ManagerHTTPError as ex:
+        except catalystwan.ManagerHTTPError as ex:
             if fail_on_exception:
                 self.fail_json(
                     msg=f"Could not perform '{action_name}' action.\nManager error: {ex.info}",
@@ -214,17 +367,20 @@ class AnsibleCatalystwanModule:
         """
         Simplify process of sending requests to Manager, that are considered as tasks (return task id).
         """
+        catalystwan = self.catalystwan
         try:
-            if payload is None:
-                response = send_func()
-            else:
-                response = send_func(payload=payload)
+            with self.measure_operation(f"execute_action_safely:{action_name}"):
+                if payload is None:
+                    response = send_func()
+                else:
+                    response = send_func(payload=payload)
 
             task_id = response.process_id if hasattr(response, "process_id") else response.id
-            task = Task(self.session, task_id)
+            task = catalystwan.Task(self.session, task_id)
 
             if wait_for_completed:
-                task_result = task.wait_for_completed()
+                with self.measure_task_wait():
+                    task_result = task.wait_for_completed()
 
                 if task_result.result:
                     result.changed = True
@@ -239,7 +395,7 @@ class AnsibleCatalystwanModule:
                 result.changed = True
                 result.response = f"Action '{action_name}' started, skipping waiting for task result"
 
-        except ManagerHTTPError as ex:
+        except catalystwan.ManagerHTTPError as ex:
             self.fail_json(
                 msg=f"Could not perform '{action_name}' action.\nManager error: {str(ex)} {ex.info}",
                 exception=traceback.format_exc(),
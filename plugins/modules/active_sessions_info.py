@@ -42,8 +42,44 @@ options:
           - Port number to use for connecting to vManage.
         required: false
         type: str
+  collect_metrics:
+    description:
+      - Collect timing of all Manager calls performed by the module (logins, endpoints, task polling)
+        and return them as C(metrics) in module result.
+      - Per-endpoint counts, p50/p95 latency, failures and payload sizes are reported.
+    required: false
+    type: bool
+    default: false
+  metrics_file:
+    description:
+      - Path to a file where collected metrics will be appended as a single JSON line per module invocation.
+      - Setting this option enables metrics collection even if C(collect_metrics) is false.
+    required: false
+    type: path
+  rate_limit:
+    description:
+      - Maximum number of requests per second sent to Manager, shared by all module processes running
+        on the controller against the same Manager (e.g. tasks executed with high number of forks).
+      - Throttled responses (429/503) are retried after C(Retry-After) or exponential backoff and
+        temporarily lower the rate for all processes.
+      - When not set, requests are not rate limited.
+    required: false
+    type: float
+  rate_limit_burst:
+    description:
+      - Number of requests that can be sent at once before rate limit applies. Defaults to C(rate_limit).
+    required: false
+    type: int
+  rate_limit_state_dir:
+    description:
+      - Directory for rate limiter state file shared between processes. Defaults to system temporary directory.
+    required: false
+    type: path
 author:
   - Arkadiusz Cichon (acichon@cisco.com)
+extends_documentation_fragment:
+  - cisco.catalystwan.fields_projection
+  - cisco.catalystwan.output_file
 """
 
 EXAMPLES = r"""
@@ -87,31 +123,39 @@ changed:
 """
 
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import Field
 
+from ..module_utils.output_file import output_file_argument_spec, write_output_file
+from ..module_utils.projection import project_records, projection_argument_spec
 from ..module_utils.result import ModuleResult
 from ..module_utils.vmanage_module import AnsibleCatalystwanModule
 
 
 class ExtendedModuleResult(ModuleResult):
     active_sessions: Optional[List] = Field(default=[])
+    output: Optional[Dict] = Field(default={})
 
 
 def run_module():
-    module = AnsibleCatalystwanModule()
+    module = AnsibleCatalystwanModule(argument_spec=dict(**projection_argument_spec(), **output_file_argument_spec()))
     result = ExtendedModuleResult()
 
     active_sessions = module.get_response_safely(
         module.session.endpoints.administration_user_and_group.get_active_sessions
     )
 
+    if module.params.get("output_file"):
+        result.output = write_output_file(module, active_sessions or [])
+        module.exit_json(**result.model_dump(mode="json"))
+
     if not active_sessions:
         module.exit_json(**result.model_dump(mode="json"))
 
-    for ses in active_sessions:
-        result.active_sessions.append(ses.model_dump(mode="json"))
+    result.active_sessions = project_records(
+        active_sessions, module.params.get("fields"), module.params.get("exclude_fields")
+    )
 
     module.exit_json(**result.model_dump(mode="json"))
 
@@ -39,14 +39,75 @@ options:
     description:
       - Path to a file where the alarms will be logged in JSON format.
       - If not provided, alarms will not be logged to a file.
+      - Deprecated, use C(output_file), which writes alarms as JSON Lines without keeping them in module result.
     type: str
     required: False
     default: None
+  watermark_file:
+    description:
+      - Path to a state file with entry time and uuid of the newest alarm seen in previous run (watermark).
+      - When set, module queries only alarms raised since the watermark and returns only alarms newer than it,
+        alarms with the same entry time as the watermark are deduplicated by uuid.
+      - C(from_time) is used only in first run, when state file doesn't exist yet.
+      - Watermark is moved only when module succeeds, so alarms are not lost when run fails.
+    type: path
+    required: False
+    version_added: "0.3.4"
+  rolling_log_file:
+    description:
+      - Path to a JSON Lines file to which returned alarms are appended, one alarm per line.
+      - Combined with C(watermark_file), every alarm is appended exactly once.
+      - File is rotated when it reaches C(rolling_log_max_size).
+    type: path
+    required: False
+    version_added: "0.3.4"
+  rolling_log_max_size:
+    description:
+      - Size in megabytes at which C(rolling_log_file) is rotated.
+    type: int
+    required: False
+    default: 100
+    version_added: "0.3.4"
+  rolling_log_backups:
+    description:
+      - Number of rotated C(rolling_log_file) files to keep (C(file.1), C(file.2), ...).
+    type: int
+    required: False
+    default: 5
+    version_added: "0.3.4"
+  summary:
+    description:
+      - Whether to return C(summary) with alarms aggregated by severity, type, device and site,
+        devices with the most alarms and first/last entry time of every alarm type.
+      - Summary is computed in the same pass that returns or writes alarms.
+    type: bool
+    required: False
+    default: False
+    version_added: "0.3.4"
+  top_devices:
+    description:
+      - Number of devices with the most alarms returned in C(summary.top_devices).
+    type: int
+    required: False
+    default: 10
+    version_added: "0.3.4"
+  return_alarms:
+    description:
+      - Whether to return list of alarms in C(alarms). Set to false together with C(summary)
+        to get only counts, without alarm bodies.
+    type: bool
+    required: False
+    default: True
+    version_added: "0.3.4"
 author:
   - Arkadiusz Cichon (acichon@cisco.com)
+notes:
+  - C(fields) and C(exclude_fields) refer to keys of returned alarms, e.g. C(host-name) or C(system-ip).
 
 extends_documentation_fragment:
   - cisco.catalystwan.manager_authentication
+  - cisco.catalystwan.fields_projection
+  - cisco.catalystwan.output_file
 """
 
 
@@ -64,6 +125,32 @@ alarms:
         "details": "Interface ge0/1 on device XYZ went down."
       }
   ]
+summary:
+  description: Alarms aggregated in one pass. Entry times are in milliseconds since epoch.
+  returned: when summary is true
+  type: dict
+  sample: {
+      "total": 3,
+      "by_severity": {"Critical": 1, "Major": 2},
+      "by_type": {"BFD_Node_Down": 2, "Interface_State_Change": 1},
+      "by_device": {"edge-1": 2, "edge-2": 1},
+      "by_site": {"100": 2, "200": 1},
+      "top_devices": [{"device": "edge-1", "count": 2}, {"device": "edge-2", "count": 1}],
+      "seen_by_type": {
+          "BFD_Node_Down": {"first_seen": 1616582130000, "last_seen": 1616585730000},
+          "Interface_State_Change": {"first_seen": 1616582130000, "last_seen": 1616582130000}
+      }
+  }
+watermark:
+  description: Watermark after this run, when C(watermark_file) is used.
+  returned: when watermark_file is set
+  type: dict
+  sample: {
+      "entry_time": 1616582130000,
+      "uuid": "2a3c8f3e-3d6b-4d38-9b3a-5d3c6e1b0f11",
+      "seen_uuids": ["2a3c8f3e-3d6b-4d38-9b3a-5d3c6e1b0f11"],
+      "queried_hours": 1
+  }
 number_of_alarms:
   description: The total number of alarms retrieved.
   returned: always
@@ -98,66 +185,281 @@ EXAMPLES = r"""
 - name: Log alarms to a file
   cisco.catalystwan.alarms:
     log_file: "/path/to/alarms.log"
+
+# Example of scraping job that appends only new alarms to a rolling JSON Lines log
+- name: Append new alarms to a log
+  cisco.catalystwan.alarms:
+    from_time: 24
+    watermark_file: "/var/lib/catalystwan/alarms_watermark.json"
+    rolling_log_file: "/var/log/catalystwan/alarms.jsonl"
+
+# Example of getting only alarm counts, without alarm bodies
+- name: Summarize alarms from last 24 hours
+  cisco.catalystwan.alarms:
+    from_time: 24
+    summary: true
+    return_alarms: false
+
+# Example of using the module to write alarms to compressed JSON Lines file
+- name: Write alarms to a file
+  cisco.catalystwan.alarms:
+    output_file: "/path/to/alarms.jsonl.gz"
 """
 
 import json
+import math
+import time
 import traceback
-from typing import List, Optional
+from collections import Counter
+from contextlib import nullcontext
+from typing import Dict, Iterable, Iterator, List, Optional
 
+import attrs
+from catalystwan.dataclasses import AlarmData
 from catalystwan.session import ManagerHTTPError
+from catalystwan.typed_list import DataSequence
 from catalystwan.utils.alarm_status import Severity
-from catalystwan.utils.creation_tools import asdict
+from catalystwan.utils.creation_tools import FIELD_NAME
 from pydantic import Field
 
+from ..module_utils.output_file import JsonLinesWriter, output_file_argument_spec, rotate_file, write_output_file
+from ..module_utils.projection import project_record, project_records, projection_argument_spec
 from ..module_utils.result import ModuleResult
+from ..module_utils.shared_state import locked_json_state
 from ..module_utils.vmanage_module import AnsibleCatalystwanModule
 
+# (attribute name, key in returned dict) pairs, same keys as produced by catalystwan's asdict
+ALARM_FIELDS = [(field.name, field.metadata.get(FIELD_NAME, field.name)) for field in attrs.fields(AlarmData)]
+MILLISECONDS_IN_HOUR = 3600 * 1000
+
 
 class ExtendedModuleResult(ModuleResult):
     alarms: Optional[List] = Field(default=[])
     number_of_alarms: Optional[List] = Field(default=[])
+    output: Optional[Dict] = Field(default={})
+    watermark: Optional[Dict] = Field(default={})
+    summary: Optional[Dict] = Field(default={})
 
 
-def run_module():
-    module_args = dict(
-        from_time=dict(type=int, required=False, default=None),
-        mark_all_as_viewed=dict(type=bool, required=False, default=False),
-        only_critical=dict(type=bool, required=False, default=False),
-        log_file=dict(type=str, required=False, default=None),
-    )
+class AlarmsSummary:
+    """Aggregates alarms record by record, so summary is computed in the same pass that returns or writes them.
 
-    module = AnsibleCatalystwanModule(argument_spec=module_args)
-    result = ExtendedModuleResult()
+    Args:
+        top_devices (int): number of devices with the most alarms to report.
+    """
 
-    try:
-        if module.params.get("only_critical"):
-            alarms = module.session.api.alarms.get(from_time=module.params["from_time"]).filter(
-                severity=Severity.CRITICAL
-            )
+    def __init__(self, top_devices: int = 10) -> None:
+        self.top_devices = top_devices
+        self.total = 0
+        self.by_severity: Counter = Counter()
+        self.by_type: Counter = Counter()
+        self.by_device: Counter = Counter()
+        self.by_site: Counter = Counter()
+        self.seen_by_type: Dict[str, Dict] = {}
+
+    def add(self, record: Dict) -> None:
+        self.total += 1
+        alarm_type = record.get("type") or "unknown"
+        self.by_severity[record.get("severity") or "unknown"] += 1
+        self.by_type[alarm_type] += 1
+        self.by_device[record.get("host-name") or record.get("system-ip") or "unknown"] += 1
+        self.by_site[str(record["site-id"]) if record.get("site-id") is not None else "unknown"] += 1
+
+        entry_time = record.get("entry_time")
+        if entry_time is None:
+            return
+        seen = self.seen_by_type.get(alarm_type)
+        if seen is None:
+            self.seen_by_type[alarm_type] = dict(first_seen=entry_time, last_seen=entry_time)
         else:
-            alarms = module.session.api.alarms.get(from_time=module.params["from_time"])
+            seen["first_seen"] = min(seen["first_seen"], entry_time)
+            seen["last_seen"] = max(seen["last_seen"], entry_time)
 
-        if module.params.get("mark_all_as_viewed"):
-            module.session.api.alarms.mark_all_as_viewed()
+    def summary(self) -> Dict:
+        return dict(
+            total=self.total,
+            by_severity=dict(self.by_severity),
+            by_type=dict(self.by_type),
+            by_device=dict(self.by_device),
+            by_site=dict(self.by_site),
+            top_devices=[
+                dict(device=device, count=count) for device, count in self.by_device.most_common(self.top_devices)
+            ],
+            seen_by_type=self.seen_by_type,
+        )
+
+
+def summarized(records: Iterable[Dict], alarms_summary: Optional[AlarmsSummary]) -> Iterator[Dict]:
+    for record in records:
+        if alarms_summary is not None:
+            alarms_summary.add(record)
+        yield record
+
+
+def alarm_record(alarm: AlarmData) -> Dict:
+    """
+    Shallow conversion of alarm to dict, AlarmData has no nested dataclasses so full asdict() is not needed.
+    """
+    record = {key: getattr(alarm, name) for name, key in ALARM_FIELDS}
+    if isinstance(record["severity"], Severity):
+        record["severity"] = record["severity"].value
+    return record
+
+
+def alarm_records(alarms: Iterable[AlarmData]) -> Iterator[Dict]:
+    """
+    Convert alarms to dicts one at a time, so they can be written to file without keeping all of them in memory.
+    """
+    for alarm in alarms:
+        yield alarm_record(alarm)
+
+
+def hours_since(timestamp_ms: int) -> int:
+    """
+    Alarms can be queried only for last N hours, add one hour of margin for clock skew between controller and Manager.
+    """
+    return max(math.ceil((time.time() * 1000 - timestamp_ms) / MILLISECONDS_IN_HOUR), 0) + 1
+
+
+def newer_than_watermark(alarms: DataSequence[AlarmData], watermark: Dict) -> DataSequence[AlarmData]:
+    """
+    Alarms with entry time after the watermark. Alarms with the same entry time as the watermark
+    are deduplicated by uuid, as are duplicates within the response.
+    """
+    last_entry_time = watermark.get("entry_time", 0)
+    seen_uuids = set(watermark.get("seen_uuids", []))
+    new_alarms = DataSequence(AlarmData, [])
+    for alarm in sorted(alarms, key=lambda alarm: alarm.entry_time or 0):
+        entry_time = alarm.entry_time or 0
+        if entry_time < last_entry_time or alarm.uuid in seen_uuids:
+            continue
+        seen_uuids.add(alarm.uuid)
+        new_alarms.append(alarm)
+    return new_alarms
 
+
+def advance_watermark(watermark: Dict, new_alarms: DataSequence[AlarmData]) -> None:
+    """
+    Move watermark to the newest alarm. Uuids of all alarms with that entry time are remembered,
+    as next query returns them again.
+    """
+    if not new_alarms:
+        return
+    newest = new_alarms[-1]
+    newest_entry_time = newest.entry_time or 0
+    seen_uuids = watermark.get("seen_uuids", []) if newest_entry_time == watermark.get("entry_time") else []
+    seen_uuids = seen_uuids + [alarm.uuid for alarm in new_alarms if (alarm.entry_time or 0) == newest_entry_time]
+    watermark.update(entry_time=newest_entry_time, uuid=newest.uuid, seen_uuids=seen_uuids)
+
+
+def get_alarms(module: AnsibleCatalystwanModule, from_time: Optional[int]) -> DataSequence[AlarmData]:
+    try:
+        return module.session.api.alarms.get(from_time=from_time)
     except ManagerHTTPError as ex:
         module.fail_json(
             msg=f"Could not perform alarms action. Manager error: {str(ex)} {ex.info}",
             exception=traceback.format_exc(),
         )
 
-    alarms_dict = [asdict(alarm) for alarm in alarms]
-    for alarm in alarms_dict:
-        if type(alarm["severity"]) is Severity:
-            alarm["severity"] = alarm["severity"].value
-    result.alarms = [alarm for alarm in alarms_dict]
+
+def filter_alarms(module: AnsibleCatalystwanModule, alarms: DataSequence[AlarmData]) -> DataSequence[AlarmData]:
+    if module.params.get("only_critical"):
+        return alarms.filter(severity=Severity.CRITICAL)
+    return alarms
+
+
+def append_to_rolling_log(module: AnsibleCatalystwanModule, alarms: DataSequence[AlarmData]) -> None:
+    path = module.params["rolling_log_file"]
+    try:
+        rotate_file(path, module.params["rolling_log_max_size"] * 1024 * 1024, module.params["rolling_log_backups"])
+        with JsonLinesWriter(path, append=True) as writer:
+            for record in alarm_records(alarms):
+                writer.write(project_record(record, module.params.get("fields"), module.params.get("exclude_fields")))
+    except OSError as ex:
+        module.fail_json(msg=f"Cannot append alarms to file: {path}, exception: {ex}")
+
+
+def write_outputs(module: AnsibleCatalystwanModule, result: ExtendedModuleResult, alarms: DataSequence[AlarmData]):
+    if module.params.get("mark_all_as_viewed"):
+        try:
+            module.session.api.alarms.mark_all_as_viewed()
+        except ManagerHTTPError as ex:
+            module.fail_json(
+                msg=f"Could not perform alarms action. Manager error: {str(ex)} {ex.info}",
+                exception=traceback.format_exc(),
+            )
 
     result.changed = False
-    result.number_of_alarms = len(alarms_dict)
+    result.number_of_alarms = len(alarms)
+
+    alarms_summary = AlarmsSummary(module.params["top_devices"]) if module.params.get("summary") else None
+    records = summarized(alarm_records(alarms), alarms_summary)
+    if module.params.get("output_file"):
+        result.output = write_output_file(module, records)
+    elif module.params.get("return_alarms"):
+        result.alarms = project_records(records, module.params.get("fields"), module.params.get("exclude_fields"))
+    else:
+        for _ in records:
+            pass
+    if alarms_summary is not None:
+        result.summary = alarms_summary.summary()
 
     if module.params.get("log_file"):
-        with open(module.params["log_file"], "w") as outfile:
-            outfile.write(json.dumps(result.alarms, indent=4))
+        logged_alarms = result.alarms or project_records(
+            alarm_records(alarms), module.params.get("fields"), module.params.get("exclude_fields")
+        )
+        try:
+            with open(module.params["log_file"], "w") as outfile:
+                outfile.write(json.dumps(logged_alarms, indent=4))
+        except OSError as ex:
+            module.fail_json(msg=f"Cannot write alarms to log file: {module.params['log_file']}, exception: {ex}")
+
+
+def run_module():
+    module_args = dict(
+        from_time=dict(type=int, required=False, default=None),
+        mark_all_as_viewed=dict(type=bool, required=False, default=False),
+        only_critical=dict(type=bool, required=False, default=False),
+        log_file=dict(type=str, required=False, default=None),
+        watermark_file=dict(type="path", required=False, default=None),
+        rolling_log_file=dict(type="path", required=False, default=None),
+        rolling_log_max_size=dict(type=int, required=False, default=100),
+        rolling_log_backups=dict(type=int, required=False, default=5),
+        summary=dict(type=bool, required=False, default=False),
+        top_devices=dict(type=int, required=False, default=10),
+        return_alarms=dict(type=bool, required=False, default=True),
+        **projection_argument_spec(),
+        **output_file_argument_spec(),
+    )
+
+    module = AnsibleCatalystwanModule(argument_spec=module_args)
+    result = ExtendedModuleResult()
+
+    if module.params.get("log_file"):
+        module.module.deprecate(
+            "log_file is deprecated, use output_file instead", version="1.0.0", collection_name="cisco.catalystwan"
+        )
+
+    watermark_file = module.params.get("watermark_file")
+    try:
+        # Lock is held for the whole run and watermark is written back only when all outputs succeeded,
+        # fail_json raises SystemExit inside the block, so state is not written and alarms are not lost
+        with locked_json_state(watermark_file) if watermark_file else nullcontext({}) as watermark:
+            from_time = module.params["from_time"]
+            if watermark.get("entry_time"):
+                from_time = hours_since(watermark["entry_time"])
+            new_alarms = get_alarms(module, from_time)
+            if watermark_file:
+                new_alarms = newer_than_watermark(new_alarms, watermark)
+            alarms = filter_alarms(module, new_alarms)
+            write_outputs(module, result, alarms)
+            if module.params.get("rolling_log_file"):
+                append_to_rolling_log(module, alarms)
+            if watermark_file:
+                advance_watermark(watermark, new_alarms)
+                result.watermark = dict(watermark, queried_hours=from_time)
+    except OSError as ex:
+        module.fail_json(msg=f"Cannot use watermark file: {watermark_file}, exception: {ex}")
 
     module.exit_json(**result.model_dump(mode="json"))
 
@@ -180,7 +180,11 @@ def run_module():
         ),
     )
 
-    module = AnsibleCatalystwanModule(argument_spec=module_args, session_reconnect_retries=180)
+    # Manager restarts services after cluster change. Full jitter backoff capped at 2 s waits about 1 s
+    # per retry on average, so 180 retries take about 3 minutes, like fixed 1 s retries did, 6 at most
+    module = AnsibleCatalystwanModule(
+        argument_spec=module_args, session_reconnect_retries=180, session_reconnect_max_backoff=2.0
+    )
     module.session.request_timeout = 60
     result = ModuleResult()
 
@@ -9,7 +9,72 @@ DOCUMENTATION = r"""
 module: config_group_deployment
 short_description: Description
 version_added: "0.3.1"
-description: Module for deployment of config groups.
+description:
+  - Module for deployment of config groups.
+  - Devices are associated with config group, their variables are updated and config group is deployed
+    in chunks of configurable size, so requests for large number of devices stay within Manager limits.
+    Chunks of every step are sent concurrently, up to C(max_concurrency) at a time.
+  - Device which failed in one step is skipped in the following steps and reported in C(devices).
+options:
+  config_group_id:
+    description:
+      - ID of config group to deploy.
+    type: str
+    required: true
+  edge_device_variables:
+    description:
+      - List of variables of devices to deploy config group to. Every item must have C(uuid) of device,
+        all other keys are config group variables.
+    type: list
+    elements: dict
+    required: true
+  associate_chunk_size:
+    description:
+      - Maximum number of devices associated with config group in single request.
+      - Value lower than 1 sends all devices in single request.
+    type: int
+    default: 500
+    version_added: "0.3.4"
+  variables_chunk_size:
+    description:
+      - Maximum number of devices, which variables are updated in single request.
+      - Value lower than 1 sends all devices in single request.
+    type: int
+    default: 200
+    version_added: "0.3.4"
+  deploy_chunk_size:
+    description:
+      - Maximum number of devices deployed with single deploy task.
+      - Value lower than 1 deploys all devices with single task.
+    type: int
+    default: 200
+    version_added: "0.3.4"
+  max_concurrency:
+    description:
+      - Maximum number of chunks sent to Manager at the same time.
+      - Threads share one Manager session, established before they start. When the session expires,
+        only one thread logs in again and the others wait for it.
+    type: int
+    default: 4
+    version_added: "0.3.4"
+  wait_for_completed:
+    description:
+      - Whether to wait for deploy tasks to complete and report status of every device.
+    type: bool
+    default: true
+    version_added: "0.3.4"
+  wait_timeout_seconds:
+    description:
+      - The maximum time to wait for single deploy task to complete.
+    type: int
+    default: 3600
+    version_added: "0.3.4"
+  wait_interval_seconds:
+    description:
+      - Interval between deploy task status checks.
+    type: int
+    default: 10
+    version_added: "0.3.4"
 author:
   - Przemyslaw Susko (sprzemys@cisco.com)
 extends_documentation_fragment:
@@ -22,9 +87,29 @@ msg:
   returned: always
   type: str
 response:
-  description: Detailed response from the vManage API if applicable.
+  description:
+    - Detailed response from the vManage API if applicable.
+    - C(parentTaskId) is ID of the first deploy task, C(parentTaskIds) are IDs of all deploy tasks.
   returned: when API call is made
   type: dict
+  sample:
+    parentTaskId: deploy_config_group-d4b8ba50-1d1a-4d29-8e1e-5b4dc0cb1ac0
+    parentTaskIds:
+      - deploy_config_group-d4b8ba50-1d1a-4d29-8e1e-5b4dc0cb1ac0
+devices:
+  description:
+    - Result of deployment for every device.
+    - C(status) is status of deploy sub-task reported by Manager, C(Failure) when device failed in earlier step,
+      C(Started) when module didn't wait for deploy task.
+  returned: always
+  type: list
+  elements: dict
+  sample:
+    - uuid: C8K-15411CCC-D476-0B3B-21F2-5D6AC387EE7B
+      host_name: cedge-1
+      status: Success
+      task_id: deploy_config_group-d4b8ba50-1d1a-4d29-8e1e-5b4dc0cb1ac0
+      msg: "Done - Push Feature Template Configuration"
 changed:
   description: Whether or not the state was changed.
   returned: always
@@ -57,15 +142,41 @@ EXAMPLES = r"""
         vpn_10_if_0: GigabitEthernet2
         vpn_10_if_0_static_ipaddr: 10.0.0.2
         vpn_10_if_0_static_subnet: 255.255.255.0
+
+- name: "Deploy config group to large number of edges"
+  cisco.catalystwan.config_group_deployment:
+    config_group_id: c90cdc29-fbc7-470a-80ad-6c81beb35848
+    edge_device_variables: "{{ edge_device_variables }}"
+    deploy_chunk_size: 100
+    max_concurrency: 8
+    wait_timeout_seconds: 7200
+  register: deployment
+
+- name: "Show devices which failed deployment"
+  ansible.builtin.debug:
+    msg: "{{ deployment.devices | rejectattr('status', 'equalto', 'Success') }}"
 """
 
 import traceback
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from catalystwan.endpoints.configuration_group import DeviceVariables, VariableData
+from catalystwan.api.task_status_api import Task
+from catalystwan.endpoints.configuration_dashboard_status import TaskResult
+from catalystwan.endpoints.configuration_group import DeviceVariables
+from catalystwan.utils.operation_status import OperationStatus
+from pydantic import Field
 
+from ..module_utils.concurrency import chunked, run_concurrently
 from ..module_utils.result import ModuleResult
 from ..module_utils.vmanage_module import AnsibleCatalystwanModule
 
+FAILURE = OperationStatus.FAILURE.value
+STARTED = "Started"
+
+
+class ExtendedModuleResult(ModuleResult):
+    devices: List[Dict] = Field(default=[])
+
 
 def normalize_variables(variables: dict):
     return_variables = {}
@@ -87,47 +198,122 @@ def normalize_variables_list(variables: list):
     return return_variables
 
 
-def generate_payload_for_device(module: AnsibleCatalystwanModule, source: dict, device_ids: list):
-    try:
-        variables = []
-        for key, value in source.items():
-            if key == "uuid":
-                continue
-            variables.append(VariableData(name=key, value=value))
-
-        device_ids.append(source["uuid"])
-        return DeviceVariables(device_id=source["uuid"], variables=variables)
-    except Exception as exception:
-        module.fail_json(msg=f"Unknown exception: {exception}", exception=traceback.format_exc())
+def generate_payload_for_device(source: dict) -> DeviceVariables:
+    # Variables are validated together with DeviceVariables model instead of creating VariableData one by one
+    return DeviceVariables(
+        device_id=source["uuid"],
+        variables=[{"name": key, "value": value} for key, value in source.items() if key != "uuid"],
+    )
+
+
+def error_message(module: AnsibleCatalystwanModule, exception: Exception) -> str:
+    info = getattr(exception, "info", None)
+    return f"{module.get_exception_string(exception)} {info}" if info else module.get_exception_string(exception)
 
 
 def run_module():
     module_args = dict(
         config_group_id=dict(type=str, required=True),
-        edge_device_variables=dict(type=list, required=True),
+        edge_device_variables=dict(type="list", elements="dict", required=True),
+        associate_chunk_size=dict(type="int", default=500),
+        variables_chunk_size=dict(type="int", default=200),
+        deploy_chunk_size=dict(type="int", default=200),
+        max_concurrency=dict(type="int", default=4),
+        wait_for_completed=dict(type="bool", default=True),
+        wait_timeout_seconds=dict(type="int", default=3600),
+        wait_interval_seconds=dict(type="int", default=10),
     )
 
     module = AnsibleCatalystwanModule(argument_spec=module_args)
-    result = ModuleResult()
+    result = ExtendedModuleResult()
 
     config_group_id = module.params.get("config_group_id")
+    max_concurrency = module.params.get("max_concurrency")
     edge_device_variables = normalize_variables_list(module.params.get("edge_device_variables"))
 
-    device_ids = []
-    variables_payload = []
-    for device in edge_device_variables:
-        variables_payload.append(generate_payload_for_device(module, device, device_ids))
-
     try:
-        module.session.api.config_group.associate(config_group_id, device_ids)
-        module.session.api.config_group.update_variables(config_group_id, "sdwan", variables_payload)
-        response = module.session.api.config_group.deploy(config_group_id, device_ids)
-        result.response = response
-        result.changed = True
-        module.exit_json(**result.model_dump(mode="json"))
+        payloads = {device["uuid"]: generate_payload_for_device(device) for device in edge_device_variables}
     except Exception as exception:
         module.fail_json(msg=f"Unknown exception: {exception}", exception=traceback.format_exc())
 
+    devices = {
+        device["uuid"]: dict(uuid=device["uuid"], host_name=device.get("host_name"), status=None, task_id=None, msg="")
+        for device in edge_device_variables
+    }
+
+    def fail_devices(device_ids: Sequence[str], step: str, exception: Exception) -> None:
+        for device_id in device_ids:
+            devices[device_id].update(status=FAILURE, msg=f"Could not {step}: {error_message(module, exception)}")
+
+    def pending_device_ids() -> List[str]:
+        return [device_id for device_id, device in devices.items() if device["status"] is None]
+
+    # Session is established before chunks are sent from worker threads
+    config_group_api = module.session.api.config_group
+
+    def associate(device_ids: Sequence[str]) -> None:
+        with module.measure_operation("config_group_deployment:associate"):
+            config_group_api.associate(config_group_id, list(device_ids))
+
+    def update_variables(device_ids: Sequence[str]) -> None:
+        with module.measure_operation("config_group_deployment:update_variables"):
+            config_group_api.update_variables(
+                config_group_id, "sdwan", [payloads[device_id] for device_id in device_ids]
+            )
+
+    def deploy(device_ids: Sequence[str]) -> Tuple[str, Optional[TaskResult]]:
+        with module.measure_operation("config_group_deployment:deploy"):
+            task_id = config_group_api.deploy(config_group_id, list(device_ids)).parentTaskId
+        if not module.params.get("wait_for_completed"):
+            return task_id, None
+        with module.measure_task_wait():
+            task_result = Task(module.session, task_id).wait_for_completed(
+                timeout_seconds=module.params.get("wait_timeout_seconds"),
+                interval_seconds=module.params.get("wait_interval_seconds"),
+            )
+        return task_id, task_result
+
+    for step, func, chunk_size in (
+        ("associate devices with config group", associate, module.params.get("associate_chunk_size")),
+        ("update variables of devices", update_variables, module.params.get("variables_chunk_size")),
+    ):
+        for chunk, _, exception in run_concurrently(func, chunked(pending_device_ids(), chunk_size), max_concurrency):
+            if exception is not None:
+                fail_devices(chunk, step, exception)
+            else:
+                result.changed = True
+
+    task_ids = []
+    deploy_chunks = chunked(pending_device_ids(), module.params.get("deploy_chunk_size"))
+    for chunk, deployment, exception in run_concurrently(deploy, deploy_chunks, max_concurrency):
+        if exception is not None:
+            fail_devices(chunk, "deploy config group", exception)
+            continue
+        task_id, task_result = deployment
+        task_ids.append(task_id)
+        result.changed = True
+        sub_tasks = {sub_task.uuid: sub_task for sub_task in task_result.sub_tasks_data} if task_result else {}
+        for device_id in chunk:
+            sub_task = sub_tasks.get(device_id)
+            if task_result is None:
+                devices[device_id].update(task_id=task_id, status=STARTED)
+            elif sub_task is None:
+                devices[device_id].update(task_id=task_id, status=FAILURE, msg="Device not found in deploy task")
+            else:
+                activity = sub_task.activity[-1] if sub_task.activity else ""
+                devices[device_id].update(task_id=task_id, status=sub_task.status, msg=activity)
+
+    if task_ids:
+        result.response = dict(parentTaskId=task_ids[0], parentTaskIds=task_ids)
+    result.devices = list(devices.values())
+
+    failed = [device for device in result.devices if device["status"] not in (OperationStatus.SUCCESS.value, STARTED)]
+    if failed:
+        result.msg = f"Config group deployment failed for {len(failed)} of {len(devices)} devices"
+        module.fail_json(**result.model_dump(mode="json"))
+    result.msg = f"Config group deployed to {len(devices)} devices"
+    module.exit_json(**result.model_dump(mode="json"))
+
 
 def main():
     run_module()
@@ -9,7 +9,49 @@ DOCUMENTATION = r"""
 module: config_groups
 short_description: Description
 version_added: "0.3.1"
-description: Module for configuration of config groups.
+description:
+  - Module for configuration of config groups.
+  - Existing feature profiles and config group are looked up by name. Feature profile is reused when canonical
+    hash of its parcels (type, name, description and data of every parcel and sub-parcel) equals hash of
+    existing profile, so re-running the module with the same input doesn't change anything.
+  - Existing feature profile with different parcels is replaced, when it's not used by any config group.
+    Otherwise module fails, as changing parcels of used profiles is not supported.
+  - Replacing profile is built under temporary name C(<name>-<hash prefix>) first. Existing profiles are deleted,
+    and replacing ones renamed, only when all profiles were built, so failed build leaves existing profiles intact.
+  - Feature profiles which need to be created are built concurrently.
+options:
+  name:
+    description:
+      - Name of config group.
+    type: str
+    required: true
+  description:
+    description:
+      - Description of config group.
+    type: str
+  system_profiles:
+    description:
+      - List of system feature profiles, as generated by C(cisco.catalystwan.feature_profile_builder).
+    type: list
+    elements: dict
+  transport_profiles:
+    description:
+      - List of transport feature profiles, as generated by C(cisco.catalystwan.feature_profile_builder).
+    type: list
+    elements: dict
+  service_profiles:
+    description:
+      - List of service feature profiles, as generated by C(cisco.catalystwan.feature_profile_builder).
+    type: list
+    elements: dict
+  max_concurrency:
+    description:
+      - Maximum number of feature profiles built at the same time.
+      - Threads share one Manager session, established before they start. When the session expires,
+        only one thread logs in again and the others wait for it.
+    type: int
+    default: 4
+    version_added: "0.3.4"
 author:
   - Przemyslaw Susko (sprzemys@cisco.com)
 extends_documentation_fragment:
@@ -31,10 +73,22 @@ changed:
   type: bool
   sample: true
 id:
-  description: ID of created config group.
+  description: ID of created or existing config group.
   returned: on success
-  type: bool
+  type: str
   sample: c90cdc29-fbc7-470a-80ad-6c81beb35848
+profiles:
+  description:
+    - Feature profiles of config group. C(state) is one of C(unchanged), C(created) or C(replaced).
+  returned: on success
+  type: list
+  elements: dict
+  sample:
+    - name: ansible-generated_Basic
+      type: system
+      id: 0d4b1a5e-1f3c-4e21-9d3c-3d3c7f6f6e0a
+      hash: 5f0c6d1b2e7c8f1e2d3c4b5a69788796a5b4c3d2e1f0a9b8c7d6e5f4a3b2c1d0
+      state: unchanged
 """
 
 EXAMPLES = r"""
@@ -52,9 +106,16 @@ EXAMPLES = r"""
             description: Banner Description
 """
 
+import hashlib
+import json
 import traceback
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
-from catalystwan.models.configuration.feature_profile.common import FeatureProfileCreationPayload
+from catalystwan.models.configuration.feature_profile.common import (
+    FeatureProfileCreationPayload,
+    FeatureProfileEditPayload,
+)
 from catalystwan.models.configuration.feature_profile.sdwan.service import (
     InterfaceEthernetParcel as ServiceInterfaceEthernetParcel,
 )
@@ -74,7 +135,9 @@ from catalystwan.models.configuration.feature_profile.sdwan.transport import (
     InterfaceEthernetParcel as TransportInterfaceEthernetParcel,
 )
 from catalystwan.models.configuration.feature_profile.sdwan.transport import TransportVpnParcel
+from pydantic import Field
 
+from ..module_utils.concurrency import run_concurrently
 from ..module_utils.result import ModuleResult
 from ..module_utils.vmanage_module import AnsibleCatalystwanModule
 
@@ -100,6 +163,65 @@ service_parcel_type_mapping = {
     "ethernet": ServiceInterfaceEthernetParcel,
 }
 
+# Parcel classes by parcel type reported by Manager, e.g. "wan/vpn/interface/ethernet"
+manager_parcel_type_mapping = {
+    profile_type: {parcel_class._get_parcel_type(): parcel_class for parcel_class in mapping.values()}
+    for profile_type, mapping in (
+        ("system", system_parcel_type_mapping),
+        ("transport", transport_parcel_type_mapping),
+        ("service", service_parcel_type_mapping),
+    )
+}
+
+PARCEL_PAYLOAD_KEYS = ("name", "description", "data")
+
+
+class ExtendedModuleResult(ModuleResult):
+    id: Optional[str] = None
+    profiles: List[Dict] = Field(default=[])
+
+
+@dataclass
+class ProfilePlan:
+    profile_type: str
+    name: str
+    builder: Any
+    parcels: List[Dict] = field(default_factory=list)
+    description: str = ""
+    hash: str = ""
+    id: Optional[str] = None
+    state: str = "created"
+    # ID of existing profile with the same name, deleted when this profile is built
+    replaces: Optional[str] = None
+
+    @property
+    def temporary_name(self) -> str:
+        return f"{self.name}-{self.hash[:8]}"
+
+
+def canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def canonical_parcel(parcel_type: str, payload: Dict, sub_parcels: List[Dict]) -> Dict:
+    """
+    Canonical form of parcel: only fields set by user, with sub-parcels in stable order.
+    """
+    return dict(
+        type=parcel_type,
+        payload={key: payload[key] for key in PARCEL_PAYLOAD_KEYS if payload.get(key) is not None},
+        sub_parcels=sorted(sub_parcels, key=canonical_json),
+    )
+
+
+def dump_parcel(parcel) -> Dict:
+    return parcel.model_dump(by_alias=True, mode="json", exclude_none=True)
+
+
+def profile_hash(description: str, parcels: List[Dict]) -> str:
+    content = dict(description=description or "", parcels=sorted(parcels, key=canonical_json))
+    return hashlib.sha256(canonical_json(content).encode()).hexdigest()
+
 
 def create_parcel(module, parcel, profile_type):
     if "config" not in parcel:
@@ -126,78 +248,224 @@ def create_parcel(module, parcel, profile_type):
         module.fail_json(msg=f"Unknown parcel type: {parcel_type}")
 
 
-def builder_add_parcel_vpn(builder, module, parcel, profile_type):
-    vpn_tag = builder.add_parcel_vpn(create_parcel(module, parcel, profile_type))
+def builder_add_parcel_vpn(builder, module, parcel, profile_type) -> Dict:
+    vpn_parcel = create_parcel(module, parcel, profile_type)
+    vpn_tag = builder.add_parcel_vpn(vpn_parcel)
+    sub_parcels = []
     if "sub_parcels" in parcel:
         for sub_parcel in parcel["sub_parcels"]:
+            sub_parcel_model = create_parcel(module, sub_parcel, profile_type)
             if profile_type == "transport":
-                builder.add_vpn_subparcel(vpn_tag, create_parcel(module, sub_parcel, profile_type))
+                builder.add_vpn_subparcel(vpn_tag, sub_parcel_model)
             elif profile_type == "service":
-                builder.add_parcel_vpn_subparcel(vpn_tag, create_parcel(module, sub_parcel, profile_type))
+                builder.add_parcel_vpn_subparcel(vpn_tag, sub_parcel_model)
+            sub_parcels.append(canonical_parcel(sub_parcel_model._get_parcel_type(), dump_parcel(sub_parcel_model), []))
+    return canonical_parcel(vpn_parcel._get_parcel_type(), dump_parcel(vpn_parcel), sub_parcels)
 
 
-def create_profile(module, profile, profile_type):
+def prepare_profile(module, profile, profile_type) -> ProfilePlan:
+    """
+    Parse parcels of profile and prepare builder, without sending anything to Manager.
+    """
     if "name" not in profile:
         module.fail_json(msg=f"{profile_type} profile lacks name")
     if "parcels" not in profile:
         module.fail_json(msg="{} profile {} lacks parcels".format(profile_type, profile["name"]))
 
+    description = profile["description"] if "description" in profile else ""
     builder = module.session.api.builders.feature_profiles.create_builder(profile_type)
     builder.add_profile_name_and_description(
-        FeatureProfileCreationPayload(
-            name=profile["name"], description=profile["description"] if "description" in profile else ""
-        )
+        FeatureProfileCreationPayload(name=profile["name"], description=description)
     )
+    plan = ProfilePlan(profile_type=profile_type, name=profile["name"], builder=builder, description=description)
     for parcel in profile["parcels"]:
         if "type" not in parcel:
             module.fail_json(msg="parcel for profile {} lacks type".format(profile["name"]))
 
         if parcel["type"] == "vpn":
-            builder_add_parcel_vpn(builder, module, parcel, profile_type)
+            plan.parcels.append(builder_add_parcel_vpn(builder, module, parcel, profile_type))
         else:
-            builder.add_parcel(create_parcel(module, parcel, profile_type))
+            parcel_model = create_parcel(module, parcel, profile_type)
+            builder.add_parcel(parcel_model)
+            plan.parcels.append(canonical_parcel(parcel_model._get_parcel_type(), dump_parcel(parcel_model), []))
+
+    plan.hash = profile_hash(description, plan.parcels)
+    return plan
+
+
+def canonical_manager_parcel(parcel: Dict, profile_type: str) -> Dict:
+    """
+    Canonical form of parcel returned by Manager. Payload is parsed with the same model as parcels
+    from module input, so defaults filled in by Manager and by the model compare equal.
+    """
+    parcel_type = parcel.get("parcelType")
+    payload = parcel.get("payload") or {}
+    parcel_class = manager_parcel_type_mapping[profile_type].get(parcel_type)
+    if parcel_class is not None:
+        try:
+            payload = dump_parcel(
+                parcel_class.model_validate({key: payload[key] for key in PARCEL_PAYLOAD_KEYS if key in payload})
+            )
+        except ValueError:
+            pass  # not comparable, kept as returned by Manager, so profile is considered changed
+    sub_parcels = [canonical_manager_parcel(sub_parcel, profile_type) for sub_parcel in parcel.get("subparcels") or []]
+    return canonical_parcel(parcel_type, payload, sub_parcels)
+
 
-    build_report = builder.build()
-    if len(build_report.failed_parcels) > 0:
-        module.fail_json(
-            msg="Failed to create {} parcels for profile {}."
-            "Build report: {}".format(len(build_report.failed_parcels), profile["name"], build_report)
-        )
+def existing_profile_hash(module, profile_type: str, profile_id: str, description: str) -> str:
+    details = module.session.get(f"dataservice/v1/feature-profile/sdwan/{profile_type}/{profile_id}?details=true")
+    parcels = details.json().get("associatedProfileParcels") or []
+    return profile_hash(description, [canonical_manager_parcel(parcel, profile_type) for parcel in parcels])
 
-    return build_report.profile_uuid
+
+def build_profile(plan: ProfilePlan):
+    return plan.builder.build()
+
+
+def profiles_result(plans: List[ProfilePlan]) -> List[Dict]:
+    return [
+        dict(name=plan.name, type=plan.profile_type, id=plan.id, hash=plan.hash, state=plan.state) for plan in plans
+    ]
+
+
+def rename_profile(module, plan: ProfilePlan) -> None:
+    module.session.put(
+        f"dataservice/v1/feature-profile/sdwan/{plan.profile_type}/{plan.id}",
+        json=FeatureProfileEditPayload(name=plan.name, description=plan.description).model_dump(),
+    )
+
+
+def replace_profiles(module, result: ExtendedModuleResult, plans: List[ProfilePlan]) -> None:
+    """
+    Delete existing profiles replaced by built ones, and give built profiles their names.
+    """
+    profiles_apis = module.session.api.sdwan_feature_profiles
+    for plan in plans:
+        if plan.replaces is None:
+            continue
+        try:
+            getattr(profiles_apis, plan.profile_type).delete_profile(plan.replaces)
+            rename_profile(module, plan)
+        except Exception as exception:
+            result.msg = (
+                f"Cannot replace {plan.profile_type} profile {plan.name} (ID {plan.replaces}) with profile "
+                f"{plan.temporary_name} (ID {plan.id}): {module.get_exception_string(exception)}. "
+                f"To recover, delete profile {plan.name} if it still exists, rename {plan.temporary_name} "
+                f"to {plan.name} and re-run the module."
+            )
+            module.fail_json(**result.model_dump(mode="json"))
+
+
+def delete_built_replacements(module, plans: List[ProfilePlan]) -> List[str]:
+    """
+    Delete temporary profiles built to replace existing ones, when building other profiles failed.
+    Returns names of profiles which couldn't be deleted.
+    """
+    profiles_apis = module.session.api.sdwan_feature_profiles
+    not_deleted = []
+    for plan in plans:
+        if plan.replaces is None or plan.id is None:
+            continue
+        try:
+            getattr(profiles_apis, plan.profile_type).delete_profile(plan.id)
+            plan.id = None
+        except Exception:
+            not_deleted.append(f"{plan.temporary_name} (ID {plan.id})")
+    return not_deleted
 
 
 def run_module():
     module_args = dict(
         name=dict(type=str, required=True),
         description=dict(type=str),
-        system_profiles=dict(type=list),
-        transport_profiles=dict(type=list),
-        service_profiles=dict(type=list),
+        system_profiles=dict(type="list", elements="dict", default=[]),
+        transport_profiles=dict(type="list", elements="dict", default=[]),
+        service_profiles=dict(type="list", elements="dict", default=[]),
+        max_concurrency=dict(type="int", default=4),
     )
 
     module = AnsibleCatalystwanModule(argument_spec=module_args)
-    result = ModuleResult()
-    profile_ids = []
+    result = ExtendedModuleResult()
 
     name = module.params.get("name")
     description = module.params.get("description")
-    system_profiles = module.params.get("system_profiles")
-    transport_profiles = module.params.get("transport_profiles")
-    service_profiles = module.params.get("service_profiles")
-
-    for profile in system_profiles:
-        profile_ids.append(create_profile(module, profile, "system"))
-    for profile in transport_profiles:
-        profile_ids.append(create_profile(module, profile, "transport"))
-    for profile in service_profiles:
-        profile_ids.append(create_profile(module, profile, "service"))
+    plans = [
+        prepare_profile(module, profile, profile_type)
+        for profile_type in ("system", "transport", "service")
+        for profile in module.params.get(f"{profile_type}_profiles") or []
+    ]
 
     try:
-        response = module.session.api.config_group.create(name, description, "sdwan", profile_ids)
-        result.response = response
-        result.changed = True
-        result.id = response.id
+        config_groups = module.session.api.config_group.get()
+        config_group = config_groups.filter(name=name).single_or_default()
+        used_profile_ids = {profile.id for group in config_groups for profile in group.profiles or []}
+
+        # Reuse existing profiles with the same parcels, replace unused ones with different parcels
+        profiles_apis = module.session.api.sdwan_feature_profiles
+        for profile_type in ("system", "transport", "service"):
+            profiles_api = getattr(profiles_apis, profile_type)
+            existing_profiles = {profile.profile_name: profile for profile in profiles_api.get_profiles()}
+            for plan in plans:
+                existing = existing_profiles.get(plan.name) if plan.profile_type == profile_type else None
+                if existing is None:
+                    continue
+                existing_id = str(existing.profile_id)
+                if existing_profile_hash(module, profile_type, existing_id, existing.description) == plan.hash:
+                    plan.id, plan.state = existing_id, "unchanged"
+                elif existing_id in used_profile_ids:
+                    module.fail_json(
+                        msg=f"{profile_type} profile {plan.name} differs from existing profile, which is used "
+                        "by config groups. Use different profile name or remove config groups using it."
+                    )
+                else:
+                    plan.replaces, plan.state = existing_id, "replaced"
+                    plan.builder.add_profile_name_and_description(
+                        FeatureProfileCreationPayload(name=plan.temporary_name, description=plan.description)
+                    )
+
+        # Profiles are independent, they are built concurrently with session established above
+        to_build = [plan for plan in plans if plan.id is None]
+        failed = []
+        for plan, build_report, exception in run_concurrently(
+            build_profile, to_build, module.params.get("max_concurrency")
+        ):
+            if exception is not None:
+                failed.append(f"{plan.name}: {module.get_exception_string(exception)}")
+            elif len(build_report.failed_parcels) > 0:
+                # Profile was created without some parcels
+                plan.id = str(build_report.profile_uuid)
+                failed.append(
+                    "Failed to create {} parcels for profile {}."
+                    "Build report: {}".format(len(build_report.failed_parcels), plan.name, build_report)
+                )
+            else:
+                plan.id = str(build_report.profile_uuid)
+            result.changed = True
+        if failed:
+            result.msg = (
+                "Failed to build feature profiles: " + "; ".join(failed) + ". Existing profiles were not changed."
+            )
+            not_deleted = delete_built_replacements(module, plans)
+            if not_deleted:
+                result.msg += " Delete temporary profiles before re-running the module: " + ", ".join(not_deleted)
+            result.profiles = profiles_result(plans)
+            module.fail_json(**result.model_dump(mode="json"))
+        result.profiles = profiles_result(plans)
+        replace_profiles(module, result, plans)
+
+        profile_ids = [plan.id for plan in plans]
+        if config_group is None:
+            response = module.session.api.config_group.create(name, description, "sdwan", profile_ids)
+            result.response = response.model_dump(mode="json")
+            result.changed = True
+            result.id = str(response.id)
+        else:
+            result.id = str(config_group.id)
+            existing_ids = {profile.id for profile in config_group.profiles or []}
+            if existing_ids != set(profile_ids) or (config_group.description or "") != (description or ""):
+                response = module.session.api.config_group.edit(result.id, name, description, "sdwan", profile_ids)
+                result.response = response.model_dump(mode="json")
+                result.changed = True
 
         module.exit_json(**result.model_dump(mode="json"))
     except Exception as exception:
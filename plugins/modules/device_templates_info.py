@@ -121,6 +121,9 @@ author:
   - Arkadiusz Cichon (acichon@cisco.com)
 extends_documentation_fragment:
   - cisco.catalystwan.manager_authentication
+  - cisco.catalystwan.fields_projection
+  - cisco.catalystwan.output_file
+  - cisco.catalystwan.fleet_state
 notes:
   - Ensure that the provided credentials have sufficient permissions to manage templates and devices in vManage.
 """
@@ -166,6 +169,29 @@ changed:
   type: bool
   returned: always
   sample: false
+fleet_state:
+  description:
+    - Snapshot of records stored in C(fleet_state_db), C(id) is used by C(cisco.catalystwan.fleet_state_info).
+    - Templates are stored as C(templates) snapshot. Devices attached to templates are stored as
+      C(template_attachments) snapshot returned in C(attachments), one record per template and device.
+  returned: when C(fleet_state_db) is set
+  type: dict
+  sample:
+    path: /var/lib/catalystwan/fleet.db
+    id: 12
+    kind: templates
+    scope: ""
+    manager: 192.0.2.1
+    created_at: "2024-06-01T10:15:30.123456+00:00"
+    records: 42
+    attachments:
+      path: /var/lib/catalystwan/fleet.db
+      id: 13
+      kind: template_attachments
+      scope: ""
+      manager: 192.0.2.1
+      created_at: "2024-06-01T10:15:31.654321+00:00"
+      records: 120
 """
 
 import json
@@ -179,6 +205,9 @@ from catalystwan.session import ManagerHTTPError
 from catalystwan.typed_list import DataSequence
 from pydantic import BaseModel, Field
 
+from ..module_utils.fleet_state import TEMPLATE_ATTACHMENTS, TEMPLATES, fleet_state_argument_spec, store_fleet_state
+from ..module_utils.output_file import output_file_argument_spec, write_output_file
+from ..module_utils.projection import project_records, projection_argument_spec
 from ..module_utils.result import ModuleResult
 from ..module_utils.vmanage_module import AnsibleCatalystwanModule
 
@@ -191,38 +220,87 @@ class BackupPathModel(BaseModel):
 
 class ExtendedModuleResult(ModuleResult):
     templates_info: Optional[Dict] = Field(default={})
+    output: Optional[Dict] = Field(default={})
+    fleet_state: Optional[Dict] = Field(default={})
     backup_paths: Optional[List[BackupPathModel]] = Field(default=[])
 
 
+def get_template_attachments(
+    module: AnsibleCatalystwanModule, templates: DataSequence[DeviceTemplateInformation]
+) -> List[Dict]:
+    """
+    Devices attached to templates, one record per template and device.
+    Only templates with attached devices are queried.
+    """
+    attachments = []
+    for template in templates:
+        if not template.devices_attached:
+            continue
+        response = module.get_response_safely(
+            module.session.get, url=f"dataservice/template/device/config/attached/{template.id}"
+        )
+        for device in response.json().get("data", []):
+            attachments.append(
+                dict(
+                    device,
+                    id=f"{template.id}/{device.get('uuid')}",
+                    template_id=template.id,
+                    template_name=template.name,
+                    host_name=device.get("host-name"),
+                    system_ip=device.get("local-system-ip", device.get("deviceIP")),
+                )
+            )
+    return attachments
+
+
 def run_module():
     module_args = dict(
         filters=dict(type="dict", default=None, required=False),
         backup=dict(type=bool, default=False),
         backup_dir_path=dict(type="path", default=PurePath(Path.cwd() / "backup")),
+        **projection_argument_spec(),
+        **output_file_argument_spec(),
+        **fleet_state_argument_spec(),
     )
     result = ExtendedModuleResult()
 
     module = AnsibleCatalystwanModule(argument_spec=module_args)
 
     filters = module.params.get("filters")
+    fields = module.params.get("fields")
+    exclude_fields = module.params.get("exclude_fields")
     filtered_templates = DataSequence(DeviceTemplateInformation)
 
     all_templates: DataSequence[DeviceTemplateInformation] = module.get_response_safely(
         module.session.api.templates.get, template=DeviceTemplate
     )
 
+    if module.params.get("fleet_state_db"):
+        result.fleet_state = store_fleet_state(module, TEMPLATES, project_records(all_templates), key_field="id")
+        # Attachments are stored separately, so attaching template to another device changes a record
+        # of that template and device instead of only the number of devices attached to the template
+        result.fleet_state["attachments"] = store_fleet_state(
+            module, TEMPLATE_ATTACHMENTS, get_template_attachments(module, all_templates), key_field="id"
+        )
+
     if filters:
         filtered_templates = all_templates.filter(**filters)
         if filtered_templates:
             module.logger.info(f"All Device Templates filtered with filters: {filters}:\n{filtered_templates}")
             result.msg = "Succesfully got all requested Device Templates Info from vManage"
-            result.templates_info = [template for template in filtered_templates]
+            if module.params.get("output_file"):
+                result.output = write_output_file(module, filtered_templates)
+            else:
+                result.templates_info = project_records(filtered_templates, fields, exclude_fields)
         else:
             module.logger.warning(msg=f"Device templates filtered with `{filters}` not present.")
             result.msg = f"Device templates filtered with `{filters}` not present on vManage."
     else:
         result.msg = "Succesfully got all Device Templates Info from vManage"
-        result.templates_info = [template for template in all_templates]
+        if module.params.get("output_file"):
+            result.output = write_output_file(module, all_templates)
+        else:
+            result.templates_info = project_records(all_templates, fields, exclude_fields)
 
     if module.params.get("backup"):
         backup_dir_path: Path = Path(module.params.get("backup_dir_path"))
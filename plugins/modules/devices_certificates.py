@@ -14,6 +14,8 @@ description:
   - This module manages the certificates for devices in vManage.
   - It can generate a Certificate Signing Request (CSR), send configuration to controllers,
     send configuration to vBond, invalidate certificates, and change the validity of the device list.
+  - CSRs can be generated for many devices at once with C(generate_csr_targets), and the module can wait
+    until certificates are installed on a list of controllers with C(wait_for_certificates).
 options:
   generate_csr:
     description:
@@ -58,6 +60,104 @@ options:
         type: str
         choices: [ "valid", "invalid" ]
         required: True
+  vedge_list_validity:
+    description:
+      - Change validity of many devices in the list at once.
+      - All chassis numbers are sent in single request, or in requests of C(chunk_size) devices.
+        Requests are sent one after another, every one is tracked as a task if C(wait_for_completed) is set.
+      - When used together with C(send_to_controllers), device list is sent to controllers once,
+        after validity of all devices was changed.
+    type: dict
+    version_added: "0.3.4"
+    suboptions:
+      chasis_numbers:
+        description:
+          - Chassis numbers of the devices. Duplicates are sent once.
+        type: list
+        elements: str
+        required: True
+      validity:
+        description:
+          - Desired validity state for the devices.
+        type: str
+        choices: [ "valid", "invalid" ]
+        required: True
+      chunk_size:
+        description:
+          - Maximum number of devices in single request.
+          - Value lower than 1 sends all devices in single request.
+        type: int
+        default: 0
+  generate_csr_targets:
+    description:
+      - Generate CSR for many devices concurrently, up to C(max_concurrency) at a time.
+      - CSR is not generated for device which already has certificate installed.
+    type: list
+    elements: dict
+    version_added: "0.3.4"
+    suboptions:
+      device_ip:
+        description:
+          - Target device IP address.
+        type: str
+        required: True
+      manager_authentication:
+        description:
+          - Credentials of Manager on which CSR is generated, for example when every vManage of a cluster
+            generates its own CSR. Defaults to C(manager_authentication) of the module.
+        type: dict
+        suboptions:
+          url:
+            description:
+              - The URL of the Manager.
+            type: str
+            required: True
+          username:
+            description:
+              - The username for authentication.
+            type: str
+            required: True
+          password:
+            description:
+              - The password for authentication.
+            type: str
+            required: True
+          port:
+            description:
+              - The port of the Manager.
+            type: str
+  max_concurrency:
+    description:
+      - Maximum number of CSRs generated at the same time.
+    type: int
+    default: 4
+    version_added: "0.3.4"
+  wait_for_certificates:
+    description:
+      - IP addresses of controllers to wait for, until all of them are in the controllers inventory
+        with C(cert_install_status) C(Installed).
+      - Inventory is fetched once per C(wait_interval_seconds) for all controllers.
+        Module fails with list of controllers without certificate when C(wait_timeout_seconds) is reached.
+    type: list
+    elements: str
+    version_added: "0.3.4"
+  wait_timeout_seconds:
+    description:
+      - The maximum time to wait for certificates of C(wait_for_certificates) to be installed.
+    type: int
+    default: 200
+    version_added: "0.3.4"
+  wait_interval_seconds:
+    description:
+      - Interval between checks of controllers inventory.
+    type: int
+    default: 10
+    version_added: "0.3.4"
+  wait_for_completed:
+    description:
+      - Whether to wait for tasks started by the actions to complete.
+    type: bool
+    default: True
   device_ip:
     description:
       - Target device IP address.
@@ -74,6 +174,8 @@ notes:
   - Actions are mutually exclusive and only one action can be performed at a time.
   - At least one of the action options must be provided.
   - The 'invalidate' option requires either 'device_ip' or 'uuid' to identify the device.
+  - The 'send_to_controllers' action is performed after validity of devices was changed.
+  - Waiting for certificates is performed after all other actions.
 
 extends_documentation_fragment:
   - cisco.catalystwan.manager_authentication
@@ -95,6 +197,40 @@ response:
   returned: when API call is made
   type: dict
   sample: {"status": "success", "details": "CSR generated successfully."}
+csr_targets:
+  description:
+    - Outcome for every device from C(generate_csr_targets), in the same order.
+    - C(status) is C(installed) when device already had certificate installed, C(generated) when CSR was
+      generated and C(failed) when CSR could not be generated.
+  returned: when C(generate_csr_targets) is set
+  type: list
+  elements: dict
+  sample:
+    - device_ip: 192.168.1.1
+      status: generated
+      msg: ""
+certificates:
+  description:
+    - Certificate install status of every controller from C(wait_for_certificates), from the last check.
+    - C(cert_install_status) is null when controller is not in the controllers inventory.
+  returned: when C(wait_for_certificates) is set
+  type: list
+  elements: dict
+  sample:
+    - device_ip: 192.168.1.1
+      host_name: vsmart-1
+      cert_install_status: Installed
+vedge_list_validity:
+  description:
+    - Result of every request sent for C(vedge_list_validity), in order of chassis numbers.
+    - C(status) is C(Started) when module didn't wait for the task.
+  returned: when C(vedge_list_validity) is set
+  type: list
+  elements: dict
+  sample:
+    - task_id: 5ec6ac1d-5d64-4b3d-9d2a-0d0b2f6b8e4a
+      devices: 500
+      status: Success
 """
 
 EXAMPLES = r"""
@@ -104,6 +240,29 @@ EXAMPLES = r"""
     device_ip: "192.168.1.1"
     generate_csr: true
 
+# Example of using the module to generate CSR on every vManage of a cluster
+- name: Generate CSR for vManages
+  cisco.catalystwan.devices_certificates:
+    generate_csr_targets:
+      - device_ip: "192.168.1.1"
+        manager_authentication:
+          url: "10.0.0.1"
+          username: "admin"
+          password: "admin"  # pragma: allowlist secret
+      - device_ip: "192.168.1.2"
+        manager_authentication:
+          url: "10.0.0.2"
+          username: "admin"
+          password: "admin"  # pragma: allowlist secret
+
+# Example of using the module to wait until certificates are installed on controllers
+- name: Wait until certificates are installed
+  cisco.catalystwan.devices_certificates:
+    wait_for_certificates:
+      - "192.168.1.1"
+      - "192.168.1.3"
+    wait_timeout_seconds: 300
+
 # Example of using the module to invalidate a device's certificates
 - name: Invalidate device certificates
   cisco.catalystwan.devices_certificates:
@@ -116,14 +275,169 @@ EXAMPLES = r"""
     change_vedge_list_validity:
       chasis_number: "123456"
       validity: "invalid"
+
+# Example of using the module to invalidate many devices and send the list to controllers once
+- name: Invalidate devices and send to controllers
+  cisco.catalystwan.devices_certificates:
+    vedge_list_validity:
+      chasis_numbers: "{{ devices | map(attribute='chasis_number') }}"
+      validity: "invalid"
+      chunk_size: 500
+    send_to_controllers: true
 """
 
+import time
+import traceback
+from typing import TYPE_CHECKING, Dict, List
+
 from catalystwan.endpoints.certificate_management_device import TargetDevice, Validity, VedgeListValidityPayload
+from catalystwan.endpoints.configuration_device_inventory import DeviceDetailsResponse
+from catalystwan.typed_list import DataSequence
+from catalystwan.utils.operation_status import OperationStatus
+from pydantic import Field
 
+from ..module_utils.concurrency import chunked, run_concurrently
 from ..module_utils.filters import get_target_device
 from ..module_utils.result import ModuleResult
 from ..module_utils.vmanage_module import AnsibleCatalystwanModule
 
+if TYPE_CHECKING:
+    from catalystwan.session import ManagerSession
+
+STARTED = "Started"
+INSTALLED = "Installed"
+
+
+class ExtendedModuleResult(ModuleResult):
+    vedge_list_validity: List[Dict] = Field(default=[])
+    csr_targets: List[Dict] = Field(default=[])
+    certificates: List[Dict] = Field(default=[])
+
+
+def generate_csr_with_session(
+    module: AnsibleCatalystwanModule,
+    session: "ManagerSession",
+    device_ip: str,
+    controllers: DataSequence[DeviceDetailsResponse],
+) -> str:
+    target_device_details = controllers.filter(device_ip=device_ip).single_or_default()
+    if target_device_details is not None and target_device_details.cert_install_status == INSTALLED:
+        return "installed"
+    with module.measure_operation("devices_certificates:generate_csr"):
+        session.endpoints.certificate_management_device.generate_csr(payload=TargetDevice(deviceIP=device_ip))
+    return "generated"
+
+
+def generate_csr_for_targets(module: AnsibleCatalystwanModule, result: ExtendedModuleResult) -> None:
+    targets = module.params["generate_csr_targets"]
+    default_url = module.params["manager_credentials"]["url"]
+    # Session with default Manager is established before targets are processed in worker threads
+    default_session = module.session
+    # Controllers inventory is shared by the cluster, so it is fetched once instead of once per target
+    inventory = default_session.endpoints.configuration_device_inventory
+    controllers = module.get_response_safely(inventory.get_device_details, device_category="controllers")
+
+    def generate_csr(target: Dict) -> str:
+        credentials = target.get("manager_authentication")
+        if credentials is None or credentials["url"] == default_url:
+            return generate_csr_with_session(module, default_session, target["device_ip"], controllers)
+        with module.measure_login():
+            session = module.catalystwan.create_manager_session(
+                url=credentials["url"],
+                username=credentials["username"],
+                password=credentials["password"],
+                port=credentials.get("port"),
+            )
+        if module.metrics is not None:
+            session.hooks["response"].append(module.metrics.response_hook)
+        with session:
+            return generate_csr_with_session(module, session, target["device_ip"], controllers)
+
+    for target, status, exception in run_concurrently(generate_csr, targets, module.params["max_concurrency"]):
+        outcome = dict(device_ip=target["device_ip"], status=status, msg="")
+        if exception is not None:
+            outcome.update(status="failed", msg=f"Could not generate CSR: {module.get_exception_string(exception)}")
+        elif status == "generated":
+            result.changed = True
+        result.csr_targets.append(outcome)
+
+    failed = [outcome for outcome in result.csr_targets if outcome["status"] == "failed"]
+    if failed:
+        result.msg = f"Could not generate CSR for {len(failed)} of {len(targets)} devices"
+        module.fail_json(**result.model_dump(mode="json"))
+    result.msg += f"CSR generated for {sum(o['status'] == 'generated' for o in result.csr_targets)} devices.\n"
+
+
+def wait_for_certificates(module: AnsibleCatalystwanModule, result: ExtendedModuleResult) -> None:
+    device_ips = list(dict.fromkeys(module.params["wait_for_certificates"]))
+    interval = module.params["wait_interval_seconds"]
+    deadline = time.monotonic() + module.params["wait_timeout_seconds"]
+    inventory = module.session.endpoints.configuration_device_inventory
+
+    with module.measure_task_wait():
+        while True:
+            controllers = module.get_response_safely(inventory.get_device_details, device_category="controllers")
+            by_ip = {device.device_ip: device for device in controllers}
+            result.certificates = [
+                dict(
+                    device_ip=device_ip,
+                    host_name=by_ip[device_ip].host_name if device_ip in by_ip else None,
+                    cert_install_status=by_ip[device_ip].cert_install_status if device_ip in by_ip else None,
+                )
+                for device_ip in device_ips
+            ]
+            laggards = [
+                device["device_ip"] for device in result.certificates if device["cert_install_status"] != INSTALLED
+            ]
+            if not laggards or time.monotonic() + interval > deadline:
+                break
+            time.sleep(interval)
+
+    if laggards:
+        result.msg = f"Certificate not installed on {len(laggards)} of {len(device_ips)} controllers: {laggards}"
+        module.fail_json(**result.model_dump(mode="json"))
+    result.msg += f"Certificate installed on all {len(device_ips)} controllers.\n"
+
+
+def change_vedge_list_validity_in_chunks(module: AnsibleCatalystwanModule, result: ExtendedModuleResult) -> None:
+    params = module.params["vedge_list_validity"]
+    chasis_numbers = list(dict.fromkeys(params["chasis_numbers"]))
+    certificate_management_device = module.session.endpoints.certificate_management_device
+
+    for chunk in chunked(chasis_numbers, params["chunk_size"]):
+        payload = [
+            VedgeListValidityPayload(chasis_number=chasis_number, validity=params["validity"])
+            for chasis_number in chunk
+        ]
+        try:
+            with module.measure_operation("devices_certificates:change_vedge_list_validity"):
+                response = certificate_management_device.change_vedge_list_validity(payload=payload)
+            chunk_result = dict(task_id=response.id, devices=len(chunk), status=STARTED)
+            result.vedge_list_validity.append(chunk_result)
+            result.changed = True
+
+            if module.params.get("wait_for_completed"):
+                with module.measure_task_wait():
+                    task_result = module.catalystwan.Task(module.session, response.id).wait_for_completed()
+                chunk_result["status"] = (
+                    OperationStatus.SUCCESS.value if task_result.result else OperationStatus.FAILURE.value
+                )
+                if not task_result.result:
+                    result.msg = (
+                        f"Couldn't change validity of {len(chunk)} devices, "
+                        f"task {response.id} failed or task has reached timeout."
+                    )
+                    module.fail_json(**result.model_dump(mode="json"))
+
+        except module.catalystwan.ManagerHTTPError as ex:
+            result.msg = (
+                f"Could not perform 'Change edge list validity' action for {len(chunk)} devices.\n"
+                f"Manager error: {str(ex)} {ex.info}"
+            )
+            module.fail_json(**result.model_dump(mode="json"), exception=traceback.format_exc())
+
+    result.msg += f"Validity of {len(chasis_numbers)} devices changed to {params['validity']}.\n"
+
 
 def run_module():
     module_args = dict(
@@ -140,6 +454,34 @@ def run_module():
                 validity=dict(type=str, choices=[Validity.VALID, Validity.INVALID], required=True),
             ),
         ),
+        vedge_list_validity=dict(
+            type="dict",
+            options=dict(
+                chasis_numbers=dict(type="list", elements="str", required=True),
+                validity=dict(type="str", choices=[Validity.VALID.value, Validity.INVALID.value], required=True),
+                chunk_size=dict(type="int", default=0),
+            ),
+        ),
+        generate_csr_targets=dict(
+            type="list",
+            elements="dict",
+            options=dict(
+                device_ip=dict(type="str", required=True),
+                manager_authentication=dict(
+                    type="dict",
+                    options=dict(
+                        url=dict(type="str", required=True),
+                        username=dict(type="str", required=True),
+                        password=dict(type="str", required=True, no_log=True),
+                        port=dict(type="str"),
+                    ),
+                ),
+            ),
+        ),
+        max_concurrency=dict(type="int", default=4),
+        wait_for_certificates=dict(type="list", elements="str"),
+        wait_timeout_seconds=dict(type="int", default=200),
+        wait_interval_seconds=dict(type="int", default=10),
         device_ip=dict(type=str, aliases=["target_ip"]),
         uuid=dict(type=str),
         wait_for_completed=dict(type="bool", default=True),
@@ -152,12 +494,24 @@ def run_module():
             ("invalidate", "send_to_controllers"),
             ("invalidate", "send_to_vbond"),
             ("invalidate", "change_vedge_list_validity"),
+            ("invalidate", "vedge_list_validity"),
+            ("change_vedge_list_validity", "vedge_list_validity"),
+            ("generate_csr", "generate_csr_targets"),
         ],
         required_one_of=[
-            ("invalidate", "generate_csr", "send_to_controllers", "send_to_vbond", "change_vedge_list_validity")
+            (
+                "invalidate",
+                "generate_csr",
+                "send_to_controllers",
+                "send_to_vbond",
+                "change_vedge_list_validity",
+                "vedge_list_validity",
+                "generate_csr_targets",
+                "wait_for_certificates",
+            )
         ],
     )
-    result = ModuleResult()
+    result = ExtendedModuleResult()
 
     invalidate_device = False
 
@@ -208,15 +562,8 @@ def run_module():
             response_key="generate_csr",
         )
 
-    if module.params.get("send_to_controllers"):
-        module.execute_action_safely(
-            result,
-            action_name="send to controllers",
-            send_func=module.session.endpoints.certificate_management_device.send_to_controllers,
-            success_msg="Send to controllers completed.\n",
-            failure_msg="Couldn't send to controllers, task failed or task has reached timeout.",
-            wait_for_completed=module.params.get("wait_for_completed"),
-        )
+    if module.params.get("generate_csr_targets"):
+        generate_csr_for_targets(module, result)
 
     if module.params.get("send_to_vbond"):
         module.execute_action_safely(
@@ -240,6 +587,23 @@ def run_module():
             wait_for_completed=module.params.get("wait_for_completed"),
         )
 
+    if module.params.get("vedge_list_validity"):
+        change_vedge_list_validity_in_chunks(module, result)
+
+    # Device list is sent to controllers once, after validity of devices was changed
+    if module.params.get("send_to_controllers"):
+        module.execute_action_safely(
+            result,
+            action_name="send to controllers",
+            send_func=module.session.endpoints.certificate_management_device.send_to_controllers,
+            success_msg="Send to controllers completed.\n",
+            failure_msg="Couldn't send to controllers, task failed or task has reached timeout.",
+            wait_for_completed=module.params.get("wait_for_completed"),
+        )
+
+    if module.params.get("wait_for_certificates"):
+        wait_for_certificates(module, result)
+
     # ----------------------------------#
     # STEP 4 - update and return result #
     # ----------------------------------#
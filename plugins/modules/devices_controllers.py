@@ -13,6 +13,9 @@ description:
   - This module can be used to add or invalidate controller devices in vManage.
   - It supports the creation of a new device with a generated CSR and specifies the device personality.
   - When invalidating, it requires either the UUID or device IP to identify the device.
+  - List of controllers can be added in single run with C(controllers). Presence of all of them is checked
+    against single fetch of controllers inventory and missing ones are created concurrently,
+    up to C(max_concurrency) at a time.
 options:
   state:
     description:
@@ -60,6 +63,61 @@ options:
     description:
       - Hostname of the device.
     type: str
+  controllers:
+    description:
+      - List of controllers to add. Can't be used together with C(device_ip), C(uuid) and C(hostname).
+      - Only C(state=present) is supported for list of controllers.
+      - Controller is present when device with the same C(hostname) exists in controllers inventory,
+        or with the same C(device_ip) if C(hostname) is not set.
+    type: list
+    elements: dict
+    version_added: "0.3.4"
+    suboptions:
+      username:
+        description:
+          - Username for the device being managed.
+        type: str
+        required: true
+      password:
+        description:
+          - Password for the device being managed.
+        type: str
+        required: true
+      personality:
+        description:
+          - Personality of the device.
+        type: str
+        choices: ["vsmart", "vbond", "vmanage"]
+        required: true
+      generate_csr:
+        description:
+          - Whether to generate a CSR (Certificate Signing Request) for the device.
+        type: bool
+        default: True
+      port:
+        description:
+          - Port used by the device.
+        type: str
+      protocol:
+        description:
+          - Protocol used by the device.
+        type: str
+        choices: ["DTLS", "TLS"]
+      device_ip:
+        description:
+          - Transport IP address of the device.
+        type: str
+        required: true
+      hostname:
+        description:
+          - Hostname of the device.
+        type: str
+  max_concurrency:
+    description:
+      - Maximum number of controllers created at the same time, when C(controllers) is set.
+    type: int
+    default: 4
+    version_added: "0.3.4"
 author:
   - Arkadiusz Cichon (acichon@cisco.com)
 notes:
@@ -67,6 +125,7 @@ notes:
   - "The 'state' option 'invalidated' will delete the device configuration in vManage."
   - "For 'present' state, 'username', 'password', 'personality', and 'device_ip' are required."
   - "For 'invalidated' state, either 'uuid' or 'device_ip' is required."
+  - "Module fails when any controller from 'controllers' list could not be created."
 extends_documentation_fragment:
   - cisco.catalystwan.manager_authentication
 """
@@ -82,6 +141,20 @@ response:
   returned: when API call is made
   type: dict
   sample: {"status": "success", "details": "Device added successfully."}
+controllers:
+  description:
+    - Outcome for every controller from C(controllers), in the same order.
+    - C(status) is C(present) when controller was already in the inventory, C(created) when it was added
+      and C(failed) when it could not be added.
+  returned: when C(controllers) is set
+  type: list
+  elements: dict
+  sample:
+    - device_ip: 192.168.1.1
+      hostname: vsmart-1
+      personality: vsmart
+      status: created
+      msg: "Added new device: 192.168.1.1, personality: vsmart"
 changed:
   description: Whether or not the state was changed.
   returned: always
@@ -104,15 +177,99 @@ EXAMPLES = r"""
   cisco.catalystwan.devices_controllers:
     uuid: "1234-5678-9abc-def0"
     state: "invalidated"
+
+# Example of using the module to add all vSmart and vBond controllers in single task
+- name: Add controllers
+  cisco.catalystwan.devices_controllers:
+    controllers:
+      - device_ip: "192.168.1.1"
+        hostname: "vsmart-1"
+        username: "admin"
+        password: "admin"  # pragma: allowlist secret
+        personality: "vsmart"
+      - device_ip: "192.168.1.2"
+        hostname: "vbond-1"
+        username: "admin"
+        password: "admin"  # pragma: allowlist secret
+        personality: "vbond"
+    max_concurrency: 8
+  register: controllers_result
 """
 
-from catalystwan.endpoints.configuration_device_inventory import DeviceCreationPayload
+from typing import Dict, List
+
+from catalystwan.endpoints.configuration_device_inventory import DeviceCreationPayload, DeviceDetailsResponse
+from catalystwan.typed_list import DataSequence
 from catalystwan.utils.personality import Personality
+from pydantic import Field
 
+from ..module_utils.concurrency import run_concurrently
 from ..module_utils.filters import get_target_device
 from ..module_utils.result import ModuleResult
 from ..module_utils.vmanage_module import AnsibleCatalystwanModule
 
+CONTROLLER_KEYS = ("username", "password", "personality", "generate_csr", "port", "protocol", "device_ip")
+
+
+class ExtendedModuleResult(ModuleResult):
+    controllers: List[Dict] = Field(default=[])
+
+
+def is_present(controller: Dict, inventory: DataSequence[DeviceDetailsResponse]) -> bool:
+    # Same precedence as get_target_device: hostname wins over device_ip
+    if controller.get("hostname"):
+        return inventory.filter(host_name=controller["hostname"]).single_or_default() is not None
+    return inventory.filter(device_ip=controller["device_ip"]).single_or_default() is not None
+
+
+def add_controllers(module: AnsibleCatalystwanModule, result: ExtendedModuleResult) -> None:
+    controllers = module.params["controllers"]
+    inventory = get_target_device(module=module, device_category="controllers", all_from_category=True)
+
+    outcomes = [
+        dict(
+            device_ip=controller["device_ip"],
+            hostname=controller.get("hostname"),
+            personality=controller["personality"],
+            status="present" if is_present(controller, inventory) else None,
+            msg="",
+        )
+        for controller in controllers
+    ]
+    missing = [index for index, outcome in enumerate(outcomes) if outcome["status"] is None]
+
+    # Session is established before devices are created from worker threads
+    device_inventory = module.session.endpoints.configuration_device_inventory
+
+    def create(index: int) -> DeviceCreationPayload:
+        controller = controllers[index]
+        payload = DeviceCreationPayload(
+            **{key: controller[key] for key in CONTROLLER_KEYS if controller.get(key) is not None}
+        )
+        with module.measure_operation("devices_controllers:create_device"):
+            device_inventory.create_device(payload=payload)
+        return payload
+
+    for index, payload, exception in run_concurrently(create, missing, module.params["max_concurrency"]):
+        if exception is not None:
+            outcomes[index].update(
+                status="failed", msg=f"Could not add device: {module.get_exception_string(exception)}"
+            )
+            continue
+        result.changed = True
+        outcomes[index].update(
+            status="created", msg=f"Added new device: {payload.device_ip}, personality: {payload.personality.value}"
+        )
+
+    result.controllers = outcomes
+    failed = [outcome for outcome in outcomes if outcome["status"] == "failed"]
+    if failed:
+        result.msg = f"Could not add {len(failed)} of {len(outcomes)} controllers"
+        module.fail_json(**result.model_dump(mode="json"))
+    created = len(missing)
+    result.msg = f"Added {created} new controllers, {len(outcomes) - created} already present"
+    module.exit_json(**result.model_dump(mode="json"))
+
 
 def run_module():
     module_args = dict(
@@ -130,10 +287,37 @@ def run_module():
         device_ip=dict(type=str),  # Add hint that unlike in GUI it has to be transport ip
         uuid=dict(type=str),
         hostname=dict(type="str"),
+        controllers=dict(
+            type="list",
+            elements="dict",
+            options=dict(
+                username=dict(type="str", required=True),
+                password=dict(type="str", required=True, no_log=True),
+                personality=dict(
+                    type="str",
+                    required=True,
+                    choices=[Personality.VSMART.value, Personality.VBOND.value, Personality.VMANAGE.value],
+                ),
+                generate_csr=dict(type="bool", default=True),
+                port=dict(type="str"),
+                protocol=dict(type="str", choices=["DTLS", "TLS"]),
+                device_ip=dict(type="str", required=True),
+                hostname=dict(type="str"),
+            ),
+        ),
+        max_concurrency=dict(type="int", default=4),
+    )
+
+    module = AnsibleCatalystwanModule(
+        argument_spec=module_args,
+        mutually_exclusive=[("controllers", "device_ip"), ("controllers", "uuid"), ("controllers", "hostname")],
     )
+    result = ExtendedModuleResult()
 
-    module = AnsibleCatalystwanModule(argument_spec=module_args)
-    result = ModuleResult()
+    if module.params["controllers"] is not None:
+        if module.params["state"] != "present":
+            module.fail_json(msg="Only state 'present' is supported for list of controllers")
+        add_controllers(module, result)
 
     # Check if state is present and required parameters are not set
     if module.params["state"] == "present" and (
@@ -13,6 +13,8 @@ description:
   - This module retrieves details about devices in vManage.
   - It can filter the retrieved device information based on specified criteria.
   - This module supports backup of running-config from devices. Available for all or filtered devices.
+  - With C(drift), running-config of devices is compared with their last backup and unified diff is returned
+    only for devices which configuration drifted.
 options:
   device_category:
     description:
@@ -41,6 +43,38 @@ options:
     description:
       - Directory to store the backup. It's created if missing. Defaults to a 'backup' folder in the current directory.
     type: path
+  drift:
+    description:
+      - Compare running-config of filtered devices with their last backup in C(backup_dir_path).
+      - Lines matching C(drift_ignore_lines) and empty lines are removed from both configs, and configs are compared
+        by hash. Hashes of backups are stored in C(.running_config_hashes.json) file in C(backup_dir_path),
+        so backup file is read only when device drifted.
+      - Only devices which drifted, have no backup or which config could not be fetched are returned in C(drift).
+      - With C(backup), running-config is compared with the previous backup and then saved as the new backup.
+    type: bool
+    default: false
+    version_added: "0.3.4"
+  drift_ignore_lines:
+    description:
+      - Regular expressions of volatile lines of running-config, like timestamps and uptime, ignored by C(drift).
+    type: list
+    elements: str
+    default:
+      - "^Building configuration"
+      - "^Current configuration\\s*:"
+      - "^!\\s*Last configuration change"
+      - "^!\\s*NVRAM config last updated"
+      - "^!\\s*No configuration change since last restart"
+      - "^!\\s*Time:"
+      - "^\\s*ntp clock-period"
+      - "^!.*[Uu]ptime"
+    version_added: "0.3.4"
+  max_concurrency:
+    description:
+      - Maximum number of running-configs fetched from Manager at the same time with C(backup) or C(drift).
+    type: int
+    default: 4
+    version_added: "0.3.4"
 author:
   - Arkadiusz Cichon (acichon@cisco.com)
 
@@ -48,9 +82,13 @@ notes:
   - The C(filters) option allows for specifying filtering criteria such as device model, status, etc.
   - The C(backup) option doesn't allow to specify backup file path, it only allows to specify directory
     Backup files are always stored in format of f"{base_filename}_{timestamp}
+  - The C(drift) option compares running-config with the latest backup file of device hostname in C(backup_dir_path).
 
 extends_documentation_fragment:
   - cisco.catalystwan.manager_authentication
+  - cisco.catalystwan.fields_projection
+  - cisco.catalystwan.output_file
+  - cisco.catalystwan.fleet_state
 
 """
 
@@ -76,6 +114,49 @@ devices:
         "status": "active"
       }
     ]
+fleet_state:
+  description:
+    - Snapshot of records stored in C(fleet_state_db), C(id) is used by C(cisco.catalystwan.fleet_state_info).
+  returned: when C(fleet_state_db) is set
+  type: dict
+  sample:
+    path: /var/lib/catalystwan/fleet.db
+    id: 12
+    kind: devices
+    scope: all
+    manager: 192.0.2.1
+    created_at: "2024-06-01T10:15:30.123456+00:00"
+    records: 42
+drift:
+  description:
+    - Devices which running-config drifted from their last backup, have no backup (C(no_baseline)),
+      or which running-config could not be fetched (C(failed)).
+  returned: when C(drift) is set
+  type: list
+  elements: dict
+  sample:
+    - hostname: edge-1
+      uuid: C8K-15411CCC-D476-0B3B-21F2-5D6AC387EE7B
+      status: drifted
+      baseline_path: backup/edge-1_01-06-2024-10-15.txt
+      diff: |-
+        --- backup/edge-1_01-06-2024-10-15.txt
+        +++ edge-1 running-config
+        @@ -10,3 +10,3 @@
+         system
+        - host-name edge-1
+        + host-name edge-one
+      msg: null
+drift_summary:
+  description: Number of devices C(checked), C(compliant), C(drifted), with C(no_baseline) and C(failed).
+  returned: when C(drift) is set
+  type: dict
+  sample:
+    checked: 120
+    compliant: 118
+    drifted: 1
+    no_baseline: 1
+    failed: 0
 """
 
 EXAMPLES = r"""
@@ -91,18 +172,52 @@ EXAMPLES = r"""
     filters:
       model: "vedge-1000"
       status: "active"
+
+# Example of using the module to retrieve only selected fields of all devices
+- name: Get uuid, hostname and system ip of all devices
+  cisco.catalystwan.devices_info:
+    fields:
+      - uuid
+      - host_name
+      - system_ip
+
+# Example of using the module to find devices which running-config changed since last backup
+- name: Check running-config drift of edge devices
+  cisco.catalystwan.devices_info:
+    drift: true
+    backup_dir_path: "/var/backups/catalystwan"
+    filters:
+      personality: vedge
+    max_concurrency: 8
+  register: config_drift
+
+# Example of using the module to store devices inventory for queries without contacting Manager
+- name: Store inventory of all devices in fleet state database
+  cisco.catalystwan.devices_info:
+    fields:
+      - uuid
+    fleet_state_db: "/var/lib/catalystwan/fleet.db"
 """
+import difflib
+import hashlib
+import json
+import re
 from datetime import datetime
 from pathlib import Path, PurePath
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from catalystwan.dataclasses import Device
 from catalystwan.endpoints.configuration_device_inventory import DeviceDetailsResponse
 from catalystwan.typed_list import DataSequence
 from pydantic import BaseModel, Field
 
+from ..module_utils.concurrency import run_concurrently
 from ..module_utils.filters import get_target_device
+from ..module_utils.fleet_state import DEVICES, fleet_state_argument_spec, store_fleet_state
+from ..module_utils.output_file import output_file_argument_spec, write_output_file
+from ..module_utils.projection import project_records, projection_argument_spec
 from ..module_utils.result import ModuleResult
+from ..module_utils.shared_state import locked_json_state
 from ..module_utils.vmanage_module import AnsibleCatalystwanModule
 
 
@@ -112,9 +227,101 @@ class BackupPathModel(BaseModel):
     backup_path: str
 
 
+class DriftModel(BaseModel):
+    hostname: str
+    uuid: str
+    status: str
+    baseline_path: Optional[str] = None
+    diff: Optional[str] = None
+    msg: Optional[str] = None
+
+
 class ExtendedModuleResult(ModuleResult):
     devices: Optional[List] = Field(default=[])
     backup_paths: Optional[List[BackupPathModel]] = Field(default=[])
+    output: Optional[Dict] = Field(default={})
+    fleet_state: Optional[Dict] = Field(default={})
+    drift: Optional[List[DriftModel]] = Field(default=[])
+    drift_summary: Optional[Dict] = Field(default={})
+
+
+BACKUP_HASHES_FILE = ".running_config_hashes.json"
+VOLATILE_LINES = [
+    r"^Building configuration",
+    r"^Current configuration\s*:",
+    r"^!\s*Last configuration change",
+    r"^!\s*NVRAM config last updated",
+    r"^!\s*No configuration change since last restart",
+    r"^!\s*Time:",
+    r"^\s*ntp clock-period",
+    r"^!.*[Uu]ptime",
+]
+
+
+def normalize_config(lines: List[str], ignore_lines: List[re.Pattern]) -> List[str]:
+    return [
+        line.rstrip() for line in lines if line.strip() and not any(pattern.search(line) for pattern in ignore_lines)
+    ]
+
+
+def config_hash(lines: List[str], ignore_lines: List[str]) -> str:
+    """
+    Hash of normalized config, together with patterns it was normalized with, so hashes stored with
+    different patterns never match.
+    """
+    digest = hashlib.sha256(json.dumps(ignore_lines).encode("utf-8"))
+    digest.update("\n".join(lines).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def last_backup_path(backup_dir_path: Path, hostname: str) -> Optional[str]:
+    backup_name = re.compile(re.escape(hostname) + r"_\d{2}-\d{2}-\d{4}-\d{2}-\d{2}\.txt")
+    backups = [path for path in backup_dir_path.glob(f"{hostname}_*.txt") if backup_name.fullmatch(path.name)]
+    if not backups:
+        return None
+    return str(max(backups, key=lambda path: path.stat().st_mtime))
+
+
+def read_config(path: str) -> List[str]:
+    with open(path, encoding="utf-8") as file:
+        return file.read().splitlines()
+
+
+def compare_with_backup(
+    device: Device,
+    config: List[str],
+    digest: str,
+    backup_dir_path: Path,
+    hashes: Dict,
+    ignore_lines: List[re.Pattern],
+    ignore_patterns: List[str],
+) -> Optional[DriftModel]:
+    """
+    Drift of normalized running-config from the last backup of device, None when config didn't drift.
+    Hash of the last backup is taken from `hashes` and stored there when backup had to be read.
+    """
+    baseline_path = last_backup_path(backup_dir_path, device.hostname)
+    if baseline_path is None:
+        return DriftModel(hostname=device.hostname, uuid=device.uuid, status="no_baseline")
+
+    stored = hashes.get(device.hostname) or {}
+    baseline = None
+    baseline_hash = stored.get("hash") if stored.get("path") == baseline_path else None
+    if baseline_hash is None:
+        baseline = normalize_config(read_config(baseline_path), ignore_lines)
+        baseline_hash = config_hash(baseline, ignore_patterns)
+        hashes[device.hostname] = dict(uuid=device.uuid, path=baseline_path, hash=baseline_hash)
+    if baseline_hash == digest:
+        return None
+
+    if baseline is None:
+        baseline = normalize_config(read_config(baseline_path), ignore_lines)
+    diff = difflib.unified_diff(
+        baseline, config, fromfile=baseline_path, tofile=f"{device.hostname} running-config", lineterm=""
+    )
+    return DriftModel(
+        hostname=device.hostname, uuid=device.uuid, status="drifted", baseline_path=baseline_path, diff="\n".join(diff)
+    )
 
 
 def run_module():
@@ -128,6 +335,12 @@ def run_module():
         filters=dict(type=dict, default=None),
         backup=dict(type=bool, default=False),
         backup_dir_path=dict(type="path", default=PurePath(Path.cwd() / "backup")),
+        drift=dict(type="bool", default=False),
+        drift_ignore_lines=dict(type="list", elements="str", default=VOLATILE_LINES),
+        max_concurrency=dict(type="int", default=4),
+        **projection_argument_spec(),
+        **output_file_argument_spec(),
+        **fleet_state_argument_spec(),
     )
 
     module = AnsibleCatalystwanModule(
@@ -135,6 +348,7 @@ def run_module():
         mutually_exclusive=[
             ("details", "backup"),
             ("details", "backup_dir_path"),
+            ("details", "drift"),
         ],
     )
     result = ExtendedModuleResult()
@@ -142,28 +356,37 @@ def run_module():
     details = module.params.get("details")
     filters = module.params.get("filters")
     backup = module.params.get("backup")
+    drift = module.params.get("drift")
     backup_dir_path: Path = Path(module.params.get("backup_dir_path"))
+    fields = module.params.get("fields")
+    exclude_fields = module.params.get("exclude_fields")
 
     devices: DataSequence[DeviceDetailsResponse] = get_target_device(
         module, device_category=module.params.get("device_category"), all_from_category=True
     )
 
+    if module.params.get("fleet_state_db"):
+        result.fleet_state = store_fleet_state(
+            module, DEVICES, project_records(devices), key_field="uuid", scope=module.params.get("device_category")
+        )
+
     if not devices:
         module.module.warn("No devices found")
         module.exit_json(**result.model_dump(mode="json"))
 
-    if details and not backup:
+    if details and not backup and not drift:
         if filters:
             filtered_devices: DataSequence[DeviceDetailsResponse] = devices.filter(**filters)
-            if filtered_devices:
-                module.logger.debug(f"All filtered_devices: {filtered_devices}")
-                result.devices = [dev.model_dump(mode="json") for dev in filtered_devices]
-            else:
+            if not filtered_devices:
                 module.module.warn(f"No devices found based on filters: {filters}")
+            module.logger.debug(f"All filtered_devices: {filtered_devices}")
+            devices = filtered_devices or DataSequence(DeviceDetailsResponse)
+        if module.params.get("output_file"):
+            result.output = write_output_file(module, devices)
         else:
-            result.devices = [dev.model_dump(mode="json") for dev in devices]
+            result.devices = project_records(devices, fields, exclude_fields)
 
-    if backup:
+    if backup or drift:
         module.logger.info(f"{backup_dir_path}")
         try:
             backup_dir_path.mkdir(parents=True, exist_ok=True)
@@ -176,16 +399,66 @@ def run_module():
             devices: DataSequence[Device] = module.get_response_safely(module.session.api.devices.get)
 
         if devices:
-            for device in devices:
-                rcfg = module.get_response_safely(module.session.api.templates.load_running, device=device)
-                timestamp = datetime.now().strftime("%d-%m-%Y-%H-%M")
-                filename = f"{device.hostname}_{timestamp}.txt"
-                backup_path = f"{backup_dir_path}/{filename}"
-                rcfg.save_as(backup_path)
-                result.backup_paths.append(
-                    BackupPathModel(hostname=device.hostname, backup_path=backup_path, filename=filename)
+            # Session is established before running-configs are fetched from worker threads
+            templates_api = module.session.api.templates
+
+            def load_running(device: Device):
+                with module.measure_operation("devices_info:load_running"):
+                    return templates_api.load_running(device=device)
+
+            running_configs = run_concurrently(load_running, devices, module.params.get("max_concurrency"))
+            ignore_patterns = module.params.get("drift_ignore_lines")
+            ignore_lines = [re.compile(pattern) for pattern in ignore_patterns]
+            summary = dict(checked=len(devices), compliant=0, drifted=0, no_baseline=0, failed=0)
+            failed = []
+
+            try:
+                with locked_json_state(str(backup_dir_path / BACKUP_HASHES_FILE)) as hashes:
+                    for device, rcfg, exception in running_configs:
+                        if exception is not None:
+                            error = module.get_exception_string(exception)
+                            failed.append(f"{device.hostname}: {error}")
+                            summary["failed"] += 1
+                            if drift:
+                                result.drift.append(
+                                    DriftModel(hostname=device.hostname, uuid=device.uuid, status="failed", msg=error)
+                                )
+                            continue
+
+                        config = normalize_config(rcfg.ioscfg, ignore_lines)
+                        digest = config_hash(config, ignore_patterns)
+
+                        if drift:
+                            device_drift = compare_with_backup(
+                                device, config, digest, backup_dir_path, hashes, ignore_lines, ignore_patterns
+                            )
+                            if device_drift is None:
+                                summary["compliant"] += 1
+                            else:
+                                summary[device_drift.status] += 1
+                                result.drift.append(device_drift)
+
+                        if backup:
+                            timestamp = datetime.now().strftime("%d-%m-%Y-%H-%M")
+                            filename = f"{device.hostname}_{timestamp}.txt"
+                            backup_path = f"{backup_dir_path}/{filename}"
+                            rcfg.save_as(backup_path)
+                            hashes[device.hostname] = dict(uuid=device.uuid, path=backup_path, hash=digest)
+                            result.backup_paths.append(
+                                BackupPathModel(hostname=device.hostname, backup_path=backup_path, filename=filename)
+                            )
+                            result.msg = f"Succesfully saved running configuration to file: {backup_path}"
+            except OSError as ex:
+                module.fail_json(msg=f"Cannot read or write backup in directory: {backup_dir_path}, exception: {ex}")
+
+            if drift:
+                result.drift_summary = summary
+                result.msg = (
+                    f"Running-config of {summary['drifted']} of {summary['checked']} devices drifted from last backup"
                 )
-                result.msg = f"Succesfully saved running configuration to file: {backup_path}"
+            if backup and failed:
+                result.msg = f"Could not load running-config of {len(failed)} devices: {failed}"
+                module.fail_json(**result.model_dump(mode="json"))
         else:
             module.module.warn(f"No devices found based on filters: {filters}")
 
@@ -0,0 +1,291 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+DOCUMENTATION = r"""
+---
+module: devices_wait
+short_description: Waits until devices within vManage reach expected state
+version_added: "0.3.4"
+description:
+  - This module waits until all selected devices from devices inventory match expected values of their fields,
+    for example C(device_state) C(READY) or C(reachability) C(reachable).
+  - Inventory is fetched once per interval for all devices, instead of once per device.
+  - Interval between checks grows with C(backoff_factor) up to C(max_interval_seconds) while no more devices
+    match, and goes back to C(interval_seconds) as soon as any device reaches expected state.
+options:
+  device_category:
+    description:
+      - Category of devices to wait for.
+    type: str
+    choices: ["controllers", "vedges", "all"]
+    default: all
+  devices:
+    description:
+      - Values of C(device_key) field of devices to wait for. Device which is not in the inventory yet
+        doesn't match, so module can also wait until devices are added.
+      - When not set, all devices from C(device_category) matching C(filters) are selected.
+    type: list
+    elements: str
+  device_key:
+    description:
+      - Field of device details identifying devices from C(devices), for example C(uuid), C(chasis_number),
+        C(device_ip) or C(host_name).
+    type: str
+    default: uuid
+  filters:
+    description:
+      - Dictionary of field names and values selecting devices. List value matches any of its elements.
+    type: dict
+  conditions:
+    description:
+      - Dictionary of field names and expected values, which all selected devices have to match.
+        List value matches any of its elements.
+      - Field names are names of device details fields, as returned by C(cisco.catalystwan.devices_info).
+    type: dict
+    required: true
+  timeout_seconds:
+    description:
+      - The maximum time to wait for all devices to match C(conditions).
+    type: int
+    default: 300
+  interval_seconds:
+    description:
+      - Initial interval between checks of devices inventory.
+    type: int
+    default: 5
+  max_interval_seconds:
+    description:
+      - The maximum interval between checks of devices inventory.
+    type: int
+    default: 60
+  backoff_factor:
+    description:
+      - Factor by which interval grows after check in which no more devices matched.
+    type: float
+    default: 1.5
+  fail_on_timeout:
+    description:
+      - Whether to fail when not all devices match C(conditions) before C(timeout_seconds).
+    type: bool
+    default: true
+author:
+  - Arkadiusz Cichon (acichon@cisco.com)
+notes:
+  - When no devices are selected, module waits until C(timeout_seconds) as if selected devices didn't match.
+extends_documentation_fragment:
+  - cisco.catalystwan.manager_authentication
+"""
+
+RETURN = r"""
+msg:
+  description: Message detailing the outcome of the operation.
+  returned: always
+  type: str
+  sample: "All 2 devices match conditions after 3 checks"
+devices:
+  description:
+    - State of every selected device from the last check.
+    - C(mismatched) has actual values of fields which don't match C(conditions).
+    - C(found) is false for devices from C(devices) missing in the inventory.
+  returned: always
+  type: list
+  elements: dict
+  sample:
+    - key: C8K-15411CCC-D476-0B3B-21F2-5D6AC387EE7B
+      uuid: C8K-15411CCC-D476-0B3B-21F2-5D6AC387EE7B
+      host_name: edge-1
+      found: true
+      matched: false
+      mismatched:
+        reachability: unreachable
+matched:
+  description: Whether all selected devices match C(conditions).
+  returned: always
+  type: bool
+  sample: true
+checks:
+  description: Number of inventory checks performed.
+  returned: always
+  type: int
+  sample: 3
+elapsed_seconds:
+  description: Time spent waiting.
+  returned: always
+  type: float
+  sample: 21.5
+changed:
+  description: Whether or not the state was changed. Always false.
+  returned: always
+  type: bool
+  sample: false
+"""
+
+EXAMPLES = r"""
+- name: Wait until edge devices are reachable and certificates are installed
+  cisco.catalystwan.devices_wait:
+    device_category: vedges
+    devices: "{{ edge_devices.devices | map(attribute='chasis_number') }}"
+    device_key: chasis_number
+    conditions:
+      cert_install_status: Installed
+      reachability: reachable
+    timeout_seconds: 600
+    manager_authentication:
+      url: "192.0.2.1"
+      username: "admin"
+      password: "password"  # pragma: allowlist secret
+
+- name: Wait until all vSmarts are in sync
+  cisco.catalystwan.devices_wait:
+    device_category: controllers
+    filters:
+      personality: vsmart
+    conditions:
+      config_status_message: ["In Sync", "Sync Pending"]
+  register: vsmarts
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from catalystwan.endpoints.configuration_device_inventory import DeviceDetailsResponse
+from pydantic import Field
+
+from ..module_utils.result import ModuleResult
+from ..module_utils.vmanage_module import AnsibleCatalystwanModule
+
+
+class ExtendedModuleResult(ModuleResult):
+    devices: List[Dict] = Field(default=[])
+    matched: bool = Field(default=False)
+    checks: int = Field(default=0)
+    elapsed_seconds: float = Field(default=0.0)
+
+
+def value_matches(actual: Any, expected: Any) -> bool:
+    if isinstance(expected, list):
+        return any(value_matches(actual, element) for element in expected)
+    if actual is None or expected is None:
+        return actual is expected
+    # Enums and numbers are compared by their string representation, as given in task arguments
+    return str(getattr(actual, "value", actual)) == str(expected)
+
+
+def field_value(device: DeviceDetailsResponse, name: str) -> Any:
+    value = getattr(device, name, None)
+    return getattr(value, "value", value)
+
+
+def select_devices(
+    inventory: List[DeviceDetailsResponse], filters: Dict, device_key: str
+) -> Dict[str, DeviceDetailsResponse]:
+    return {
+        str(field_value(device, device_key)): device
+        for device in inventory
+        if all(value_matches(field_value(device, name), expected) for name, expected in filters.items())
+    }
+
+
+def device_report(key: str, device: Optional[DeviceDetailsResponse], conditions: Dict) -> Dict:
+    if device is None:
+        return dict(key=key, uuid=None, host_name=None, found=False, matched=False, mismatched={})
+    mismatched = {
+        name: field_value(device, name)
+        for name, expected in conditions.items()
+        if not value_matches(field_value(device, name), expected)
+    }
+    return dict(
+        key=key, uuid=device.uuid, host_name=device.host_name, found=True, matched=not mismatched, mismatched=mismatched
+    )
+
+
+def run_module():
+    module_args = dict(
+        device_category=dict(type="str", choices=["controllers", "vedges", "all"], default="all"),
+        devices=dict(type="list", elements="str"),
+        device_key=dict(type="str", default="uuid", no_log=False),
+        filters=dict(type="dict"),
+        conditions=dict(type="dict", required=True),
+        timeout_seconds=dict(type="int", default=300),
+        interval_seconds=dict(type="int", default=5),
+        max_interval_seconds=dict(type="int", default=60),
+        backoff_factor=dict(type="float", default=1.5),
+        fail_on_timeout=dict(type="bool", default=True),
+    )
+
+    module = AnsibleCatalystwanModule(argument_spec=module_args)
+    result = ExtendedModuleResult()
+
+    device_category = module.params["device_category"]
+    categories = ["controllers", "vedges"] if device_category == "all" else [device_category]
+    wanted = list(dict.fromkeys(module.params["devices"] or []))
+    device_key = module.params["device_key"]
+    filters = module.params["filters"] or {}
+    conditions = module.params["conditions"]
+    interval = module.params["interval_seconds"]
+
+    inventory_api = module.session.endpoints.configuration_device_inventory
+    catalystwan = module.catalystwan
+    start = time.monotonic()
+    deadline = start + module.params["timeout_seconds"]
+    matched_count = 0
+    last_error = None
+
+    with module.measure_task_wait():
+        while True:
+            result.checks += 1
+            try:
+                inventory = []
+                for category in categories:
+                    with module.measure_operation("devices_wait:get_device_details"):
+                        inventory.extend(inventory_api.get_device_details(device_category=category))
+            except (catalystwan.ManagerHTTPError, catalystwan.ManagerRequestException) as ex:
+                # Manager may be temporarily unavailable during bring-up, keep waiting until deadline
+                last_error = module.get_exception_string(ex)
+                module.logger.warning(f"Cannot get devices inventory: {last_error}")
+            else:
+                last_error = None
+                selected = select_devices(inventory, filters, device_key)
+                keys = wanted or list(selected)
+                result.devices = [device_report(key, selected.get(key), conditions) for key in keys]
+                result.matched = bool(result.devices) and all(device["matched"] for device in result.devices)
+
+                now_matched = sum(device["matched"] for device in result.devices)
+                if now_matched > matched_count:
+                    interval = module.params["interval_seconds"]
+                elif result.checks > 1:
+                    interval = min(interval * module.params["backoff_factor"], module.params["max_interval_seconds"])
+                matched_count = now_matched
+
+            remaining = deadline - time.monotonic()
+            if result.matched or remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+
+    result.elapsed_seconds = round(time.monotonic() - start, 2)
+
+    if result.matched:
+        result.msg = f"All {len(result.devices)} devices match conditions after {result.checks} checks"
+        module.exit_json(**result.model_dump(mode="json"))
+
+    if not result.devices:
+        result.msg = "No devices selected"
+    else:
+        laggards = [device["key"] for device in result.devices if not device["matched"]]
+        result.msg = f"{len(laggards)} of {len(result.devices)} devices don't match conditions: {laggards}"
+    if last_error is not None:
+        result.msg += f". Last error: {last_error}"
+    if module.params["fail_on_timeout"]:
+        module.fail_json(**result.model_dump(mode="json"))
+    module.exit_json(**result.model_dump(mode="json"))
+
+
+def main():
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
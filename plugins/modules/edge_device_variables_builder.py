@@ -0,0 +1,210 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+DOCUMENTATION = r"""
+---
+module: edge_device_variables_builder
+short_description: Build config group variables of edge devices
+version_added: "0.3.4"
+description:
+  - Builds C(edge_device_variables) for C(cisco.catalystwan.config_group_deployment) from settable variables
+    generated by C(cisco.catalystwan.feature_profile_builder) and a list of edge instances, in one pass.
+  - Transport interface variables are set to C(<interface_prefix><N>),
+    where N is position of the variable starting at 1.
+  - Service interface variables are set to C(<interface_prefix><index>), where index is taken from
+    C(service_interfaces) of the edge instance at the same position. Static IP address variables are set to
+    C(addr) of these service interfaces and static subnet variables to C(subnet_mask).
+options:
+  settable_variables:
+    description:
+      - Settable variables grouped by profile type, as returned by C(cisco.catalystwan.feature_profile_builder).
+    type: dict
+    required: true
+  edge_instances:
+    description:
+      - List of edge instances, as created by C(cisco.sdwan_deployment.aws_edges)
+        and C(cisco.sdwan_deployment.azure_edges) roles.
+      - Every instance is copied to its variables, except keys listed in C(exclude_keys).
+    type: list
+    elements: dict
+    required: true
+  exclude_keys:
+    description:
+      - Keys of edge instances which are not variables. Keys are removed at any level of nesting.
+    type: list
+    elements: str
+    default: [admin_username, mgmt_public_ip, transport_public_ip, service_interfaces]
+  interface_prefix:
+    description:
+      - Prefix of interface names set for interface name variables.
+    type: str
+    default: GigabitEthernet
+  subnet_mask:
+    description:
+      - Value set for static subnet variables.
+    type: str
+    default: 255.255.255.0
+  pseudo_commit_timer:
+    description:
+      - Value of C(pseudo_commit_timer) variable set for every edge device.
+    type: int
+    default: 300
+author:
+  - Arkadiusz Cichon (acichon@cisco.com)
+"""
+
+RETURN = r"""
+edge_device_variables:
+  description: Variables of every edge device, in order of C(edge_instances).
+  returned: on success
+  type: list
+  elements: dict
+  sample:
+    - hostname: edge-1
+      system_ip: 192.168.1.1
+      site_id: 1001
+      vpn_0_transport_if: GigabitEthernet1
+      vpn_10_if_0: GigabitEthernet2
+      vpn_10_if_0_static_ipaddr: 10.0.10.1
+      vpn_10_if_0_static_subnet: 255.255.255.0
+      pseudo_commit_timer: 300
+msg:
+  description: Message detailing the outcome of the operation.
+  returned: on failure
+  type: str
+"""
+
+EXAMPLES = r"""
+- name: Generate feature profiles
+  cisco.catalystwan.feature_profile_builder:
+    templates_path: "/path/to/parcel/templates"
+    system_profiles: "{{ system_profiles }}"
+    transport_profiles: "{{ transport_profiles }}"
+    service_profiles: "{{ service_profiles }}"
+  register: feature_profiles
+
+- name: Build variables of all edge devices
+  cisco.catalystwan.edge_device_variables_builder:
+    settable_variables: "{{ feature_profiles.data.settable_variables }}"
+    edge_instances: "{{ deployed_edge_instances }}"
+  register: edge_variables
+
+- name: Deploy config group
+  cisco.catalystwan.config_group_deployment:
+    config_group_id: "{{ config_group_id }}"
+    edge_device_variables: "{{ edge_variables.edge_device_variables }}"
+    manager_authentication: "{{ manager_authentication }}"
+"""
+
+from typing import Any, Dict, FrozenSet, List
+
+from ansible.module_utils.basic import AnsibleModule
+
+
+class EdgeVariablesError(Exception):
+    pass
+
+
+def remove_keys(data: Any, keys: FrozenSet[str]) -> Any:
+    """
+    Copy of data without given keys at any level of nesting, same as ansible.utils.remove_keys filter.
+    """
+    if isinstance(data, dict):
+        return {key: remove_keys(value, keys) for key, value in data.items() if key not in keys}
+    if isinstance(data, list):
+        return [remove_keys(item, keys) for item in data]
+    return data
+
+
+def service_interface(device: Dict, index: int) -> Dict:
+    service_interfaces = device.get("service_interfaces") or []
+    if index >= len(service_interfaces):
+        raise EdgeVariablesError(
+            f"Edge instance {device.get('hostname', device)} has {len(service_interfaces)} service interfaces, "
+            f"at least {index + 1} required by settable variables"
+        )
+    return service_interfaces[index]
+
+
+def build_device_variables(
+    device: Dict,
+    transport_vars: Dict,
+    service_vars: Dict,
+    exclude_keys: FrozenSet[str],
+    interface_prefix: str,
+    subnet_mask: str,
+    pseudo_commit_timer: int,
+) -> Dict:
+    device_vars = remove_keys(device, exclude_keys)
+    for index, name in enumerate(transport_vars.get("interface_names") or []):
+        device_vars[name] = f"{interface_prefix}{index + 1}"
+    for index, name in enumerate(service_vars.get("interface_names") or []):
+        device_vars[name] = f"{interface_prefix}{service_interface(device, index)['index']}"
+    for index, name in enumerate(service_vars.get("static_ip_addresses") or []):
+        device_vars[name] = service_interface(device, index)["addr"]
+    for name in service_vars.get("static_subnets") or []:
+        device_vars[name] = subnet_mask
+    device_vars["pseudo_commit_timer"] = pseudo_commit_timer
+    return device_vars
+
+
+def build_edge_device_variables(
+    settable_variables: Dict,
+    edge_instances: List[Dict],
+    exclude_keys: List[str],
+    interface_prefix: str,
+    subnet_mask: str,
+    pseudo_commit_timer: int,
+) -> List[Dict]:
+    transport_vars = settable_variables.get("transport") or {}
+    service_vars = settable_variables.get("service") or {}
+    excluded = frozenset(exclude_keys)
+    return [
+        build_device_variables(
+            device, transport_vars, service_vars, excluded, interface_prefix, subnet_mask, pseudo_commit_timer
+        )
+        for device in edge_instances
+    ]
+
+
+def run_module():
+    module_args = dict(
+        settable_variables=dict(type="dict", required=True),
+        edge_instances=dict(type="list", elements="dict", required=True),
+        exclude_keys=dict(
+            type="list",
+            elements="str",
+            no_log=False,
+            default=["admin_username", "mgmt_public_ip", "transport_public_ip", "service_interfaces"],
+        ),
+        interface_prefix=dict(type="str", default="GigabitEthernet"),
+        subnet_mask=dict(type="str", default="255.255.255.0"),
+        pseudo_commit_timer=dict(type="int", default=300),
+    )
+
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    try:
+        edge_device_variables = build_edge_device_variables(
+            settable_variables=module.params["settable_variables"],
+            edge_instances=module.params["edge_instances"],
+            exclude_keys=module.params["exclude_keys"],
+            interface_prefix=module.params["interface_prefix"],
+            subnet_mask=module.params["subnet_mask"],
+            pseudo_commit_timer=module.params["pseudo_commit_timer"],
+        )
+    except (EdgeVariablesError, KeyError, TypeError) as ex:
+        module.fail_json(msg=f"Cannot build edge device variables: {ex}")
+
+    module.exit_json(changed=False, edge_device_variables=edge_device_variables)
+
+
+def main():
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,35 @@ module: feature_profile_builder
 short_description: Description
 version_added: "0.3.1"
 description: Module for building feature profile data based on parcel templates.
+options:
+  templates_path:
+    description:
+      - Path to directory with parcel templates, organized in C(<profile type>_parcels/<template>.yml) files.
+    type: str
+    required: true
+  system_profiles:
+    description:
+      - A list of system feature profiles to generate.
+    type: list
+    elements: raw
+  transport_profiles:
+    description:
+      - A list of transport feature profiles to generate.
+    type: list
+    elements: raw
+  service_profiles:
+    description:
+      - A list of service feature profiles to generate.
+    type: list
+    elements: raw
+  cache_file:
+    description:
+      - Path to a file where parsed parcel templates are stored between runs (pickle format).
+      - Templates are parsed again only when their modification time or size changed.
+      - The cache file is loaded with pickle, it must be stored in a location writable only by trusted users.
+    type: path
+    required: false
+    version_added: "0.3.4"
 author:
   - Przemyslaw Susko (sprzemys@cisco.com)
 """
@@ -32,20 +61,20 @@ service_profiles:
   returned: on success
   type: str
 settable_variables:
-  description: A list of settable variables for created feature profiles grouped by profile type, i.e.:
-    settable_variables:
-      service:
-        interface_names:
+  description: A list of settable variables for created feature profiles grouped by profile type.
+  returned: on success
+  type: str
+  sample:
+    service:
+      interface_names:
         - vpn_10_if_0
-        static_ip_addresses:
+      static_ip_addresses:
         - vpn_10_if_0_static_ipaddr
-        static_subnets:
+      static_subnets:
         - vpn_10_if_0_static_subnet
-      transport:
-        interface_names:
+    transport:
+      interface_names:
         - vpn_0_transport_if
-  returned: on success
-  type: str
 """
 
 EXAMPLES = r"""
@@ -80,34 +109,82 @@ EXAMPLES = r"""
         - template: vpn
           sub_parcels:
             - template: ethernet
+
+- name: "Generate config group data for many sites, parsing every template only once"
+  cisco.catalystwan.feature_profile_builder:
+    templates_path: "/path/to/parcel/templates"
+    cache_file: "/path/to/parcel/templates_cache.pickle"
+    system_profiles: "{{ site_system_profiles }}"
 """
 
 import os
-from copy import copy
+import pickle
+import tempfile
 from dataclasses import asdict, dataclass
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 from ansible.module_utils.basic import AnsibleModule
 
+# Version of persistent cache format, cache files with other version are ignored
+CACHE_VERSION = 1
+
 
 class TemplateCache:
-    def __init__(self, module: AnsibleModule, templates_dir: os.path):
+    """Parsed parcel templates, keyed by absolute file path and file modification time and size.
+
+    With `cache_file`, parsed templates are persisted between runs, so every template is parsed
+    once until it changes. Returned templates are shared between parcels and must not be modified,
+    `merge_template` applies parcel config without modifying the template.
+    """
+
+    def __init__(self, module: AnsibleModule, templates_dir: os.path, cache_file: Optional[str] = None):
         self.module = module
         self.dir = templates_dir
-        self.cache = {}
+        self.cache_file = cache_file
+        self.cache: Dict[str, Tuple[Tuple[int, int], Any]] = self._load()
+        self.changed = False
+
+    def _load(self) -> Dict:
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, "rb") as file:
+                version, cache = pickle.load(file)
+        except (OSError, ValueError, TypeError, EOFError, pickle.UnpicklingError) as ex:
+            self.module.warn(f"Ignoring unreadable templates cache file {self.cache_file}: {ex}")
+            return {}
+        return cache if version == CACHE_VERSION else {}
+
+    def save(self) -> None:
+        if not self.cache_file or not self.changed:
+            return
+        directory = os.path.dirname(os.path.abspath(self.cache_file))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump((CACHE_VERSION, self.cache), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as ex:
+            self.module.warn(f"Cannot write templates cache file {self.cache_file}: {ex}")
 
     def get(self, template):
-        if template not in self.cache:
-            file_path = os.path.join(self.dir, template)
-            try:
+        file_path = os.path.abspath(os.path.join(self.dir, template))
+        try:
+            stat = os.stat(file_path)
+            key = (stat.st_mtime_ns, stat.st_size)
+            entry = self.cache.get(file_path)
+            if entry is None or entry[0] != key:
                 with open(file_path, "r") as file:
-                    self.cache[template] = yaml.safe_load(file)
-            except FileNotFoundError:
-                self.module.fail_json(msg=f"File not found {file_path}")
-            except IOError as e:
-                self.module.fail_json(msg=f"Error reading file {file_path}: {e}")
-        return copy(self.cache[template])
+                    entry = (key, yaml.safe_load(file))
+                self.cache[file_path] = entry
+                self.changed = True
+        except FileNotFoundError:
+            self.module.fail_json(msg=f"File not found {file_path}")
+        except IOError as e:
+            self.module.fail_json(msg=f"Error reading file {file_path}: {e}")
+        return entry[1]
 
 
 @dataclass
@@ -148,15 +225,21 @@ def get_settable_vars_for_profile(profile_type: str) -> SettableVars.Vars:
         return SETTABLE_VARS.service
 
 
-def update_template(template, config: dict):
+def merge_template(template: dict, config: dict) -> dict:
+    """
+    Return template with config values applied, without modifying the template or the config.
+    Only dicts on the path to overridden values are copied, everything else is shared with the template.
+    """
+    merged = dict(template)
     for key, value in config.items():
         if key in template:
             if isinstance(value, dict) and isinstance(template[key], dict):
-                update_template(template[key], value)
+                merged[key] = merge_template(template[key], value)
             else:
                 if isinstance(value, str) and value.startswith("{"):
                     value = "{{ '" + value + "' }}"
-                template[key] = value
+                merged[key] = value
+    return merged
 
 
 def append_settable_vars(config: dict, profile_type: str):
@@ -193,16 +276,17 @@ def generate_parcel(module: AnsibleModule, cache: TemplateCache, profile_type: s
         module.fail_json(f"Template type not provided for {profile_type} type parcel")
 
     template = cache.get(f"{profile_type}_parcels/{source['template']}.yml")
+    config = template["config"]
     if "config" in source:
-        update_template(template["config"], source["config"])
-    append_settable_vars(template["config"], profile_type)
+        config = merge_template(config, source["config"])
+    append_settable_vars(config, profile_type)
 
     sub_parcels = []
     if source["template"] == "vpn" and "sub_parcels" in source and len(source["sub_parcels"]):
         for parcel in source["sub_parcels"]:
             sub_parcels.append(generate_parcel(module, cache, profile_type, parcel))
 
-    generated = {"type": source["template"], "config": template["config"]}
+    generated = {"type": source["template"], "config": config}
     if len(sub_parcels):
         generated.update({"sub_parcels": sub_parcels})
 
@@ -225,6 +309,7 @@ def run_module():
         system_profiles=dict(type="list"),
         transport_profiles=dict(type="list"),
         service_profiles=dict(type="list"),
+        cache_file=dict(type="path", default=None),
     )
 
     result = dict(changed=True, data={})
@@ -236,10 +321,11 @@ def run_module():
     transport_profiles = module.params["transport_profiles"]
     service_profiles = module.params["service_profiles"]
 
-    cache = TemplateCache(module, templates_path)
+    cache = TemplateCache(module, templates_path, module.params["cache_file"])
     generated_system_profiles = generate_profiles(module, cache, "system", system_profiles)
     generated_transport_profiles = generate_profiles(module, cache, "transport", transport_profiles)
     generated_service_profiles = generate_profiles(module, cache, "service", service_profiles)
+    cache.save()
 
     result["data"].update({"system_profiles": generated_system_profiles})
     result["data"].update({"transport_profiles": generated_transport_profiles})
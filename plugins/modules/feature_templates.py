@@ -78,24 +78,7 @@ from catalystwan.session import ManagerHTTPError
 from catalystwan.typed_list import DataSequence
 from pydantic import BaseModel, ConfigDict, Field
 
-from ..module_utils.feature_templates.aaa import aaa_definition
-from ..module_utils.feature_templates.cisco_aaa import cisco_aaa_definition
-from ..module_utils.feature_templates.cisco_banner import cisco_banner_definition
-from ..module_utils.feature_templates.cisco_bfd import cisco_bfd_definition
-from ..module_utils.feature_templates.cisco_logging import cisco_logging_definition
-from ..module_utils.feature_templates.cisco_ntp import cisco_ntp_definition
-from ..module_utils.feature_templates.cisco_omp import cisco_omp_definition
-from ..module_utils.feature_templates.cisco_ospf import cisco_ospf_definition
-from ..module_utils.feature_templates.cisco_secure_internet_gateway import cisco_secure_internet_gateway_definition
-from ..module_utils.feature_templates.cisco_snmp import cisco_snmp_definition
-from ..module_utils.feature_templates.cisco_system import cisco_system_definition
-from ..module_utils.feature_templates.cisco_vpn import cisco_vpn_definition
-from ..module_utils.feature_templates.cisco_vpn_interface import cisco_vpn_interface_definition
-from ..module_utils.feature_templates.omp_vsmart import omp_vsmart_definition
-from ..module_utils.feature_templates.security_vsmart import security_vsmart_definition
-from ..module_utils.feature_templates.system_vsmart import system_vsmart_definition
-from ..module_utils.feature_templates.vpn_vsmart import vpn_vsmart_definition
-from ..module_utils.feature_templates.vpn_vsmart_interface import vpn_vsmart_interface_definition
+from ..module_utils.feature_template_definitions import feature_template_argument_spec
 from ..module_utils.result import ModuleResult
 from ..module_utils.vmanage_module import AnsibleCatalystwanModule
 
@@ -126,24 +109,8 @@ def run_module():
         debug=dict(type="bool", default=False),
         device_specific_variables=dict(type="raw", default={}),
         # device=dict(type="str", default=None),  # For this we need to think how to pass devices
-        **aaa_definition,
-        **cisco_aaa_definition,
-        **cisco_banner_definition,
-        **cisco_bfd_definition,
-        **cisco_logging_definition,
-        **cisco_ntp_definition,
-        **cisco_omp_definition,
-        **cisco_ospf_definition,
-        **cisco_secure_internet_gateway_definition,
-        **cisco_snmp_definition,
-        **cisco_system_definition,
-        **cisco_vpn_interface_definition,
-        **cisco_vpn_definition,
-        **omp_vsmart_definition,
-        **security_vsmart_definition,
-        **system_vsmart_definition,
-        **vpn_vsmart_definition,
-        **vpn_vsmart_interface_definition,
+        # Suboptions of template types are imported only for template types used in the task
+        **feature_template_argument_spec(),
     )
 
     result = ExtendedModuleResult()
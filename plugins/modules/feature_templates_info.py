@@ -96,6 +96,8 @@ author:
   - Arkadiusz Cichon (acichon@cisco.com)
 extends_documentation_fragment:
   - cisco.catalystwan.manager_authentication
+  - cisco.catalystwan.fields_projection
+  - cisco.catalystwan.output_file
 notes:
   - Ensure that the provided credentials have sufficient permissions to manage templates and devices in vManage.
 """
@@ -149,23 +151,30 @@ from catalystwan.models.templates import FeatureTemplateInformation
 from catalystwan.typed_list import DataSequence
 from pydantic import Field
 
+from ..module_utils.output_file import output_file_argument_spec, write_output_file
+from ..module_utils.projection import project_records, projection_argument_spec
 from ..module_utils.result import ModuleResult
 from ..module_utils.vmanage_module import AnsibleCatalystwanModule
 
 
 class ExtendedModuleResult(ModuleResult):
     templates_info: Optional[Dict] = Field(default={})
+    output: Optional[Dict] = Field(default={})
 
 
 def run_module():
     module_args = dict(
         filters=dict(type="dict", default=None, required=False),
+        **projection_argument_spec(),
+        **output_file_argument_spec(),
     )
     result = ExtendedModuleResult()
 
     module = AnsibleCatalystwanModule(argument_spec=module_args)
 
     filters = module.params.get("filters")
+    fields = module.params.get("fields")
+    exclude_fields = module.params.get("exclude_fields")
 
     all_templates: DataSequence[FeatureTemplateInformation] = module.get_response_safely(
         module.session.api.templates.get, template=FeatureTemplate
@@ -176,13 +185,19 @@ def run_module():
         if filtered_templates:
             module.logger.info(f"All Feature Templates filtered with filters: {filters}:\n{filtered_templates}")
             result.msg = "Succesfully got all requested Feature Templates Info from vManage"
-            result.templates_info = [template for template in filtered_templates]
+            if module.params.get("output_file"):
+                result.output = write_output_file(module, filtered_templates)
+            else:
+                result.templates_info = project_records(filtered_templates, fields, exclude_fields)
         else:
             module.logger.warning(msg=f"Feature templates filtered with `{filters}` not present.")
             result.msg = f"Feature templates filtered with `{filters}` not present on vManage."
     else:
         result.msg = "Succesfully got all Feature Templates Info from vManage"
-        result.templates_info = [template for template in all_templates]
+        if module.params.get("output_file"):
+            result.output = write_output_file(module, all_templates)
+        else:
+            result.templates_info = project_records(all_templates, fields, exclude_fields)
 
     module.exit_json(**result.model_dump(mode="json"))
 
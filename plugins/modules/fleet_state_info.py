@@ -0,0 +1,257 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+DOCUMENTATION = r"""
+---
+module: fleet_state_info
+short_description: Queries fleet state stored locally by other modules
+version_added: "0.3.4"
+description:
+  - This module queries snapshots of fleet state stored in SQLite database with C(fleet_state_db) option
+    of C(cisco.catalystwan.devices_info), C(cisco.catalystwan.software_upgrade_info),
+    C(cisco.catalystwan.device_templates_info) and C(cisco.catalystwan.health_checks). Manager is not contacted.
+  - Returns records of single snapshot, or with C(since_snapshot_id) records added, removed and changed
+    since given snapshot.
+  - Template attachments are stored in C(template) and C(template_id) fields of C(devices) records,
+    and in C(devices_attached) field of C(templates) records.
+options:
+  fleet_state_db:
+    description:
+      - Path to SQLite database of fleet state.
+      - Can be set with C(CATALYSTWAN_FLEET_STATE_DB) environment variable.
+    type: path
+    required: true
+  kind:
+    description:
+      - Kind of records to query, C(devices) stored by C(cisco.catalystwan.devices_info), C(software)
+        by C(cisco.catalystwan.software_upgrade_info), C(templates) and C(template_attachments)
+        by C(cisco.catalystwan.device_templates_info) and C(health) by C(cisco.catalystwan.health_checks).
+      - Records of C(template_attachments) are keyed by C(<template id>/<device uuid>).
+    type: str
+    choices: ["devices", "software", "templates", "template_attachments", "health"]
+    required: true
+  scope:
+    description:
+      - Scope of snapshot, which is C(device_category) for C(devices), C(device_type) for C(software),
+        C(check_type) for C(health) and empty string for C(templates) and C(template_attachments).
+      - When not set, snapshots of any scope are selected.
+    type: str
+  manager_url:
+    description:
+      - URL of Manager which records were fetched from. When not set, snapshots of any Manager are selected.
+    type: str
+  snapshot_id:
+    description:
+      - ID of snapshot to query. Defaults to the latest snapshot of C(kind), C(scope) and C(manager_url).
+        With C(since_snapshot_id), scope and Manager of that snapshot are used by default.
+    type: int
+  since_snapshot_id:
+    description:
+      - ID of earlier snapshot. When set, module returns C(delta) between this snapshot and C(snapshot_id)
+        instead of C(records).
+    type: int
+  filters:
+    description:
+      - Dictionary of field names and values selecting records. List value matches any of its elements.
+      - Fields C(key), C(host_name) and C(system_ip) are matched by index, other top level fields of records
+        by their values.
+      - Used only when C(since_snapshot_id) is not set.
+    type: dict
+  fields:
+    description:
+      - List of fields returned for every record, including C(added) and C(removed) records of C(delta).
+        When not set, all fields are returned.
+    type: list
+    elements: str
+  ignore_fields:
+    description:
+      - Fields which changes alone don't make record changed in C(delta), for example uptime of device.
+    type: list
+    elements: str
+    default: [uptime_date, last_updated, time_remaining_for_expiration]
+  list_snapshots:
+    description:
+      - Return all snapshots of C(kind), C(scope) and C(manager_url) in C(snapshots).
+    type: bool
+    default: false
+author:
+  - Arkadiusz Cichon (acichon@cisco.com)
+"""
+
+RETURN = r"""
+msg:
+  description: Message detailing the outcome of the operation.
+  returned: always
+  type: str
+  sample: "Found 2 records in snapshot 12"
+snapshot:
+  description: Queried snapshot.
+  returned: when snapshot is found
+  type: dict
+  sample:
+    id: 12
+    kind: devices
+    scope: all
+    manager: 192.0.2.1
+    created_at: "2024-06-01T10:15:30.123456+00:00"
+    records: 42
+since_snapshot:
+  description: Earlier snapshot of C(delta).
+  returned: when C(since_snapshot_id) is set
+  type: dict
+records:
+  description: Records of snapshot matching C(filters).
+  returned: when C(since_snapshot_id) is not set
+  type: list
+  elements: dict
+delta:
+  description:
+    - Records C(added) and C(removed) since C(since_snapshot), and C(changed) records.
+    - Every changed record has C(key), C(host_name) and C(changes) with C(before) and C(after) value
+      of every changed field.
+  returned: when C(since_snapshot_id) is set
+  type: dict
+  sample:
+    added: []
+    removed: []
+    changed:
+      - key: C8K-15411CCC-D476-0B3B-21F2-5D6AC387EE7B
+        host_name: edge-1
+        changes:
+          version:
+            before: "17.12.01a"
+            after: "17.12.03"
+snapshots:
+  description: Snapshots of C(kind), latest first.
+  returned: when C(list_snapshots) is set
+  type: list
+  elements: dict
+changed:
+  description: Whether or not the state was changed. Always false.
+  returned: always
+  type: bool
+  sample: false
+"""
+
+EXAMPLES = r"""
+- name: Store inventory of all devices
+  cisco.catalystwan.devices_info:
+    fleet_state_db: "/var/lib/catalystwan/fleet.db"
+    fields:
+      - uuid
+    manager_authentication:
+      url: "192.0.2.1"
+      username: "admin"
+      password: "password"  # pragma: allowlist secret
+  register: inventory
+
+- name: Get unreachable edge devices from stored inventory
+  cisco.catalystwan.fleet_state_info:
+    fleet_state_db: "/var/lib/catalystwan/fleet.db"
+    kind: devices
+    filters:
+      personality: vedge
+      reachability: unreachable
+    fields:
+      - uuid
+      - host_name
+      - system_ip
+
+- name: Get devices changed since previous inventory
+  cisco.catalystwan.fleet_state_info:
+    fleet_state_db: "/var/lib/catalystwan/fleet.db"
+    kind: devices
+    since_snapshot_id: "{{ previous_snapshot_id }}"
+    snapshot_id: "{{ inventory.fleet_state.id }}"
+  register: inventory_changes
+"""
+
+import os
+import sqlite3
+
+from ansible.module_utils.basic import AnsibleModule, env_fallback
+
+from ..module_utils.fleet_state import KINDS, FleetStateStore
+from ..module_utils.projection import project_records
+
+
+def run_module():
+    module_args = dict(
+        fleet_state_db=dict(type="path", required=True, fallback=(env_fallback, ["CATALYSTWAN_FLEET_STATE_DB"])),
+        kind=dict(type="str", choices=KINDS, required=True),
+        scope=dict(type="str"),
+        manager_url=dict(type="str"),
+        snapshot_id=dict(type="int"),
+        since_snapshot_id=dict(type="int"),
+        filters=dict(type="dict"),
+        fields=dict(type="list", elements="str"),
+        ignore_fields=dict(
+            type="list",
+            elements="str",
+            default=["uptime_date", "last_updated", "time_remaining_for_expiration"],
+        ),
+        list_snapshots=dict(type="bool", default=False),
+    )
+
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+    result = dict(changed=False)
+
+    path = module.params["fleet_state_db"]
+    kind = module.params["kind"]
+    scope = module.params["scope"]
+    manager = module.params["manager_url"]
+    if not os.path.exists(path):
+        module.fail_json(msg=f"Fleet state database doesn't exist: {path}")
+
+    try:
+        with FleetStateStore(path) as store:
+            since_snapshot = None
+            if module.params["since_snapshot_id"] is not None:
+                since_snapshot = store.get_snapshot(module.params["since_snapshot_id"])
+                if since_snapshot is None or since_snapshot["kind"] != kind:
+                    module.fail_json(msg=f"No {kind} snapshot with ID: {module.params['since_snapshot_id']}")
+                scope = since_snapshot["scope"] if scope is None else scope
+                manager = since_snapshot["manager"] if manager is None else manager
+                result["since_snapshot"] = since_snapshot
+
+            if module.params["list_snapshots"]:
+                result["snapshots"] = store.snapshots(kind, scope, manager)
+
+            if module.params["snapshot_id"] is not None:
+                snapshot = store.get_snapshot(module.params["snapshot_id"])
+                if snapshot is None or snapshot["kind"] != kind:
+                    module.fail_json(msg=f"No {kind} snapshot with ID: {module.params['snapshot_id']}", **result)
+            else:
+                snapshot = store.latest_snapshot(kind, scope, manager)
+                if snapshot is None:
+                    module.fail_json(msg=f"No {kind} snapshots in fleet state database: {path}", **result)
+            result["snapshot"] = snapshot
+
+            if since_snapshot is not None:
+                delta = store.delta(since_snapshot["id"], snapshot["id"], module.params["ignore_fields"])
+                delta["added"] = project_records(delta["added"], module.params["fields"])
+                delta["removed"] = project_records(delta["removed"], module.params["fields"])
+                result["delta"] = delta
+                result["msg"] = (
+                    f"Since snapshot {since_snapshot['id']} to {snapshot['id']}: {len(delta['added'])} added, "
+                    f"{len(delta['removed'])} removed, {len(delta['changed'])} changed records"
+                )
+            else:
+                records = store.query(snapshot["id"], module.params["filters"])
+                result["records"] = project_records(records, module.params["fields"])
+                result["msg"] = f"Found {len(records)} records in snapshot {snapshot['id']}"
+    except (OSError, sqlite3.Error) as ex:
+        module.fail_json(msg=f"Cannot query fleet state database: {path}, exception: {ex}")
+
+    module.exit_json(**result)
+
+
+def main():
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
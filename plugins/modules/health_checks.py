@@ -12,6 +12,12 @@ version_added: "0.1.0"
 description:
   - This module performs various health checks on devices managed by vManage.
   - Available health chesk are choosen by C(check_type)
+  - Structured results of checks can be stored as snapshot of a run with C(snapshot_dir) and C(run_id),
+    and two snapshots can be compared with C(compare) to find devices and sessions which state regressed.
+  - With C(watch_seconds), selected check is repeated every C(interval_seconds) within single session,
+    devices are queried concurrently and only transitions of session states are returned in C(events).
+  - With C(summary), BFD and OMP health is evaluated from fabric-level counters of all devices fetched in single
+    request, and sessions are fetched only for devices which don't look healthy in the counters.
 options:
   check_type:
     description:
@@ -23,10 +29,92 @@ options:
     description:
       - A dictionary of filters used to select devices for module action.
     type: dict
+  summary:
+    description:
+      - Evaluate health from fabric-level counters of BFD sessions and OMP peers of all devices,
+        fetched in single request, and fetch sessions only of devices which don't look healthy.
+      - Device is healthy in the counters when all its BFD sessions are up, or when its number of OMP peers
+        equals the number of vSmarts in the fabric. OMP sessions of vSmarts are always fetched.
+        Device without BFD sessions is skipped, same as when its sessions are fetched.
+      - Used only by C(bfd) and C(omp) checks.
+    type: bool
+    default: false
+    version_added: "0.3.4"
+  snapshot_dir:
+    description:
+      - Directory of snapshot files. Snapshot of run C(run_id) is stored in C(<snapshot_dir>/<run_id>.json).
+      - Results of every C(check_type) are stored in the same snapshot, so all checks of one run
+        can be compared at once. Results of the same C(check_type) are replaced.
+      - Required with C(run_id) and C(compare).
+    type: path
+    version_added: "0.3.4"
+  run_id:
+    description:
+      - ID of run, for example C(pre_upgrade), which results are stored as snapshot in C(snapshot_dir).
+    type: str
+    version_added: "0.3.4"
+  compare:
+    description:
+      - Compare results of C(check_type) stored in two snapshots instead of performing health checks.
+        Manager is not contacted in this mode.
+      - Module fails when any session or device state regressed, which means it was healthy in C(before)
+        and is missing or unhealthy in C(after), or it's unhealthy only in C(after).
+      - Device reported from fabric summary with C(summary) in only one of the runs is compared by health
+        of all its sessions, reported as session C(*).
+      - Control and orchestrator connections to the same peer, for example one per TLOC color, are compared
+        as one session C(<peer-type>:<system-ip>), which is healthy only when all of them are up.
+    type: dict
+    version_added: "0.3.4"
+    suboptions:
+      before:
+        description:
+          - ID of run stored before the change.
+        type: str
+        required: true
+      after:
+        description:
+          - ID of run stored after the change.
+        type: str
+        required: true
+  watch_seconds:
+    description:
+      - Watch state of sessions of C(check_type) for given time, instead of checking it once.
+      - Devices are selected once at start, then check is repeated every C(interval_seconds) for these devices,
+        using the same Manager session. Reachability of devices is taken from inventory at start.
+      - Only transitions of session states are returned in C(events). Sessions unhealthy in the first check
+        are reported as transitions from null state.
+      - Module fails when any session was unhealthy at any check, for example when BFD session flapped.
+      - Manager error of single device is reported as transition of its session C(error) and doesn't stop watch.
+      - Connections to the same peer are watched as one session, see C(compare), so change of their order
+        in response is not a transition, and flap of any of them is.
+      - Memory usage of C(device_system_status) is watched as C(normal) or C(high), so its change below
+        threshold is not a transition.
+      - Must be at least 1.
+    type: int
+    version_added: "0.3.4"
+  interval_seconds:
+    description:
+      - Interval between checks of C(watch_seconds).
+      - Must be at least 1.
+    type: int
+    default: 30
+    version_added: "0.3.4"
+  max_concurrency:
+    description:
+      - Maximum number of devices queried at the same time in C(watch_seconds) mode.
+      - Must be at least 1.
+    type: int
+    default: 4
+    version_added: "0.3.4"
 author:
   - Arkadiusz Cichon (acichon@cisco.com)
+notes:
+  - With C(fleet_state_db), state of sessions of checked devices is stored as snapshot of kind C(health)
+    and scope C(check_type). In C(watch_seconds) mode state from the last check is stored.
+    Nothing is stored in C(compare) mode.
 extends_documentation_fragment:
   - cisco.catalystwan.manager_authentication
+  - cisco.catalystwan.fleet_state
 """
 
 RETURN = r"""
@@ -51,6 +139,59 @@ health_check_msg:
   returned: always
   type: list
   sample: ["All control connections are in state 'up' for vEdge 1.2.3.4"]
+snapshot_path:
+  description: Path of snapshot file with results of this run.
+  returned: when C(run_id) is set
+  type: str
+  sample: /var/lib/health/pre_upgrade.json
+regressions:
+  description:
+    - Sessions which state regressed between C(before) and C(after) runs of C(compare).
+    - C(before) or C(after) is null when session is missing in the snapshot.
+  returned: when C(compare) is set
+  type: list
+  elements: dict
+  sample:
+    - check: bfd
+      uuid: C8K-15411CCC-D476-0B3B-21F2-5D6AC387EE7B
+      host_name: edge-1
+      session: "10.0.0.1:biz-internet-10.0.0.2:mpls"
+      before: up
+      after: down
+events:
+  description:
+    - Transitions of session states during C(watch_seconds), in order of checks.
+    - C(before) or C(after) is null when session was not present in previous or next check.
+    - C(healthy) is health of session after the transition.
+  returned: when C(watch_seconds) is set
+  type: list
+  elements: dict
+  sample:
+    - timestamp: "2024-06-01T10:15:30.123456+00:00"
+      uuid: C8K-15411CCC-D476-0B3B-21F2-5D6AC387EE7B
+      host_name: edge-1
+      session: "10.0.0.1:biz-internet-10.0.0.2:mpls"
+      before: up
+      after: down
+      healthy: false
+fleet_state:
+  description:
+    - Snapshot of records stored in C(fleet_state_db), C(id) is used by C(cisco.catalystwan.fleet_state_info).
+  returned: when C(fleet_state_db) is set
+  type: dict
+  sample:
+    path: /var/lib/catalystwan/fleet.db
+    id: 12
+    kind: health
+    scope: bfd
+    manager: 192.0.2.1
+    created_at: "2024-06-01T10:15:30.123456+00:00"
+    records: 42
+polls:
+  description: Number of checks performed during C(watch_seconds).
+  returned: when C(watch_seconds) is set
+  type: int
+  sample: 21
 changed:
   description: Indicates if any changes were made by the module.
   returned: always
@@ -70,6 +211,43 @@ EXAMPLES = r"""
     check_type: "control_connections"
     device_uuid: "1.2.3.4"
 
+# Example of using the module to check BFD sessions of large fabric
+- name: Check BFD sessions using fabric-level counters
+  cisco.catalystwan.health_checks:
+    check_type: "bfd"
+    summary: true
+
+# Example of using the module to gate a change on health check regressions
+- name: Store BFD health before upgrade
+  cisco.catalystwan.health_checks:
+    check_type: "bfd"
+    snapshot_dir: "/var/lib/health"
+    run_id: "pre_upgrade"
+
+- name: Store BFD health after upgrade
+  cisco.catalystwan.health_checks:
+    check_type: "bfd"
+    snapshot_dir: "/var/lib/health"
+    run_id: "post_upgrade"
+  ignore_errors: true
+
+- name: Fail when BFD sessions regressed
+  cisco.catalystwan.health_checks:
+    check_type: "bfd"
+    snapshot_dir: "/var/lib/health"
+    compare:
+      before: "pre_upgrade"
+      after: "post_upgrade"
+
+# Example of using the module to watch for flapping sessions after a change
+- name: Watch BFD sessions for 10 minutes
+  cisco.catalystwan.health_checks:
+    check_type: "bfd"
+    watch_seconds: 600
+    interval_seconds: 20
+    max_concurrency: 8
+  register: bfd_watch
+
 # Example of using the module to check orchestrator connections on a specific device
 - name: Check orchestrator connections on a specific device
   cisco.catalystwan.health_checks:
@@ -77,22 +255,46 @@ EXAMPLES = r"""
     device_uuid: "1.2.3.4"
 """
 
+import json
+import os
+import time
+from datetime import datetime, timezone
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from catalystwan.dataclasses import Personality
+from catalystwan.dataclasses import Connection, Personality
 from catalystwan.endpoints.configuration_device_inventory import DeviceDetailsResponse
 from catalystwan.typed_list import DataSequence
 from catalystwan.utils.creation_tools import asdict
 from pydantic import Field
 
+from ..module_utils.concurrency import run_concurrently
 from ..module_utils.filters import get_devices_details
+from ..module_utils.fleet_state import HEALTH, fleet_state_argument_spec, store_fleet_state
 from ..module_utils.result import ModuleResult
+from ..module_utils.shared_state import locked_json_state
 from ..module_utils.vmanage_module import AnsibleCatalystwanModule
 
 
 class ExtendedModuleResult(ModuleResult):
     health_summary: Optional[List] = Field(default=[])
+    # Structured results stored in snapshots: uuid -> device info and state of every checked session
+    health_records: Dict[str, Dict] = Field(default={}, exclude=True)
+    snapshot_path: Optional[str] = Field(default=None)
+    regressions: List[Dict] = Field(default=[])
+    events: List[Dict] = Field(default=[])
+    polls: int = Field(default=0)
+    fleet_state: Optional[Dict] = Field(default={})
+
+
+# Per device counters in `dataservice/device` response, not modelled by catalystwan DeviceData
+BFD_SESSIONS_UP = "bfdSessionsUp"
+BFD_SESSIONS = "bfdSessions"
+OMP_PEERS = "ompPeers"
+# Session recorded in snapshot for all sessions of device which was healthy in fabric summary
+ALL_SESSIONS = "*"
+# Session recorded in watch mode for device which couldn't be queried
+WATCH_ERROR = "error"
 
 
 class HealthCheckTypes(str, Enum):
@@ -103,9 +305,179 @@ class HealthCheckTypes(str, Enum):
     OMP = "omp"
 
 
+def record_state(
+    result: ExtendedModuleResult,
+    check: HealthCheckTypes,
+    dev: DeviceDetailsResponse,
+    session: str,
+    state: Any,
+    healthy: bool,
+) -> None:
+    record = result.health_records.setdefault(
+        dev.uuid,
+        dict(
+            host_name=dev.host_name,
+            system_ip=dev.system_ip,
+            personality=getattr(dev.personality, "value", dev.personality),
+            sessions={},
+        ),
+    )
+    record["sessions"][session] = dict(state=None if state is None else str(state), healthy=healthy)
+
+
+def record_connections(
+    result: ExtendedModuleResult,
+    check: HealthCheckTypes,
+    dev: DeviceDetailsResponse,
+    connections: List[Connection],
+    expected_state: str,
+) -> None:
+    """
+    Connections to the same peer, e.g. one per TLOC color, are recorded as single session, which is healthy
+    only when all of them are up. State lists states of all connections, sorted so it doesn't depend on order
+    of connections in response.
+    """
+    peer_states: Dict[str, List[str]] = {}
+    for connection in connections:
+        peer_states.setdefault(f"{connection.peerType}:{connection.systemIp}", []).append(connection.state)
+    for session, states in peer_states.items():
+        record_state(
+            result, check, dev, session, ",".join(sorted(states)), all(state == expected_state for state in states)
+        )
+
+
+def snapshot_path(module: AnsibleCatalystwanModule, run_id: str) -> str:
+    if not run_id or os.sep in run_id or run_id in (".", ".."):
+        module.fail_json(msg=f"Invalid run_id: {run_id!r}")
+    return os.path.join(module.params["snapshot_dir"], f"{run_id}.json")
+
+
+def store_snapshot(module: AnsibleCatalystwanModule, result: ExtendedModuleResult, healthy: bool) -> str:
+    """
+    Store results of this check in snapshot of the run, next to results of other checks of the same run.
+    """
+    path = snapshot_path(module, module.params["run_id"])
+    try:
+        os.makedirs(module.params["snapshot_dir"], exist_ok=True)
+        with locked_json_state(path) as snapshot:
+            snapshot.setdefault("run_id", module.params["run_id"])
+            snapshot.setdefault("checks", {})[module.params["check_type"]] = dict(
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                healthy=healthy,
+                devices=result.health_records,
+            )
+    except OSError as ex:
+        module.fail_json(msg=f"Cannot store health check snapshot: {path}, exception: {ex}")
+    return path
+
+
+def load_check_snapshot(module: AnsibleCatalystwanModule, run_id: str) -> Dict[str, Dict]:
+    path = snapshot_path(module, run_id)
+    try:
+        with open(path, encoding="utf-8") as file:
+            snapshot = json.load(file)
+    except (OSError, ValueError) as ex:
+        module.fail_json(msg=f"Cannot load health check snapshot: {path}, exception: {ex}")
+    checks = snapshot.get("checks", {})
+    if module.params["check_type"] not in checks:
+        module.fail_json(msg=f"No results of check {module.params['check_type']} in snapshot: {path}")
+    return checks[module.params["check_type"]]["devices"]
+
+
+def summarize_sessions(sessions: Dict[str, Dict]) -> Dict[str, Dict]:
+    healthy = sum(session["healthy"] for session in sessions.values())
+    return {ALL_SESSIONS: dict(state=f"{healthy}/{len(sessions)} up", healthy=healthy == len(sessions))}
+
+
+def comparable_sessions(before: Dict[str, Dict], after: Dict[str, Dict], uuid: str) -> Tuple[Dict, Dict]:
+    before_sessions = before.get(uuid, {}).get("sessions", {})
+    after_sessions = after.get(uuid, {}).get("sessions", {})
+    # Device recorded from fabric summary only once is compared by health of all its sessions
+    if (ALL_SESSIONS in before_sessions) != (ALL_SESSIONS in after_sessions):
+        if before_sessions and ALL_SESSIONS not in before_sessions:
+            before_sessions = summarize_sessions(before_sessions)
+        if after_sessions and ALL_SESSIONS not in after_sessions:
+            after_sessions = summarize_sessions(after_sessions)
+    return before_sessions, after_sessions
+
+
+def find_regressions(check: str, before: Dict[str, Dict], after: Dict[str, Dict]) -> List[Dict]:
+    """
+    Sessions healthy in `before` and missing or unhealthy in `after`, or unhealthy only in `after`.
+    """
+    regressions = []
+    for uuid in before.keys() | after.keys():
+        device = after.get(uuid) or before[uuid]
+        before_sessions, after_sessions = comparable_sessions(before, after, uuid)
+        for session in before_sessions.keys() | after_sessions.keys():
+            old, new = before_sessions.get(session), after_sessions.get(session)
+            if new is None:
+                regressed = old["healthy"]
+            else:
+                regressed = not new["healthy"] and (old is None or old["healthy"])
+            if regressed:
+                regressions.append(
+                    dict(
+                        check=check,
+                        uuid=uuid,
+                        host_name=device.get("host_name"),
+                        session=session,
+                        before=old and old["state"],
+                        after=new and new["state"],
+                    )
+                )
+    return sorted(regressions, key=lambda regression: (regression["uuid"], regression["session"]))
+
+
+def compare_snapshots(module: AnsibleCatalystwanModule, result: ExtendedModuleResult) -> None:
+    before_run, after_run = module.params["compare"]["before"], module.params["compare"]["after"]
+    regressions = find_regressions(
+        module.params["check_type"], load_check_snapshot(module, before_run), load_check_snapshot(module, after_run)
+    )
+    result.regressions = regressions
+    if regressions:
+        devices = len({regression["uuid"] for regression in regressions})
+        result.msg = f"State of {len(regressions)} sessions on {devices} devices regressed since run {before_run}"
+        module.fail_json(**result.model_dump(mode="json"))
+    result.msg = f"No regressions between runs {before_run} and {after_run}"
+    module.exit_json(**result.model_dump(mode="json"))
+
+
+def store_results(module: AnsibleCatalystwanModule, result: ExtendedModuleResult, healthy: bool) -> None:
+    if module.params["run_id"]:
+        result.snapshot_path = store_snapshot(module, result, healthy)
+    if module.params["fleet_state_db"]:
+        records = [dict(uuid=uuid, **record) for uuid, record in result.health_records.items()]
+        result.fleet_state = store_fleet_state(
+            module, HEALTH, records, key_field="uuid", scope=module.params["check_type"]
+        )
+
+
+def get_fabric_aggregates(module: AnsibleCatalystwanModule) -> Dict[str, Dict]:
+    """
+    Counters of all devices from single request, keyed by system ip.
+    """
+    response = module.get_response_safely(module.session.get, url="dataservice/device")
+    return {device.get("system-ip"): device for device in response.json().get("data", [])}
+
+
+def expected_omp_peers(aggregates: Dict[str, Dict]) -> int:
+    """
+    Number of OMP peers of device which is not vSmart, when it peers with every vSmart of the fabric.
+    """
+    return sum(device.get("personality") == Personality.VSMART.value for device in aggregates.values())
+
+
+def aggregate_counter(aggregates: Dict[str, Dict], dev: DeviceDetailsResponse, key: str) -> Optional[int]:
+    try:
+        return int(aggregates[dev.system_ip][key])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
 def control_connections_have_state_up(
     result: ExtendedModuleResult, module: AnsibleCatalystwanModule, devices: DataSequence[DeviceDetailsResponse]
-):
+) -> bool:
     EXCECTED_STATE = "up"
     control_connections_health = []
     result.response[f"{HealthCheckTypes.CONTROL_CONNECTIONS.value}"] = {}
@@ -119,6 +491,7 @@ def control_connections_have_state_up(
             result.health_summary.append(
                 f"Device {dev.personality}: {dev.uuid} - not reachable. Cannot verify control connections state.",
             )
+            record_state(result, HealthCheckTypes.CONTROL_CONNECTIONS, dev, "reachability", dev.reachability, False)
             continue
 
         connections = module.get_response_safely(
@@ -129,6 +502,7 @@ def control_connections_have_state_up(
             asdict(connection) for connection in connections
         ]
 
+        record_connections(result, HealthCheckTypes.CONTROL_CONNECTIONS, dev, connections, EXCECTED_STATE)
         for connection in connections:
             if connection.state == EXCECTED_STATE:
                 control_connections_health.append(True)
@@ -145,22 +519,22 @@ def control_connections_have_state_up(
 
     if not control_connections_health:
         result.msg = "No Control connections present!"
-        module.fail_json(**result.model_dump(mode="json"))
+        return False
 
     if not all(control_connections_health):
         result.msg = (
             "Not all health checks for control connections passed. "
             "See result.health_summary for list of all control connections state."
         )
-        module.fail_json(**result.model_dump(mode="json"))
+        return False
 
     result.msg = "All required health checks have been completed successfully"
-    module.exit_json(**result.model_dump(mode="json"))
+    return True
 
 
 def orchestrator_connections_have_state_up(
     result: ExtendedModuleResult, module: AnsibleCatalystwanModule, devices: DataSequence[DeviceDetailsResponse]
-):
+) -> bool:
     EXCECTED_STATE = "up"
     orchestrator_connections_health = []
     result.response[f"{HealthCheckTypes.ORCHERSTRATOR_CONNECTIONS.value}"] = {}
@@ -173,6 +547,9 @@ def orchestrator_connections_have_state_up(
             result.health_summary.append(
                 f"Device {dev.personality}: {dev.uuid} - not reachable. Cannot verify orchestrator connections state.",
             )
+            record_state(
+                result, HealthCheckTypes.ORCHERSTRATOR_CONNECTIONS, dev, "reachability", dev.reachability, False
+            )
             continue
 
         connections = module.get_response_safely(
@@ -183,6 +560,7 @@ def orchestrator_connections_have_state_up(
             asdict(connection) for connection in connections
         ]
 
+        record_connections(result, HealthCheckTypes.ORCHERSTRATOR_CONNECTIONS, dev, connections, EXCECTED_STATE)
         for connection in connections:
             if connection.state == EXCECTED_STATE:
                 orchestrator_connections_health.append(True)
@@ -199,22 +577,22 @@ def orchestrator_connections_have_state_up(
 
     if not orchestrator_connections_health:
         result.msg = "No Orchestractor connections present!"
-        module.fail_json(**result.model_dump(mode="json"))
+        return False
 
     if not all(orchestrator_connections_health):
         result.msg = (
             "Not all health checks for orchestrator connections passed. "
             "See result.health_summary for list of all orchestrator connections state."
         )
-        module.fail_json(**result.model_dump(mode="json"))
+        return False
 
     result.msg = "All required health checks have been completed successfully"
-    module.exit_json(**result.model_dump(mode="json"))
+    return True
 
 
 def system_status_is_healthy(
     result: ExtendedModuleResult, module: AnsibleCatalystwanModule, devices: DataSequence[DeviceDetailsResponse]
-):
+) -> bool:
     CPU_STATE = "normal"
     MEM_STATE = "normal"
     MEM_USAGE_THRESHOLD = 90
@@ -231,6 +609,7 @@ def system_status_is_healthy(
             result.health_summary.append(
                 f"Device {dev.personality}: {dev.uuid} - not reachable. Cannot verify system status health.",
             )
+            record_state(result, HealthCheckTypes.DEVICE_SYSTEM_STATUS, dev, "reachability", dev.reachability, False)
             continue
         system_status = module.get_response_safely(
             module.session.api.device_state.get_system_status, device_id=dev.system_ip
@@ -241,6 +620,7 @@ def system_status_is_healthy(
 
         module.logger.info(f"System status for {dev.uuid}: {asdict(system_status)}")
         result.response[f"{HealthCheckTypes.DEVICE_SYSTEM_STATUS.value}"][dev.uuid] = asdict(system_status)
+        health_before = len(system_status_is_healthy)
 
         if isinstance(system_status.cpu_state, str) and system_status.cpu_state == CPU_STATE:
             system_status_is_healthy.append(True)
@@ -260,7 +640,10 @@ def system_status_is_healthy(
             system_status_is_healthy.append(False)
             result.health_summary.append(f'Wrong mem_state: "{system_status.mem_state}" for {dev.uuid} has occurred')
 
-        if isinstance(system_status.memUsage, (int, float)) and system_status.memUsage < MEM_USAGE_THRESHOLD:
+        mem_usage_normal = (
+            isinstance(system_status.memUsage, (int, float)) and system_status.memUsage < MEM_USAGE_THRESHOLD
+        )
+        if mem_usage_normal:
             system_status_is_healthy.append(True)
             result.health_summary.append(
                 f'Expected memUsage: "{CPU_STATE}" for {dev.personality} {dev.uuid}',
@@ -292,24 +675,39 @@ def system_status_is_healthy(
                 f'Wrong DEVICE_REACHABILITY: "{system_status.reachability}" for {dev.uuid} has occurred'
             )
 
+        # Usage is recorded as bucket, so its change below threshold is not a transition in watch mode
+        metrics = {
+            "cpu_state": system_status.cpu_state,
+            "mem_state": system_status.mem_state,
+            "memUsage": "normal" if mem_usage_normal else "high",
+            "status": system_status.status,
+            "reachability": system_status.reachability.value,
+        }
+        # Health of metrics was appended above in the same order
+        for (name, value), healthy in zip(metrics.items(), system_status_is_healthy[health_before:]):
+            record_state(result, HealthCheckTypes.DEVICE_SYSTEM_STATUS, dev, name, value, healthy)
+
     if not system_status_is_healthy:
         result.msg = "Cannot evaluate system status health!"
-        module.fail_json(**result.model_dump(mode="json"))
+        return False
 
     if not all(system_status_is_healthy):
         result.msg = (
             "Not all health checks for system status passed. "
             "See result.health_summary for list of all system statuses."
         )
-        module.fail_json(**result.model_dump(mode="json"))
+        return False
 
     result.msg = "All required health checks have been completed successfully"
-    module.exit_json(**result.model_dump(mode="json"))
+    return True
 
 
 def bfd_sessions_health(
-    result: ExtendedModuleResult, module: AnsibleCatalystwanModule, devices: DataSequence[DeviceDetailsResponse]
-):
+    result: ExtendedModuleResult,
+    module: AnsibleCatalystwanModule,
+    devices: DataSequence[DeviceDetailsResponse],
+    aggregates: Optional[Dict[str, Dict]] = None,
+) -> bool:
     EXCECTED_STATE = "up"
     bfd_sessions_health = []
     result.response[f"{HealthCheckTypes.BFD.value}"] = {}
@@ -321,8 +719,27 @@ def bfd_sessions_health(
             result.health_summary.append(
                 f"Device {dev.personality}: {dev.uuid} - not reachable. Cannot verify BFD sessions state.",
             )
+            record_state(result, HealthCheckTypes.BFD, dev, "reachability", dev.reachability, False)
             continue
 
+        if aggregates is not None:
+            sessions_up = aggregate_counter(aggregates, dev, BFD_SESSIONS_UP)
+            sessions = aggregate_counter(aggregates, dev, BFD_SESSIONS)
+            if sessions == 0:
+                continue
+            if sessions is not None and sessions_up == sessions:
+                bfd_sessions_health.append(True)
+                record_state(result, HealthCheckTypes.BFD, dev, ALL_SESSIONS, f"{sessions_up}/{sessions} up", True)
+                result.response[f"{HealthCheckTypes.BFD.value}"][dev.uuid] = {
+                    BFD_SESSIONS_UP: sessions_up,
+                    BFD_SESSIONS: sessions,
+                }
+                result.health_summary.append(
+                    f'All {sessions} BFD sessions state "{EXCECTED_STATE}" for {dev.personality} {dev.uuid} '
+                    f"(fabric summary)"
+                )
+                continue
+
         bfd_sessions = module.get_response_safely(
             module.session.api.device_state.get_bfd_sessions, device_id=dev.system_ip
         )
@@ -332,6 +749,15 @@ def bfd_sessions_health(
         ]
 
         for bfd_session in bfd_sessions:
+            record_state(
+                result,
+                HealthCheckTypes.BFD,
+                dev,
+                f"{bfd_session.sourceIp}:{bfd_session.sourceTlocColor}-"
+                f"{bfd_session.destinationPublicIp}:{bfd_session.remoteTlocColor}",
+                bfd_session.state,
+                bfd_session.state == EXCECTED_STATE,
+            )
             if bfd_session.state == EXCECTED_STATE:
                 bfd_sessions_health.append(True)
                 result.health_summary.append(
@@ -347,25 +773,31 @@ def bfd_sessions_health(
 
     if not bfd_sessions_health:
         result.msg = "No BFD sessions present!"
-        module.fail_json(**result.model_dump(mode="json"))
+        return False
 
     if not all(bfd_sessions_health):
         result.msg = (
             "Not all health checks for BFD sessions passed. "
             "See result.health_summary for list of all BFD sessions state."
         )
-        module.fail_json(**result.model_dump(mode="json"))
+        return False
 
     result.msg = "All required health checks have been completed successfully"
-    module.exit_json(**result.model_dump(mode="json"))
+    return True
 
 
 def omp_sessions_health(
-    result: ExtendedModuleResult, module: AnsibleCatalystwanModule, devices: DataSequence[DeviceDetailsResponse]
-):
+    result: ExtendedModuleResult,
+    module: AnsibleCatalystwanModule,
+    devices: DataSequence[DeviceDetailsResponse],
+    aggregates: Optional[Dict[str, Dict]] = None,
+    expected_peers: Optional[int] = None,
+) -> bool:
     EXCECTED_STATE = ["up", "UP"]
     omp_sessions_health = []
     result.response[f"{HealthCheckTypes.OMP.value}"] = {}
+    if expected_peers is None and aggregates is not None:
+        expected_peers = expected_omp_peers(aggregates)
 
     for dev in devices:
         # if device not reachable report problem but move with other devices to have all reported
@@ -374,8 +806,22 @@ def omp_sessions_health(
             result.health_summary.append(
                 f"Device {dev.personality}: {dev.uuid} - not reachable. Cannot verify OMP sessions state.",
             )
+            record_state(result, HealthCheckTypes.OMP, dev, "reachability", dev.reachability, False)
             continue
 
+        # Counters don't tell how many peers of vSmart are up, so its sessions are always fetched
+        if expected_peers and dev.personality != Personality.VSMART:
+            omp_peers = aggregate_counter(aggregates, dev, OMP_PEERS)
+            if omp_peers == expected_peers:
+                omp_sessions_health.append(True)
+                record_state(result, HealthCheckTypes.OMP, dev, "omp", EXCECTED_STATE[0], True)
+                result.response[f"{HealthCheckTypes.OMP.value}"][dev.uuid] = {OMP_PEERS: omp_peers}
+                result.health_summary.append(
+                    f'OMP sessions state "{EXCECTED_STATE[0]}" for {dev.personality} {dev.uuid}, '
+                    f"{omp_peers} of {expected_peers} OMP peers (fabric summary)"
+                )
+                continue
+
         omp_sessions = module.get_response_safely(module.session.api.omp.get_omp_summary, device_id=dev.system_ip)
         module.logger.info(f"OMP summary data: {[asdict(ses) for ses in omp_sessions]}")
         result.response[f"{HealthCheckTypes.OMP.value}"][dev.uuid] = [
@@ -383,6 +829,14 @@ def omp_sessions_health(
         ]
 
         for omp_session in omp_sessions:
+            record_state(
+                result,
+                HealthCheckTypes.OMP,
+                dev,
+                "omp",
+                omp_session.oper_state.lower(),
+                omp_session.oper_state in EXCECTED_STATE,
+            )
             if omp_session.oper_state in EXCECTED_STATE:
                 omp_sessions_health.append(True)
                 result.health_summary.append(
@@ -394,17 +848,155 @@ def omp_sessions_health(
 
     if not omp_sessions_health:
         result.msg = "No OMP sessions present!"
-        module.fail_json(**result.model_dump(mode="json"))
+        return False
 
     if not all(omp_sessions_health):
         result.msg = (
             "Not all health checks for OMP sessions passed. "
             "See result.health_summary for list of all OMP sessions state."
         )
-        module.fail_json(**result.model_dump(mode="json"))
+        return False
 
     result.msg = "All required health checks have been completed successfully"
-    module.exit_json(**result.model_dump(mode="json"))
+    return True
+
+
+def run_check(
+    result: ExtendedModuleResult,
+    module: AnsibleCatalystwanModule,
+    devices: DataSequence[DeviceDetailsResponse],
+    aggregates: Optional[Dict[str, Dict]] = None,
+    expected_peers: Optional[int] = None,
+) -> bool:
+    check_type = module.params["check_type"]
+    if check_type == HealthCheckTypes.CONTROL_CONNECTIONS:
+        return control_connections_have_state_up(result, module, devices)
+    if check_type == HealthCheckTypes.ORCHERSTRATOR_CONNECTIONS:
+        return orchestrator_connections_have_state_up(result, module, devices)
+    if check_type == HealthCheckTypes.DEVICE_SYSTEM_STATUS:
+        return system_status_is_healthy(result, module, devices)
+    if check_type == HealthCheckTypes.BFD:
+        return bfd_sessions_health(result, module, devices, aggregates)
+    if check_type == HealthCheckTypes.OMP:
+        return omp_sessions_health(result, module, devices, aggregates, expected_peers)
+    return True
+
+
+class WatchedModule:
+    """
+    Module passed to checks of single device in watch mode, which are called from worker threads.
+
+    Manager errors are raised instead of failing the module, so they are reported as events of the device.
+    """
+
+    def __init__(self, module: AnsibleCatalystwanModule):
+        self.module = module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.module, name)
+
+    def get_response_safely(self, get_data_func: Any, **kwargs: Any) -> Any:
+        with self.module.measure_operation(f"get_response_safely:{getattr(get_data_func, '__name__', get_data_func)}"):
+            return get_data_func(**kwargs)
+
+
+def poll_devices(
+    module: AnsibleCatalystwanModule, devices: List[DeviceDetailsResponse], check: HealthCheckTypes
+) -> Dict[str, Dict]:
+    """
+    State of sessions of all devices, every device is checked separately in at most `max_concurrency` threads.
+    """
+    watched_module = WatchedModule(module)
+    aggregates = None
+    if module.params["summary"] and check in (HealthCheckTypes.BFD, HealthCheckTypes.OMP):
+        try:
+            aggregates = get_fabric_aggregates(watched_module)
+        except Exception as ex:
+            module.logger.warning(f"Cannot get fabric summary, sessions of all devices are fetched: {ex}")
+
+    # Counted once per poll instead of once per device
+    expected_peers = expected_omp_peers(aggregates) if aggregates is not None else None
+
+    def poll_device(dev: DeviceDetailsResponse) -> Optional[Dict]:
+        device_result = ExtendedModuleResult()
+        run_check(device_result, watched_module, [dev], aggregates, expected_peers)
+        return device_result.health_records.get(dev.uuid)
+
+    poll_result = ExtendedModuleResult()
+    for dev, record, error in run_concurrently(poll_device, devices, module.params["max_concurrency"]):
+        if error is not None:
+            record_state(poll_result, check, dev, WATCH_ERROR, module.get_exception_string(error), False)
+        elif record is not None:
+            poll_result.health_records[dev.uuid] = record
+    return poll_result.health_records
+
+
+def find_transitions(timestamp: str, before: Dict[str, Dict], after: Dict[str, Dict]) -> List[Dict]:
+    events = []
+    for uuid in sorted(before.keys() | after.keys()):
+        device = after.get(uuid) or before[uuid]
+        before_sessions, after_sessions = comparable_sessions(before, after, uuid)
+        for session in sorted(before_sessions.keys() | after_sessions.keys()):
+            old, new = before_sessions.get(session), after_sessions.get(session)
+            if old == new:
+                continue
+            events.append(
+                dict(
+                    timestamp=timestamp,
+                    uuid=uuid,
+                    host_name=device.get("host_name"),
+                    session=session,
+                    before=old and old["state"],
+                    after=new and new["state"],
+                    # Session which disappeared is unhealthy, unless it was error of device
+                    healthy=new["healthy"] if new else session == WATCH_ERROR,
+                )
+            )
+    return events
+
+
+def watch_sessions(
+    module: AnsibleCatalystwanModule, result: ExtendedModuleResult, devices: List[DeviceDetailsResponse]
+) -> bool:
+    check = module.params["check_type"]
+    start = time.monotonic()
+    deadline = start + module.params["watch_seconds"]
+    records: Dict[str, Dict] = {}
+
+    while True:
+        timestamp = datetime.now(timezone.utc).isoformat()
+        polled = poll_devices(module, devices, check)
+        events = find_transitions(timestamp, records, polled)
+        if not result.polls:
+            # Healthy sessions of the first check are the baseline, only unhealthy ones are reported
+            events = [event for event in events if not event["healthy"]]
+        result.events.extend(events)
+        result.polls += 1
+        records = polled
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        with module.measure_task_wait():
+            time.sleep(min(module.params["interval_seconds"], remaining))
+
+    result.health_records = records
+    unhealthy = [event for event in result.events if not event["healthy"]]
+    elapsed = round(time.monotonic() - start)
+    if unhealthy:
+        devices_count = len({event["uuid"] for event in unhealthy})
+        result.msg = (
+            f"{len(unhealthy)} unhealthy transitions on {devices_count} devices "
+            f"in {result.polls} checks over {elapsed} seconds"
+        )
+        return False
+    if not records:
+        result.msg = f"No {check} sessions present!"
+        return False
+    result.msg = (
+        f"{len(result.events)} transitions, all sessions healthy in {result.polls} checks over {elapsed} seconds"
+    )
+    return True
 
 
 def run_module():
@@ -415,27 +1007,58 @@ def run_module():
             required=True,
         ),
         filters=dict(type="dict", default=None),
+        summary=dict(type="bool", default=False),
+        snapshot_dir=dict(type="path"),
+        run_id=dict(type="str"),
+        compare=dict(
+            type="dict",
+            options=dict(
+                before=dict(type="str", required=True),
+                after=dict(type="str", required=True),
+            ),
+        ),
+        watch_seconds=dict(type="int"),
+        interval_seconds=dict(type="int", default=30),
+        max_concurrency=dict(type="int", default=4),
+        **fleet_state_argument_spec(),
     )
 
-    module = AnsibleCatalystwanModule(argument_spec=module_args)
+    module = AnsibleCatalystwanModule(
+        argument_spec=module_args,
+        mutually_exclusive=[("run_id", "compare"), ("watch_seconds", "compare")],
+        required_by={"run_id": "snapshot_dir", "compare": "snapshot_dir"},
+    )
     result = ExtendedModuleResult()
 
+    for name in ("watch_seconds", "interval_seconds", "max_concurrency"):
+        if module.params[name] is not None and module.params[name] < 1:
+            module.fail_json(msg=f"{name} must be at least 1, got: {module.params[name]}")
+
+    if module.params["compare"]:
+        compare_snapshots(module, result)
+    if module.params["run_id"]:
+        snapshot_path(module, module.params["run_id"])
+
     devices: DataSequence[DeviceDetailsResponse] = get_devices_details(module=module, deployed_only=True)
     module.logger.debug(f"Devices to test: {[dev.host_name for dev in devices]}")
     if not devices:
         result.msg = f"Empty devices list based on filter: {module.params.get('filters')}"
+        store_results(module, result, True)
         module.exit_json(**result.model_dump(mode="json"))
 
-    if module.params["check_type"] == HealthCheckTypes.CONTROL_CONNECTIONS:
-        control_connections_have_state_up(result, module, devices)
-    if module.params["check_type"] == HealthCheckTypes.ORCHERSTRATOR_CONNECTIONS:
-        orchestrator_connections_have_state_up(result, module, devices)
-    if module.params["check_type"] == HealthCheckTypes.DEVICE_SYSTEM_STATUS:
-        system_status_is_healthy(result, module, devices)
-    if module.params["check_type"] == HealthCheckTypes.BFD:
-        bfd_sessions_health(result, module, devices)
-    if module.params["check_type"] == HealthCheckTypes.OMP:
-        omp_sessions_health(result, module, devices)
+    if module.params["watch_seconds"] is not None:
+        healthy = watch_sessions(module, result, devices)
+    else:
+        aggregates = None
+        if module.params["summary"] and module.params["check_type"] in (HealthCheckTypes.BFD, HealthCheckTypes.OMP):
+            aggregates = get_fabric_aggregates(module)
+        healthy = run_check(result, module, devices, aggregates)
+
+    store_results(module, result, healthy)
+
+    if not healthy:
+        module.fail_json(**result.model_dump(mode="json"))
+    module.exit_json(**result.model_dump(mode="json"))
 
 
 def main():
@@ -28,6 +28,8 @@ author:
   - Arkadiusz Cichon (acichon@cisco.com)
 extends_documentation_fragment:
   - cisco.catalystwan.manager_authentication
+  - cisco.catalystwan.fields_projection
+  - cisco.catalystwan.output_file
 """
 
 RETURN = r"""
@@ -57,12 +59,14 @@ EXAMPLES = r"""
       version: "20.3.2"
 """
 
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from catalystwan.endpoints.configuration.software_actions import RemoteServerInfo, SoftwareImageDetails
 from catalystwan.typed_list import DataSequence
 from pydantic import Field
 
+from ..module_utils.output_file import output_file_argument_spec, write_output_file
+from ..module_utils.projection import project_records, projection_argument_spec
 from ..module_utils.result import ModuleResult
 from ..module_utils.vmanage_module import AnsibleCatalystwanModule
 
@@ -70,6 +74,7 @@ from ..module_utils.vmanage_module import AnsibleCatalystwanModule
 class ExtendedModuleResult(ModuleResult):
     remote_servers: Optional[List] = Field(default=[])
     software_images: Optional[List] = Field(default=[])
+    output: Optional[Dict] = Field(default={})
 
 
 def run_module():
@@ -80,6 +85,8 @@ def run_module():
             choices=["remote_servers", "software_images"],
         ),
         filters=dict(type=dict, default=None),
+        **projection_argument_spec(),
+        **output_file_argument_spec(),
     )
 
     module = AnsibleCatalystwanModule(
@@ -87,6 +94,8 @@ def run_module():
     )
     result = ExtendedModuleResult()
     category = module.params.get("category")
+    fields = module.params.get("fields")
+    exclude_fields = module.params.get("exclude_fields")
 
     if category == "remote_servers":
         remote_servers: Union[DataSequence[RemoteServerInfo], Any] = module.get_response_safely(
@@ -100,9 +109,12 @@ def run_module():
                 **module.params.get("filters")
             )
             module.logger.debug(f"All filtered_remote_servers: {filtered_remote_servers}")
-            result.remote_servers = [server.model_dump(mode="json") for server in filtered_remote_servers]
+            remote_servers = filtered_remote_servers
+
+        if module.params.get("output_file"):
+            result.output = write_output_file(module, remote_servers)
         else:
-            result.remote_servers = [server.model_dump(mode="json") for server in remote_servers]
+            result.remote_servers = project_records(remote_servers, fields, exclude_fields)
 
     if category == "software_images":
         all_images: Union[DataSequence[SoftwareImageDetails], Any] = module.get_response_safely(
@@ -116,9 +128,12 @@ def run_module():
                 **module.params.get("filters")
             )
             module.logger.debug(f"All filtered_all_images: {filtered_all_images}")
-            result.software_images = [server.model_dump(mode="json") for server in filtered_all_images]
+            all_images = filtered_all_images
+
+        if module.params.get("output_file"):
+            result.output = write_output_file(module, all_images)
         else:
-            result.software_images = [server.model_dump(mode="json") for server in all_images]
+            result.software_images = project_records(all_images, fields, exclude_fields)
 
     module.exit_json(**result.model_dump(mode="json"))
 
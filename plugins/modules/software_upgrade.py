@@ -213,7 +213,8 @@ class SoftwareState(str, Enum):
 )
 def wait_for_task_data(module: AnsibleCatalystwanModule, result: ModuleResult, task: Task):
     task.session.login()
-    task_data = task.wait_for_completed(timeout_seconds=module.params.get("wait_timeout_seconds"))
+    with module.measure_task_wait():
+        task_data = task.wait_for_completed(timeout_seconds=module.params.get("wait_timeout_seconds"))
     if not task_data.result:
         result.msg = [data.activity for data in task_data.sub_tasks_data]
         result.response = task_data.json()
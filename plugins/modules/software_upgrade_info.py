@@ -33,6 +33,9 @@ author:
   - Arkadiusz Cichon (acichon@cisco.com)
 extends_documentation_fragment:
   - cisco.catalystwan.manager_authentication
+  - cisco.catalystwan.fields_projection
+  - cisco.catalystwan.output_file
+  - cisco.catalystwan.fleet_state
 """
 
 EXAMPLES = r"""
@@ -83,26 +86,47 @@ installed_devices:
       returned: when device is present
       sample: "installed"
     # Other fields returned by the InstalledDeviceData model_dump method
+fleet_state:
+  description:
+    - Snapshot of records stored in C(fleet_state_db), C(id) is used by C(cisco.catalystwan.fleet_state_info).
+  returned: when C(fleet_state_db) is set
+  type: dict
+  sample:
+    path: /var/lib/catalystwan/fleet.db
+    id: 12
+    kind: software
+    scope: controller
+    manager: 192.0.2.1
+    created_at: "2024-06-01T10:15:30.123456+00:00"
+    records: 42
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from catalystwan.endpoints.configuration_device_actions import InstalledDeviceData
 from catalystwan.typed_list import DataSequence
 from pydantic import Field
 
+from ..module_utils.fleet_state import SOFTWARE, fleet_state_argument_spec, store_fleet_state
+from ..module_utils.output_file import output_file_argument_spec, write_output_file
+from ..module_utils.projection import project_records, projection_argument_spec
 from ..module_utils.result import ModuleResult
 from ..module_utils.vmanage_module import AnsibleCatalystwanModule
 
 
 class ExtendedModuleResult(ModuleResult):
     installed_devices: Optional[List] = Field(default=[])
+    output: Optional[Dict] = Field(default={})
+    fleet_state: Optional[Dict] = Field(default={})
 
 
 def run_module():
     module_args = dict(
         device_type=dict(type=str, required=False, choices=["vedge", "controller", "vmanage"], default="controller"),
         filters=dict(type=dict, default=None),
+        **projection_argument_spec(),
+        **output_file_argument_spec(),
+        **fleet_state_argument_spec(),
     )
 
     module = AnsibleCatalystwanModule(
@@ -110,6 +134,8 @@ def run_module():
     )
     result = ExtendedModuleResult()
     device_type = module.params.get("device_type")
+    fields = module.params.get("fields")
+    exclude_fields = module.params.get("exclude_fields")
 
     installed_devices_info: DataSequence[InstalledDeviceData] = module.get_response_safely(
         module.session.endpoints.configuration_device_actions.get_list_of_installed_devices,
@@ -118,14 +144,22 @@ def run_module():
     module.logger.info(f"get_list_of_installed_devices response: {installed_devices_info}")
     module.logger.debug(f"Filter: {module.params.get('filters')}")
 
+    if module.params.get("fleet_state_db"):
+        result.fleet_state = store_fleet_state(
+            module, SOFTWARE, project_records(installed_devices_info), key_field="uuid", scope=device_type
+        )
+
     if module.params.get("filters"):
         filtered_installed_devices_info: DataSequence[InstalledDeviceData] = installed_devices_info.filter(
             **module.params.get("filters")
         )
         module.logger.debug(f"All filtered_remote_servers: {filtered_installed_devices_info}")
-        result.installed_devices = [server.model_dump(mode="json") for server in filtered_installed_devices_info]
+        installed_devices_info = filtered_installed_devices_info
+
+    if module.params.get("output_file"):
+        result.output = write_output_file(module, installed_devices_info)
     else:
-        result.installed_devices = [server.model_dump(mode="json") for server in installed_devices_info]
+        result.installed_devices = project_records(installed_devices_info, fields, exclude_fields)
 
     module.exit_json(**result.model_dump(mode="json"))
 
@@ -3,6 +3,12 @@
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from pathlib import Path, PurePath
 from pprint import pformat
@@ -17,6 +23,10 @@ from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 
 PROJECT_ROOT_DIR = PurePath(Path.cwd())
+TEMPLATE_DIR = PROJECT_ROOT_DIR / "utils"
+TEMPLATES = ["docs_fragments_template.j2", "ft_device_model.j2", "ft_definitions.j2"]
+# Schema hashes of models from the last run, outputs of models with unchanged schema are not rewritten
+HASHES_FILE = "utils/.ft_generator_hashes.json"
 
 
 def safe_issubclass(type_, class_):
@@ -235,33 +245,104 @@ def generate_arg_spec(yaml_data):
     return parse_options(options)
 
 
-for model_name, model_module in available_models.items():
-    # Part for Ansible documentation
-    ansible_docs = generate_ansible_docs(model_module, model_name)
-
-    def to_nice_yaml(data):
-        return yaml.dump(data, allow_unicode=True, default_flow_style=False, indent=4, sort_keys=False)
-
-    template_dir = PROJECT_ROOT_DIR / "utils"
+def flatten_arg_spec(arg_spec, prefix=""):
+    """
+    Flatten nested argument spec to {option path: (type, required, default, elements, choices, children)}
+    used by module_utils/feature_template_validation.py. Options of list of dicts are children of the list,
+    children are sorted so output doesn't depend on order of fields in model.
+    """
+    flat = {}
+    for opt_name, opt_spec in arg_spec.items():
+        path = f"{prefix}{opt_name}"
+        options = opt_spec.get("options", {})
+        choices = opt_spec.get("choices")
+        flat[path] = (
+            opt_spec["type"],
+            opt_spec.get("required", False),
+            opt_spec.get("default"),
+            opt_spec.get("elements"),
+            tuple(choices) if choices is not None else None,
+            tuple(sorted(options)),
+        )
+        flat.update(flatten_arg_spec(options, prefix=f"{path}."))
+    return flat
+
+
+def to_nice_yaml(data):
+    return yaml.dump(data, allow_unicode=True, default_flow_style=False, indent=4, sort_keys=False)
+
+
+def create_environment():
     env = Environment(
-        loader=FileSystemLoader(template_dir), trim_blocks=True, lstrip_blocks=True, keep_trailing_newline=True
+        loader=FileSystemLoader(TEMPLATE_DIR), trim_blocks=True, lstrip_blocks=True, keep_trailing_newline=True
     )
     env.filters["to_nice_yaml"] = to_nice_yaml
+    return env
+
+
+def generator_fingerprint():
+    """
+    Hash of generator code and templates, outputs of all models are regenerated when any of them changes.
+    """
+    digest = hashlib.sha256()
+    for path in [Path(__file__), *(Path(TEMPLATE_DIR) / name for name in TEMPLATES)]:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def schema_hash(model: Type[BaseModel], fingerprint: str):
+    """
+    Hash of pydantic model JSON schema (fields, types, defaults, descriptions) and generator fingerprint.
+    """
+    digest = hashlib.sha256(fingerprint.encode())
+    digest.update(json.dumps(model.model_json_schema(), sort_keys=True, default=str).encode())
+    digest.update(str(model._docs_description.default).encode())
+    return digest.hexdigest()
+
+
+def model_output_files(model_name: str):
+    return [
+        f"{PROJECT_ROOT_DIR}/plugins/doc_fragments/feature_template_{model_name}.py",
+        f"{PROJECT_ROOT_DIR}/plugins/module_utils/feature_templates/{model_name}.py",
+        f"{PROJECT_ROOT_DIR}/plugins/module_utils/feature_templates_validation/{model_name}.py",
+    ]
+
+
+def outputs_exist(model_name: str):
+    return all(os.path.exists(file_name) for file_name in model_output_files(model_name))
+
+
+def write_file(file_name, content):
+    with open(file_name, "w") as f:
+        f.write(content)
+    print(f"File '{file_name}' has been written successfully.")
 
-    template_file = PurePath("docs_fragments_template.j2")
-    template = env.get_template(str(template_file))
+
+# Templates are compiled once per process: in main process and in initializer of every worker process
+_env = None
+
+
+def init_worker():
+    global _env
+    _env = create_environment()
+    for template_file in TEMPLATES:
+        _env.get_template(template_file)
+
+
+def generate_model(model_name: str):
+    model_module = available_models[model_name]
+    docs_file, definition_file, validation_file = model_output_files(model_name)
+
+    # Part for Ansible documentation
+    ansible_docs = generate_ansible_docs(model_module, model_name)
+    template = _env.get_template("docs_fragments_template.j2")
     try:
         output = template.render(yaml_data=ansible_docs)
     except Exception as ex:
         print(ex)
         print(ansible_docs)
         raise ex
-
-    filename = f"{PROJECT_ROOT_DIR}/plugins/doc_fragments/feature_template_{model_name}.py"
-    with open(filename, "w") as f:
-        f.write(output)
-
-    print(f"File '{filename}' has been written successfully.")
+    write_file(docs_file, output)
 
     # Part for Ansible module arguments specification
     yaml_str = yaml.dump(ansible_docs, sort_keys=False)
@@ -269,39 +350,72 @@ for model_name, model_module in available_models.items():
     # Generate the argument spec
     arg_spec = generate_arg_spec(yaml_str)
 
-    # Define the variable name
-    variable_name = f"{model_name}_definition"
+    # Write the generated dictionary to a Python file, use pformat to get a string representation of the dictionary
+    write_file(definition_file, f"{model_name}_definition = {pformat(arg_spec, indent=2, width=80)}\n")
 
-    # Write the generated dictionary to a Python file
-    output_file = f"{PROJECT_ROOT_DIR}/plugins/module_utils/feature_templates/{model_name}.py"
-    with open(output_file, "w") as file:
-        file.write(f"{variable_name} = ")
-        # Use pformat to get a string representation of the dictionary
-        file.write(pformat(arg_spec, indent=2, width=80))
-        file.write("\n")
-    print(f"File '{output_file}' has been written successfully.")
+    # Part for precomputed validation table
+    validation = pformat(flatten_arg_spec(arg_spec), indent=2, width=120)
+    write_file(validation_file, f"{model_name}_validation = {validation}\n")
+    return model_name
 
-    # Part for Ansible DeviceModel docs fragment
-    # Load the template file
-    template_file = "ft_device_model.j2"
-    template = env.get_template(template_file)
 
-    # Render the template with the DeviceModel enum
-    output = template.render(device_models=get_args(DeviceModel))
+def load_hashes(hashes_file: Path):
+    try:
+        return json.loads(hashes_file.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Generate feature template docs fragments and argument specs.")
+    parser.add_argument("--force", action="store_true", help="regenerate outputs of all models")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--hashes-file", type=Path, default=Path(PROJECT_ROOT_DIR / HASHES_FILE))
+    args = parser.parse_args(argv)
+
+    # Only models with changed schema (or missing outputs) are regenerated
+    fingerprint = generator_fingerprint()
+    stored_hashes = {} if args.force else load_hashes(args.hashes_file)
+    hashes = {model_name: schema_hash(model, fingerprint) for model_name, model in available_models.items()}
+    changed = [
+        model_name
+        for model_name in sorted(available_models)
+        if stored_hashes.get(model_name) != hashes[model_name] or not outputs_exist(model_name)
+    ]
+    print(f"{len(changed)} of {len(available_models)} models changed: {', '.join(changed) or '-'}")
+
+    init_worker()
+    if len(changed) > 1 and args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(changed)), initializer=init_worker) as executor:
+            for model_name in executor.map(generate_model, changed):
+                stored_hashes[model_name] = hashes[model_name]
+    else:
+        for model_name in changed:
+            generate_model(model_name)
+            stored_hashes[model_name] = hashes[model_name]
 
-    # Write the output to a file
-    file_name = f"{PROJECT_ROOT_DIR}/plugins/doc_fragments/device_models_feature_template.py"
-    with open(file_name, "w") as f:
-        f.write(output)
-    print(f"File '{file_name}' has been written successfully.")
+    # Part for Ansible DeviceModel docs fragment
+    output = _env.get_template("ft_device_model.j2").render(device_models=get_args(DeviceModel))
+    write_file(f"{PROJECT_ROOT_DIR}/plugins/doc_fragments/device_models_feature_template.py", output)
 
+    # Part for dispatcher importing only definitions of template types used in task
+    output = _env.get_template("ft_definitions.j2").render(model_names=sorted(available_models))
+    write_file(f"{PROJECT_ROOT_DIR}/plugins/module_utils/feature_template_definitions.py", output)
 
-print(
-    """
+    # Hashes of removed models are dropped
+    hashes_data = {model_name: stored_hashes[model_name] for model_name in sorted(hashes)}
+    args.hashes_file.write_text(json.dumps(hashes_data, indent=2) + "\n")
+
+    print(
+        """
     When used, note that Device Specific Variables doesn't have description and it required manual effort to fix
     these in documentation. Example: cisco.catalystwan.feature_template_cisco_system requires updating few fields.
     Look for '- null' fields.
     That will be solved once we will have Device Specific Variables in SDK properly defined.
 
     """
-)
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
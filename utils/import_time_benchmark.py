@@ -0,0 +1,79 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Guards cold import time of collection's module_utils and modules which don't need catalystwan at import time.
+
+Every module is imported in a fresh interpreter, the check fails when catalystwan got imported
+or import took longer than allowed. Collection has to be importable, e.g.:
+
+    ansible-galaxy collection install . --force
+    python utils/import_time_benchmark.py --collections-path ~/.ansible/collections
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+COLLECTION = "ansible_collections.cisco.catalystwan.plugins"
+
+GUARDED_MODULES = [
+    f"{COLLECTION}.module_utils.vmanage_module",
+    f"{COLLECTION}.module_utils.output_file",
+    f"{COLLECTION}.module_utils.projection",
+    f"{COLLECTION}.modules.active_sessions_info",
+    f"{COLLECTION}.modules.server_info",
+    f"{COLLECTION}.modules.feature_profile_builder",
+]
+
+IMPORT_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+catalystwan = sorted(name for name in sys.modules if name == "catalystwan" or name.startswith("catalystwan."))
+print(json.dumps(dict(seconds=seconds, catalystwan=catalystwan)))
+"""
+
+
+def measure(module: str, collections_path: str) -> Dict:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [collections_path, os.environ.get("PYTHONPATH")])))
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET.format(module=module)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--collections-path", default=os.path.expanduser("~/.ansible/collections"))
+    parser.add_argument("--max-seconds", type=float, default=0.5, help="maximum cold import time of single module")
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs is compared against the limit")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in GUARDED_MODULES:
+        runs = [measure(module, args.collections_path) for _ in range(args.repeat)]
+        seconds = min(run["seconds"] for run in runs)
+        catalystwan = runs[0]["catalystwan"]
+        status = "OK"
+        if catalystwan:
+            status = f"FAIL: imports catalystwan ({', '.join(catalystwan[:3])}, ...)"
+        elif seconds > args.max_seconds:
+            status = f"FAIL: slower than {args.max_seconds}s"
+        failed = failed or status != "OK"
+        print(f"{seconds:8.3f}s  {module}  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))